@@ -27,6 +27,9 @@ import urllib.request
 import urllib.parse
 import re
 
+# libyaml's C loader when PyYAML was built with it, the pure-Python safe loader otherwise
+_YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 # Import ONVIF discovery classes from simple_camera_gui instead of duplicating
 try:
     from camera_gui import (
@@ -1262,9 +1265,9 @@ class ConfigGUI(QWidget):
                     self.rebuild_camera_tabs(self.cams_count.value())
                     return
                 
-                # Try parsing with yaml.safe_load
+                # Try parsing with the safe YAML loader
                 try:
-                    config = yaml.safe_load(config_content)
+                    config = yaml.load(config_content, Loader=_YAML_SAFE_LOADER)
                 except yaml.YAMLError as yaml_error:
                     print(f"YAML parsing error: {yaml_error}")
                     self.rebuild_camera_tabs(self.cams_count.value())
@@ -1586,7 +1589,7 @@ class ConfigGUI(QWidget):
         if os.path.exists(config_path):
             try:
                 with open(config_path, 'r') as f:
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=_YAML_SAFE_LOADER)
                 if config and "cameras" in config:
                     camera_names = list(config["cameras"].keys())
             except:
@@ -2754,7 +2757,7 @@ class ConfigGUI(QWidget):
 
         try:
             with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YAML_SAFE_LOADER)
             
             if not config:
                 return False
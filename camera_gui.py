@@ -26,6 +26,9 @@ import urllib.request
 import urllib.parse
 import re
 
+# libyaml's C loader when PyYAML was built with it, the pure-Python safe loader otherwise
+_YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 # Global list to track all ONVIF worker threads for cleanup
 _active_onvif_workers = []
 
@@ -758,6 +761,8 @@ class CocoClassesDialog(QDialog):
 class SimpleCameraGUI(QWidget):
     """Simple Camera Configuration GUI - exact design from config_gui.py"""
     
+    config_saved = Signal()  # Emitted after the camera configuration was written successfully
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Frigate + MemryX Camera Config")
@@ -1449,9 +1454,9 @@ class SimpleCameraGUI(QWidget):
                     self.rebuild_camera_tabs(self.cams_count.value())
                     return
                 
-                # Try parsing with yaml.safe_load
+                # Try parsing with the safe YAML loader
                 try:
-                    config = yaml.safe_load(config_content)
+                    config = yaml.load(config_content, Loader=_YAML_SAFE_LOADER)
                     if config is None:
                         config = {}
                 except yaml.YAMLError as yaml_error:
@@ -2339,7 +2344,7 @@ class SimpleCameraGUI(QWidget):
         if os.path.exists(config_path):
             try:
                 with open(config_path, 'r') as f:
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=_YAML_SAFE_LOADER)
                 if config and "cameras" in config:
                     camera_names = list(config["cameras"].keys())
             except:
@@ -3290,6 +3295,8 @@ class SimpleCameraGUI(QWidget):
                 from PySide6.QtCore import QTimer
                 QTimer.singleShot(2000, lambda: setattr(self.launcher_parent, 'suppress_config_change_popup', False))
             
+            self.config_saved.emit()
+            
             # Close the GUI window
             self.close()
             
@@ -3310,7 +3317,7 @@ class SimpleCameraGUI(QWidget):
                 return {}
             
             try:
-                config = yaml.safe_load(config_content)
+                config = yaml.load(config_content, Loader=_YAML_SAFE_LOADER)
                 if config is None:
                     config = {}
                 return config
@@ -15,7 +15,18 @@ import shutil
 import tempfile
 import webbrowser
 import platform
+import functools
+import json
+import logging
+import socket
+import http.client
+import urllib.parse
+import re
+import select
+import codecs
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 # Try to import psutil for system monitoring
 try:
@@ -24,36 +35,1592 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+# How long (seconds) a disk usage reading is reused by the system info panel
+_DISK_USAGE_TTL = 15
+
+# How long (seconds) a Prerequisites tab probe result (git/dpkg/docker/apt output) is reused
+_PREREQ_CHECK_TTL = 3
+
+# System details that can't change while the launcher runs, looked up once for the info panels
+_SYS_KERNEL = platform.release()  # Same as `uname -r`
+_SYS_OS = f"{platform.system()} {_SYS_KERNEL}"
+_SYS_ARCH = platform.machine()  # Same as `uname -m`
+_SYS_PY = platform.python_version()
+if PSUTIL_AVAILABLE:
+    _SYS_CPU = str(psutil.cpu_count())
+    _SYS_MEM_GB = psutil.virtual_memory().total / (1024**3)
+
+# Diagnostics from the periodic status paths go through logging rather than print()
+# so they never block on a piped stdout and stay silent unless debug logging is enabled
+logger = logging.getLogger(__name__)
+
 # Import required Qt modules
 try:
     from PySide6.QtWidgets import (
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-        QTabWidget, QTextEdit, QPushButton, QLabel, QProgressBar,
+        QTabWidget, QTextEdit, QPlainTextEdit, QPushButton, QLabel, QProgressBar,
         QGroupBox, QFormLayout, QCheckBox, QMessageBox, QSplitter,
         QFrame, QScrollArea, QGridLayout, QSpacerItem, QSizePolicy,
-        QDialog, QLineEdit, QDialogButtonBox, QFileDialog
+        QDialog, QLineEdit, QDialogButtonBox, QFileDialog, QGraphicsColorizeEffect
+    )
+    from PySide6.QtCore import (
+        QThread, Signal, Slot, QTimer, Qt, QEvent, QRunnable, QThreadPool, QPoint,
+        QPropertyAnimation, QSequentialAnimationGroup, QSize, QMargins, QElapsedTimer
+    )
+    from PySide6.QtGui import (
+        QFont, QPixmap, QImage, QPalette, QColor, QIcon, QPainter, QTextCursor, QPixmapCache, QGuiApplication
     )
-    from PySide6.QtCore import QThread, Signal, QTimer, Qt, QEvent
-    from PySide6.QtGui import QFont, QPixmap, QPalette, QColor, QIcon, QPainter
 except ImportError as e:
     print("❌ Required GUI libraries are not available.")
     print("   Please run './launch.sh' to set up the environment properly.")
     print(f"   Error: {e}")
     sys.exit(1)
 
-# Import Simple Camera GUI
-try:
-    from camera_gui import SimpleCameraGUI
-except ImportError as e:
-    print(f"Warning: Could not import SimpleCameraGUI: {e}")
-    SimpleCameraGUI = None
+# The camera and advanced config GUIs (and everything they import) are loaded on
+# first use rather than at startup; the result is memoized, None if unavailable
+@functools.lru_cache(maxsize=None)
+def _load_simple_camera_gui():
+    """Import and return SimpleCameraGUI"""
+    try:
+        from camera_gui import SimpleCameraGUI
+    except ImportError as e:
+        print(f"Warning: Could not import SimpleCameraGUI: {e}")
+        return None
+    return SimpleCameraGUI
 
-# Import Advanced Config GUI
-try:
-    from advanced_config_gui import ConfigGUI
-except ImportError as e:
-    print(f"Warning: Could not import ConfigGUI: {e}")
-    ConfigGUI = None
+@functools.lru_cache(maxsize=None)
+def _load_config_gui():
+    """Import and return ConfigGUI"""
+    try:
+        from advanced_config_gui import ConfigGUI
+    except ImportError as e:
+        print(f"Warning: Could not import ConfigGUI: {e}")
+        return None
+    return ConfigGUI
+
+# QFonts can't be created before the QApplication, so shared ones are built on first use
+# (setFont copies the font, so the cached instances are never modified)
+@functools.lru_cache(maxsize=None)
+def _font(family, size, weight=QFont.Normal):
+    """Return a shared QFont for family/size/weight"""
+    return QFont(family, size, weight)
+
+# Size (logical px) of the emoji icons on the Prerequisites and Frigate Setup tab buttons
+_EMOJI_ICON_SIZE = 16
+
+def _emoji_icon(emoji):
+    """Return an icon of an emoji glyph, rasterized once and kept in QPixmapCache"""
+    key = f"emoji:{emoji}:{_EMOJI_ICON_SIZE}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        ratio = QGuiApplication.instance().devicePixelRatio()
+        side = round(_EMOJI_ICON_SIZE * ratio)
+        image = QImage(side, side, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        font = painter.font()
+        font.setPixelSize(side - 2)
+        painter.setFont(font)
+        painter.drawText(image.rect(), Qt.AlignCenter, emoji)
+        painter.end()
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(ratio)
+        QPixmapCache.insert(key, pixmap)
+    return QIcon(pixmap)
+
+def _set_button_label(button, label):
+    """Set a button's text, showing a leading emoji ("🔄 Refresh") as a cached icon instead of text"""
+    emoji, _, text = label.partition(' ')
+    if not text or emoji.isascii():
+        button.setText(label)
+        return
+    button.setIcon(_emoji_icon(emoji))
+    button.setIconSize(QSize(_EMOJI_ICON_SIZE, _EMOJI_ICON_SIZE))
+    button.setText(text)
+
+def _emoji_button(label):
+    """Create a QPushButton whose leading emoji is drawn as an icon (see _set_button_label)"""
+    button = QPushButton()
+    _set_button_label(button, label)
+    return button
+
+# Shared styles for the guidance dialogs (parsed by Qt once per string, not rebuilt per dialog)
+_GUIDANCE_TITLE_QSS = """
+    font-family: 'Segoe UI', Arial, sans-serif;
+    font-size: 18px;
+    font-weight: 700;
+    color: #0694a2;
+    margin-left: 10px;
+"""
+
+_GUIDANCE_TEXT_QSS = """
+    font-family: 'Segoe UI', Arial, sans-serif;
+    font-size: 14px;
+    color: #2d3748;
+    line-height: 1.5;
+    padding: 15px;
+    background: #f0fff4;
+    border-radius: 8px;
+    border-left: 4px solid #0694a2;
+"""
+
+_NEXT_STEPS_TEXT_QSS = _GUIDANCE_TEXT_QSS.replace('#f0fff4', '#f7fafc')
+
+_GUIDANCE_HIGHLIGHT_BTN_QSS = """
+    QPushButton {
+        background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+            stop: 0 #0694a2, stop: 1 #0f766e);
+        color: white;
+        border: none;
+        border-radius: 6px;
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 13px;
+        font-weight: 600;
+        padding: 8px 16px;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+            stop: 0 #0891b2, stop: 1 #164e63);
+    }
+"""
+
+_GUIDANCE_GOT_IT_BTN_QSS = """
+    QPushButton {
+        background: #e2e8f0;
+        color: #2d3748;
+        border: 1px solid #cbd5e0;
+        border-radius: 6px;
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 13px;
+        font-weight: 600;
+        padding: 8px 16px;
+    }
+    QPushButton:hover {
+        background: #cbd5e0;
+    }
+"""
+
+# Next Steps dialog text shown when the camera setup guide is closed
+_NEXT_STEPS_GUIDANCE_HTML = (
+    "Now you're ready for the next step:<br><br>"
+    "👉 <b>Click the \"🎥 Set Up Your Cameras\" button</b> below to start adding your cameras to Frigate.<br><br>"
+    "This will open the camera configuration tool where you can discover and configure your Amcrest cameras."
+)
+
+# Amcrest camera hardware setup steps shown by the camera setup guide
+_CAMERA_SETUP_STEPS = (
+    {
+        "title": "STEP 1: Power On Camera",
+        "description": "Connect the power adapter to your camera's power port and wait 30 seconds for initialization.",
+        "points": (
+            "Look for the green LED light on the camera's back",
+            "Camera may rotate during startup (normal behavior)",
+            "Green LED solid = ready for setup"
+        ),
+        "image": None
+    },
+    {
+        "title": "STEP 2: Install Mobile App",
+        "description": "Download 'Amcrest View Pro' from your device's app store.",
+        "points": (
+            "iOS: App Store | Android: Google Play Store",
+            "Search for 'Amcrest View Pro'",
+            "Install and open the app"
+        ),
+        "image": "setup_1.png"
+    },
+    {
+        "title": "STEP 3: App Initial Setup",
+        "description": "Launch the app and follow the welcome screens.",
+        "points": (
+            "Allow required permissions (camera, location)",
+            "Tap 'Start' to begin setup"
+        ),
+        "image": "setup_2.jpg"
+    },
+    {
+        "title": "STEP 4: Select WiFi Camera",
+        "description": "Choose WiFi Camera setup option.",
+        "points": (
+            "Select 'WiFi Camera' from menu",
+        ),
+        "image": "setup_3.jpg"
+    },
+    {
+        "title": "STEP 4.1: WiFi Configuration Setup",
+        "description": "Select WiFi configuration setup option.",
+        "points": (
+            "Choose WiFi configuration setup",
+            "<b>Important: Your phone must be connected to the WiFi network you want the camera to use</b>"
+        ),
+        "image": "setup_4.jpg"
+    },
+    {
+        "title": "STEP 5: Scan Camera QR Code",
+        "description": "Find and scan the QR code on your camera's back.",
+        "points": (
+            "Allow camera access for QR scanning",
+            "Locate QR code on camera's back and scan it"
+        ),
+        "image": "setup_5.jpg"
+    },
+    {
+        "title": "STEP 6: Configure Camera Settings",
+        "description": "Set up camera name and credentials.",
+        "points": (
+            "Enter a descriptive camera name (e.g., 'Front Door', 'Garage')",
+            "Default username/password: admin/admin"
+        ),
+        "image": "setup_7.jpg"
+    },
+    {
+        "title": "STEP 6.1: Enter WiFi Password",
+        "description": "Enter your WiFi network password.",
+        "points": (
+            "Enter your WiFi network password carefully",
+            "Ensure password is correct",
+            "Double-check for typos"
+        ),
+        "image": "setup_8.jpg"
+    },
+    {
+        "title": "STEP 7: Network Connection",
+        "description": "Connect camera to your network.",
+        "points": (
+            "Allow app to find local network devices",
+            "Wait for WiFi connection process (30-60 seconds)"
+        ),
+        "image": "setup_9.jpg"
+    },
+    {
+        "title": "STEP 7.1: Connection Success",
+        "description": "Camera setup completed successfully.",
+        "points": (
+            "Connection successful! Camera is now online",
+            "Click on 'Start Live View' to proceed",
+            "Camera is ready for use"
+        ),
+        "image": "setup_11.jpg"
+    },
+    {
+        "title": "STEP 8: Set Security Password",
+        "description": "Create a secure password for camera access.",
+        "points": (
+            "Tap 'Start Live View'",
+            "Create strong password (8-32 characters)",
+            "Use mix of letters and numbers"
+        ),
+        "image": "setup_12.jpg"
+    }
+)
+
+# Frigate integration steps shown after the hardware setup completes
+_FRIGATE_SETUP_STEPS = (
+    {
+        "title": "NEXT STEPS: Configure Camera in Frigate",
+        "description": "Now that your camera is set up, add it to Frigate for AI detection.",
+        "points": (
+            "Camera hardware setup is complete",
+            "Next: Add camera to Frigate application",
+            "Use the 'Set Up Your Cameras' button below"
+        ),
+        "image": "gui_1.png"
+    },
+    {
+        "title": "STEP 9: Open Camera Setup Tool", 
+        "description": "Go to setup your camera button to add cameras to Frigate.",
+        "points": (
+            "Click on 'Set Up Your Cameras' button",
+            "This opens the camera configuration interface",
+            "You'll configure detection and recording settings"
+        ),
+        "image": "gui_2.png"
+    },
+    {
+        "title": "STEP 10: Discover Camera IP Address",
+        "description": "Inside the setup tool, click on discover camera button to identify IP addresses.",
+        "points": (
+            "Click on 'Discover Camera' button",
+            "This will scan your network for IP cameras",
+            "Automatically finds camera IP addresses"
+        ),
+        "image": "gui_3.png"
+    },
+    {
+        "title": "STEP 11: Start Network Scan",
+        "description": "Start scan to identify the IP addresses of cameras connected in your house.",
+        "points": (
+            "Click 'Start Scan' to begin network discovery",
+            "Wait for scan to complete (may take 30-60 seconds)",
+            "All connected IP cameras will be detected"
+        ),
+        "image": "gui_4.png"
+    },
+    {
+        "title": "STEP 12: Select Camera and Configure",
+        "description": "Select your IP camera and enter username/password to complete setup.",
+        "points": (
+            "You will see detected IP cameras in the list",
+            "Select your camera from the discovered devices",
+            "Enter the username and password you created earlier",
+            "Click to proceed and complete camera integration"
+        ),
+        "image": "gui_5.png"
+    }
+)
+
+_HEADER_ICON_QSS = "font-size: 32px;"
+
+# "Loading ..." labels standing in for tabs that are built the first time they are selected
+_TAB_PLACEHOLDER_QSS = "color: #666; font-size: 14px; padding: 50px;"
+
+# Status chips set on the check/status labels each time a check completes
+_STATUS_OK_QSS = "background: #e8f4f0; color: #2d5a4a; padding: 8px; border-radius: 6px;"
+_STATUS_ERROR_QSS = "background: #fbeaea; color: #6b3737; padding: 8px; border-radius: 6px;"
+_STATUS_WARNING_QSS = "background: #fdf6e3; color: #8b7355; padding: 8px; border-radius: 6px;"
+_STATUS_OK_SMALL_QSS = "background: #e8f4f0; color: #2d5a4a; padding: 6px; border-radius: 4px;"
+_STATUS_ERROR_SMALL_QSS = "background: #fbeaea; color: #6b3737; padding: 6px; border-radius: 4px;"
+_STATUS_UNKNOWN_SMALL_QSS = "background: #fef5e7; color: #8b5a00; padding: 6px; border-radius: 4px;"
+_CHECK_OK_QSS = "background: #e8f4f0; color: #2d5a4a;"
+_CHECK_MISSING_QSS = "background: #fbeaea; color: #6b3737;"
+
+# Scroll areas whose page shows the tab background through
+_TRANSPARENT_SCROLL_QSS = """
+    QScrollArea {
+        background: transparent;
+        border: none;
+    }
+    QScrollArea > QWidget > QWidget {
+        background: transparent;
+    }
+    QScrollBar:vertical {
+        background: #f0f0f0;
+        width: 12px;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical {
+        background: #4a90a4;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: #38758a;
+    }
+    QScrollBar:horizontal {
+        background: #f0f0f0;
+        height: 12px;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:horizontal {
+        background: #4a90a4;
+        border-radius: 6px;
+        min-width: 20px;
+    }
+    QScrollBar::handle:horizontal:hover {
+        background: #38758a;
+    }
+"""
+
+# PreConfigured Box Start/Stop button looks, one per operation state
+_STOP_BTN_QSS = """
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #f87171, stop:1 #ef4444);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 14px 16px;
+        font-weight: 600;
+        font-size: 14px;
+        font-family: 'Segoe UI', 'Inter', sans-serif;
+    }
+    QPushButton:hover:enabled {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #fca5a5, stop:1 #f87171);
+    }
+    QPushButton:pressed {
+        background: #dc2626;
+    }
+    QPushButton:disabled {
+        background: #a0aec0;
+        color: #718096;
+    }
+"""
+
+_STOP_BTN_STOPPING_QSS = """
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #ff5722, stop:1 #d84315);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 14px 16px;
+        font-weight: 600;
+        font-size: 14px;
+        font-family: 'Segoe UI', 'Inter', sans-serif;
+    }
+"""
+
+_STOP_BTN_STOPPED_QSS = """
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #6c757d, stop:1 #5a6268);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 14px 16px;
+        font-weight: 600;
+        font-size: 14px;
+        font-family: 'Segoe UI', 'Inter', sans-serif;
+    }
+"""
+
+_START_BTN_BUILDING_QSS = """
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #ff9800, stop:1 #f57c00);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 14px 16px;
+        font-weight: 600;
+        font-size: 14px;
+        font-family: 'Segoe UI', 'Inter', sans-serif;
+    }
+"""
+
+_START_BTN_STARTING_QSS = """
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #2196f3, stop:1 #1976d2);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 14px 16px;
+        font-weight: 600;
+        font-size: 14px;
+        font-family: 'Segoe UI', 'Inter', sans-serif;
+    }
+"""
+
+_START_BTN_RUNNING_QSS = """
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #4caf50, stop:1 #388e3c);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 14px 16px;
+        font-weight: 600;
+        font-size: 14px;
+        font-family: 'Segoe UI', 'Inter', sans-serif;
+    }
+"""
+
+# Common scroll bar styling for consistency across all text areas
+_SCROLL_BAR_QSS = """
+    QScrollBar:vertical {
+        background: #f0f0f0;
+        width: 12px;
+        border-radius: 6px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: #4a90a4;
+        border-radius: 6px;
+        min-height: 20px;
+        margin: 2px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: #38758a;
+    }
+    QScrollBar::handle:vertical:pressed {
+        background: #2c6b7d;
+    }
+    QScrollBar:horizontal {
+        background: #f0f0f0;
+        height: 12px;
+        border-radius: 6px;
+        margin: 0px;
+    }
+    QScrollBar::handle:horizontal {
+        background: #4a90a4;
+        border-radius: 6px;
+        min-width: 20px;
+        margin: 2px;
+    }
+    QScrollBar::handle:horizontal:hover {
+        background: #38758a;
+    }
+    QScrollBar::handle:horizontal:pressed {
+        background: #2c6b7d;
+    }
+    QScrollBar::add-line, QScrollBar::sub-line {
+        border: none;
+        background: none;
+    }
+"""
+
+# Log and editor views, each with the common scroll bars
+_INSTALL_PROGRESS_QSS = """
+    QPlainTextEdit {
+        background: #fafbfc;
+        border: 1px solid #e5e8eb;
+        border-radius: 6px;
+        font-family: 'Consolas', 'Monaco', monospace;
+        font-size: 12px;
+        color: #2d3748;
+        padding: 10px;
+        line-height: 1.3;
+        selection-background-color: #bee3f8;
+        selection-color: #2a4365;
+    }
+""" + _SCROLL_BAR_QSS
+
+_DOCKER_PROGRESS_QSS = """
+    QPlainTextEdit {
+        background: #fafbfc;
+        border: 1px solid #e5e8eb;
+        border-radius: 6px;
+        font-family: 'Consolas', 'Monaco', 'Liberation Mono', monospace;
+        font-size: 12px;
+        color: #2d3748;
+        padding: 12px;
+        line-height: 1.4;
+        selection-background-color: #bee3f8;
+        selection-color: #2a4365;
+    }
+""" + _SCROLL_BAR_QSS
+
+_DOCKER_LOGS_QSS = """
+    QPlainTextEdit {
+        background: #fafbfc;
+        border: 1px solid #e5e8eb;
+        border-radius: 6px;
+        font-family: 'Consolas', 'Monaco', 'Liberation Mono', monospace;
+        font-size: 10px;
+        color: #2d3748;
+        padding: 8px;
+        line-height: 1.3;
+        selection-background-color: #bee3f8;
+        selection-color: #2a4365;
+    }
+""" + _SCROLL_BAR_QSS
+
+_CONFIG_EDITOR_QSS = """
+    QTextEdit {
+        background: #fafbfc;
+        border: 1px solid #cbd5e0;
+        border-radius: 6px;
+        font-family: 'Consolas', 'Monaco', 'Liberation Mono', monospace;
+        font-size: 13px;
+        color: #2d3748;
+        padding: 12px;
+        line-height: 1.5;
+    }
+    QTextEdit[readOnly="true"] {
+        background: #f8f9fa;
+        color: #495057;
+    }
+""" + _SCROLL_BAR_QSS
+
+# Config editor looks set when toggling between edit and read-only mode
+_CONFIG_EDITOR_EDIT_QSS = """
+    QTextEdit {
+        background: #ffffff;
+        border: 2px solid #28a745;
+        border-radius: 6px;
+        font-family: 'Consolas', 'Monaco', 'Liberation Mono', monospace;
+        font-size: 13px;
+        color: #2d3748;
+        padding: 12px;
+        line-height: 1.5;
+    }
+"""
+
+_CONFIG_EDITOR_VIEW_QSS = """
+    QTextEdit {
+        background: #f8f9fa;
+        border: 1px solid #cbd5e0;
+        border-radius: 6px;
+        font-family: 'Consolas', 'Monaco', 'Liberation Mono', monospace;
+        font-size: 13px;
+        color: #495057;
+        padding: 12px;
+        line-height: 1.5;
+    }
+"""
+
+_CAMERAS_SCROLL_QSS = """
+    QScrollArea {
+        border: 1px solid #cbd5e0;
+        border-radius: 6px;
+        background: #f8f9fa;
+    }
+""" + _SCROLL_BAR_QSS
+
+# Docker Manager operation status chip: ready, busy with Stop still available, busy
+_OPERATION_STATUS_QSS = """
+    QLabel {
+        background: %s;
+        color: %s;
+        padding: 8px;
+        border-radius: 6px;
+        font-size: 11px;
+        font-weight: bold;
+        margin: 4px 0px;
+    }
+"""
+_OPERATION_READY_QSS = _OPERATION_STATUS_QSS % ('#e8f4f0', '#2d5a4a')
+_OPERATION_BUSY_STOPPABLE_QSS = _OPERATION_STATUS_QSS % ('#fef3c7', '#92400e')
+_OPERATION_BUSY_QSS = _OPERATION_STATUS_QSS % ('#fbeaea', '#6b3737')
+
+
+def _build_header(icon, title):
+    """Emoji icon + title row used at the top of the small guidance/info dialogs"""
+    title_layout = QHBoxLayout()
+    
+    icon_label = QLabel(icon)
+    icon_label.setStyleSheet(_HEADER_ICON_QSS)
+    title_layout.addWidget(icon_label)
+    
+    title_label = QLabel(title)
+    title_label.setStyleSheet(_GUIDANCE_TITLE_QSS)
+    title_layout.addWidget(title_label)
+    title_layout.addStretch()
+    
+    return title_layout
+
+# Quick troubleshooting tips shown at the end of the camera setup guide
+_TROUBLESHOOTING_POINTS = (
+    "Camera won't power on: Check power connection, try different outlet",
+    "Can't find camera: Restart camera (unplug 10 seconds), ensure same WiFi network",
+    "WiFi won't connect: Verify password, use 2.4GHz network, move closer to router",
+    "App issues: Restart app, check internet, update to latest version"
+)
+
+# Bounding box the setup guide screenshots are scaled into, and the cam_assets
+# subdirectory holding copies already scaled to it (written by prescale_cam_assets.py)
+_SETUP_GUIDE_IMAGE_SIZE = (250, 400)
+_SETUP_GUIDE_SCALED_DIR = "scaled_%dx%d" % _SETUP_GUIDE_IMAGE_SIZE
+# Screenshots whose fitted size is within this many pixels of their own are used unscaled
+_SETUP_GUIDE_SCALE_TOLERANCE = 32
+
+def _prescaled_image_path(image_path):
+    """Path of the shipped, already-scaled copy of a setup guide screenshot"""
+    directory, name = os.path.split(image_path)
+    return os.path.join(directory, _SETUP_GUIDE_SCALED_DIR, name)
+
+def _scale_setup_guide_image(image):
+    """Scale a screenshot to fit the step card"""
+    # Within a few pixels of the card size already; resampling wouldn't visibly change it
+    target = image.size().scaled(*_SETUP_GUIDE_IMAGE_SIZE, Qt.KeepAspectRatio)
+    if (abs(image.width() - target.width()) <= _SETUP_GUIDE_SCALE_TOLERANCE
+            and abs(image.height() - target.height()) <= _SETUP_GUIDE_SCALE_TOLERANCE):
+        return image
+    return image.scaled(target, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+def _load_setup_guide_image(image_path):
+    """Load a setup guide screenshot at step card size (None if unreadable)"""
+    # Prefer the pre-scaled copy so nothing has to be resampled at runtime
+    image = QImage(_prescaled_image_path(image_path))
+    if not image.isNull():
+        return image
+    
+    image = QImage(image_path)
+    if image.isNull():
+        return None
+    return _scale_setup_guide_image(image)
+
+# Stylesheet for the whole camera setup guide, set once on the dialog. One-off widgets are
+# selected by objectName and the repeated ones (step cards and their parts, troubleshooting
+# points) by a "class" property. Section frames also style the frames (and labels) nested in
+# them, as their own per-widget sheets used to, with the label rules specific enough to win.
+# The step cards aren't clickable, so they get no :hover rules (and no repaints on mouse-over).
+_SETUP_GUIDE_QSS = """
+    QDialog {
+        background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+            stop: 0 #f8fafc, stop: 1 #e2e8f0);
+    }
+    
+    QFrame#guideHeader, QFrame#guideHeader QFrame {
+        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
+            stop: 0 #0694a2, stop: 1 #0f766e);
+        border: none;
+        border-bottom: 2px solid rgba(0,0,0,0.15);
+    }
+    QFrame#guideHeader QLabel#guideHeaderIcon {
+        font-size: 28px;
+        color: white;
+        background: rgba(255,255,255,0.15);
+        border-radius: 20px;
+        padding: 6px;
+        margin-right: 12px;
+    }
+    QFrame#guideHeader QLabel#guideHeaderTitle {
+        font-family: 'Segoe UI', 'SF Pro Display', Arial, sans-serif;
+        font-size: 24px;
+        font-weight: 700;
+        color: white;
+        background: none;
+    }
+    QFrame#guideHeader QLabel#guideHeaderSubtitle {
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 14px;
+        color: rgba(255,255,255,0.9);
+        background: none;
+        margin-top: 3px;
+    }
+    
+    QScrollArea#guideScroll {
+        border: none;
+        background: transparent;
+    }
+    QScrollArea#guideScroll QScrollBar:vertical {
+        background: #e2e8f0;
+        width: 12px;
+        border-radius: 6px;
+        margin: 2px;
+    }
+    QScrollArea#guideScroll QScrollBar::handle:vertical {
+        background: #cbd5e0;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    QScrollArea#guideScroll QScrollBar::handle:vertical:hover {
+        background: #a0aec0;
+    }
+    
+    QFrame#guideIntro, QFrame#guideIntro QFrame {
+        background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+            stop: 0 #e6f7ff, stop: 1 #bae7ff);
+        border: 2px solid #1890ff;
+        border-radius: 12px;
+        padding: 20px;
+        margin-bottom: 10px;
+    }
+    QFrame#guideIntro QLabel#guideIntroTitle {
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 20px;
+        font-weight: 700;
+        color: #003a8c;
+        margin-bottom: 8px;
+    }
+    QFrame#guideIntro QLabel#guideIntroText {
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 14px;
+        color: #003a8c;
+        line-height: 1.5;
+    }
+    
+    QFrame[class="stepCard"], QFrame[class="stepCard"] QFrame {
+        background: white;
+        border: 1px solid #e2e8f0;
+        border-radius: 10px;
+        padding: 0;
+        margin: 3px 0;
+    }
+    QFrame[class="stepCard"] QLabel[class="stepHeader"] {
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 18px;
+        font-weight: 700;
+        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: 0 #0694a2, stop: 1 #0f766e);
+        color: white;
+        padding: 10px 18px;
+        border-radius: 6px;
+        margin-bottom: 5px;
+    }
+    QFrame[class="stepCard"] QLabel[class="stepDescription"] {
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 16px;
+        font-weight: 600;
+        color: #2d3748;
+        margin-bottom: 8px;
+    }
+    QFrame[class="stepCard"] QLabel[class="stepPoints"] {
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 15px;
+        color: #4a5568;
+    }
+    QFrame[class="stepCard"] QLabel[class="stepImage"] {
+        border: 2px solid #e2e8f0;
+        border-radius: 8px;
+        padding: 5px;
+        background: #f7fafc;
+    }
+    
+    QFrame#guideCompletion, QFrame#guideCompletion QFrame {
+        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: 0 #0694a2, stop: 1 #0f766e);
+        border: none;
+        border-radius: 10px;
+        padding: 15px;
+        margin: 8px 0;
+    }
+    QFrame#guideCompletion QLabel#guideCompletionTitle {
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 18px;
+        font-weight: 700;
+        color: white;
+    }
+    QFrame#guideCompletion QLabel#guideCredentials {
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 16px;
+        color: white;
+        background: rgba(255,255,255,0.1);
+        padding: 10px;
+        border-radius: 6px;
+    }
+    
+    QFrame#guideTroubleshooting, QFrame#guideTroubleshooting QFrame {
+        background: #fef2f2;
+        border: 1px solid #fca5a5;
+        border-radius: 12px;
+        padding: 15px;
+        margin: 10px 0;
+    }
+    QFrame#guideTroubleshooting QLabel#guideTroubleshootingTitle {
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 16px;
+        font-weight: 700;
+        color: #b91c1c;
+        margin-bottom: 6px;
+    }
+    QFrame#guideTroubleshooting QLabel[class="guideTroubleshootingPoint"] {
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 13px;
+        color: #b91c1c;
+        padding: 2px 0;
+    }
+    
+    QFrame#guideFooter {
+        background: white;
+        border-top: 1px solid #e2e8f0;
+    }
+    QPushButton#guideCloseButton {
+        background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+            stop: 0 #0694a2, stop: 1 #0f766e);
+        color: white;
+        border: none;
+        border-radius: 6px;
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 14px;
+        font-weight: 600;
+    }
+    QPushButton#guideCloseButton:hover {
+        background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+            stop: 0 #4b5563, stop: 1 #0694a2);
+    }
+    QPushButton#guideCloseButton:pressed {
+        background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+            stop: 0 #0f766e, stop: 1 #111827);
+    }
+"""
+
+_STEP_POINT_HTML = "<p style='margin: 3px 0;'><span style='color: #0694a2; font-weight: bold;'>•</span> {}</p>"
+
+# Styles for the Prerequisites and Frigate Setup tabs, appended to the main window stylesheet so
+# they are parsed once; widgets opt in with a "kind" (buttons, labels) or "section" (group boxes)
+# property. Listed after the generic QPushButton rules so they win over :pressed/:disabled there.
+_MANUAL_SETUP_QSS = """
+    QLabel[kind="tabHeader"] {
+        background: #e8f4f0;
+        color: #2d5a4a;
+        padding: 10px;
+        border-radius: 6px;
+        font-size: 12px;
+        font-weight: bold;
+        margin-bottom: 5px;
+    }
+    QLabel[kind="info"] {
+        background: #f8f9fa;
+        color: #495057;
+        padding: 6px;
+        border-radius: 4px;
+        font-size: 10px;
+        border-left: 3px solid #28a745;
+        margin: 4px 0px;
+    }
+    QLabel[kind="guidance"] {
+        color: #6c757d;
+        font-size: 10px;
+        padding: 4px;
+    }
+    QLabel[kind="nextSteps"] {
+        background: #e8f4f0;
+        color: #2d5a4a;
+        padding: 12px;
+        border-radius: 6px;
+        font-size: 13px;
+        border-left: 4px solid #48bb78;
+    }
+    QGroupBox[section] {
+        border-radius: 6px;
+        font-weight: bold;
+        padding-top: 10px;
+        padding-bottom: 8px;
+    }
+    QGroupBox[section]::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 6px 0 6px;
+        font-size: 12px;
+    }
+    QGroupBox[section="prereq"] {
+        border: 2px solid #b3d9d0;
+        margin-top: 5px;
+        min-height: 160px;
+        max-height: 180px;
+    }
+    QGroupBox[section="prereq"]::title { color: #5a9b8a; }
+    QGroupBox[section="docker"] {
+        border: 2px solid #c8d4e3;
+        margin-top: 8px;
+        min-height: 140px;
+        max-height: 160px;
+    }
+    QGroupBox[section="docker"]::title { color: #7a8fab; }
+    QGroupBox[section="memryx"] {
+        border: 2px solid #d6c8e3;
+        margin-top: 8px;
+        min-height: 160px;
+        max-height: 180px;
+    }
+    QGroupBox[section="memryx"]::title { color: #8a7fab; }
+    QGroupBox[section="repo"] {
+        border: 2px solid #c8d4e3;
+        margin-top: 6px;
+        padding-top: 8px;
+        padding-bottom: 0px;
+    }
+    QGroupBox[section="repo"]::title { color: #7a8fab; }
+    QPushButton[kind="smallDanger"], QPushButton[kind="smallSuccess"] {
+        color: white;
+        font-size: 11px;
+        font-weight: bold;
+    }
+    QPushButton[kind="smallDanger"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #dc3545, stop:1 #c82333);
+    }
+    QPushButton[kind="smallDanger"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #e3444e, stop:1 #dc3545);
+    }
+    QPushButton[kind="smallSuccess"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #28a745, stop:1 #1e7e34);
+    }
+    QPushButton[kind="smallSuccess"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #34ce57, stop:1 #28a745);
+    }
+    QPushButton[kind="docker"], QPushButton[kind="memryx"], QPushButton[kind="danger"] {
+        color: white;
+        font-size: 12px;
+        font-weight: bold;
+        border-radius: 5px;
+    }
+    QPushButton[kind="docker"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2563eb, stop:1 #1d4ed8);
+    }
+    QPushButton[kind="docker"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #0694a2, stop:1 #2563eb);
+    }
+    QPushButton[kind="docker"]:pressed { background: #0f766e; }
+    QPushButton[kind="memryx"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #7c3aed, stop:1 #6d28d9);
+    }
+    QPushButton[kind="memryx"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #8b5cf6, stop:1 #7c3aed);
+    }
+    QPushButton[kind="memryx"]:pressed { background: #5b21b6; }
+    QPushButton[kind="danger"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #dc3545, stop:1 #c82333);
+    }
+    QPushButton[kind="danger"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #e85d75, stop:1 #dc3545);
+    }
+    QPushButton[kind="danger"]:pressed { background: #bd2130; }
+    QPushButton[kind="success"], QPushButton[kind="primary"] {
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 15px;
+        font-size: 13px;
+        font-weight: 600;
+    }
+    QPushButton[kind="success"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #48bb78, stop:1 #38a169);
+    }
+    QPushButton[kind="success"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #68d391, stop:1 #48bb78);
+    }
+    QPushButton[kind="success"]:pressed { background: #2f855a; }
+    QPushButton[kind="primary"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #4a90a4, stop:1 #38758a);
+    }
+    QPushButton[kind="primary"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #5b9bb0, stop:1 #428299);
+    }
+    QPushButton[kind="primary"]:pressed { background: #2d6374; }
+"""
+
+# Docker Manager secondary action buttons, appended to the main window stylesheet after
+# _MANUAL_SETUP_QSS; buttons opt in with a "kind" property
+_DOCKER_MANAGER_QSS = """
+    QPushButton[kind="dockerRebuild"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #fde68a, stop:1 #fcd34d);
+        color: #92400e;
+        border: 1px solid #f59e0b;
+    }
+    QPushButton[kind="dockerRebuild"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #fef3c7, stop:1 #fde68a);
+        border: 1px solid #d97706;
+    }
+    QPushButton[kind="dockerRebuild"]:pressed {
+        background: #f59e0b;
+        color: white;
+    }
+    QPushButton[kind="dockerRemove"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #fecaca, stop:1 #fca5a5);
+        color: #991b1b;
+        border: 1px solid #dc2626;
+    }
+    QPushButton[kind="dockerRemove"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #fee2e2, stop:1 #fecaca);
+        border: 1px solid #b91c1c;
+    }
+    QPushButton[kind="dockerRemove"]:pressed {
+        background: #dc2626;
+        color: white;
+    }
+    QPushButton[kind="dockerOpenUi"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #bfdbfe, stop:1 #93c5fd);
+        color: #0f766e;
+        border: 1px solid #0694a2;
+    }
+    QPushButton[kind="dockerOpenUi"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #dbeafe, stop:1 #bfdbfe);
+        border: 1px solid #2563eb;
+    }
+    QPushButton[kind="dockerOpenUi"]:pressed {
+        background: #0694a2;
+        color: white;
+    }
+    QPushButton[kind="dockerRebuild"]:disabled, QPushButton[kind="dockerRemove"]:disabled,
+    QPushButton[kind="dockerOpenUi"]:disabled {
+        background: #f3f4f6;
+        color: #9ca3af;
+        border: 1px solid #d1d5db;
+    }
+"""
+
+# Layout of the Prerequisites tab above its progress log, built by FrigateLauncher._build_from_spec.
+# "attr" names the FrigateLauncher attribute a widget is stored in; "slot" and "recheck" name the
+# method a button runs ("recheck" re-runs a prerequisite check with fresh probes)
+_PREREQ_TAB_SPEC = (
+    {"kind": "header", "text": "🔧 This tab handles system-level prerequisites required before setting up Frigate. "
+                               "Complete these steps first before proceeding to Frigate Setup."},
+    {"kind": "group", "title": "Step 1: System Prerequisites Check", "section": "prereq", "items": (
+        {"kind": "check_grid", "rows": (
+            {"title": "Git:", "attr": "prereq_git_check",
+             "button": {"text": "📦 Install Git", "attr": "install_git_btn", "slot": "install_system_prereq",
+                        "args": ("git",), "style": "smallDanger"}},
+            {"title": "Build Tools:", "attr": "prereq_build_check",
+             "tooltip": "Build Tools include GCC, Make, and other compilation tools needed for DKMS and package building",
+             "button": {"text": "🔧 Install Build Tools", "attr": "install_build_btn", "slot": "install_system_prereq",
+                        "args": ("build-tools",), "style": "smallSuccess",
+                        "tooltip": "Installs build-essential package (GCC, Make, G++, etc.) required for compiling software"}},
+        )},
+        {"kind": "info", "text": "💡 Includes GCC, Make, and tools for MemryX driver compilation and Docker builds."},
+        {"kind": "button", "text": "🔍 Check System Prerequisites", "recheck": "check_system_prerequisites",
+         "min_height": 45},
+    )},
+    {"kind": "group", "title": "Step 2: Docker Installation & Setup", "section": "docker", "items": (
+        {"kind": "status_row", "title": "Docker Status:", "text": "🔄 Checking Docker status...",
+         "attr": "prereq_docker_status", "recheck": "check_docker_prereq_status"},
+        {"kind": "button", "text": "🐳 Install Docker from Scratch", "attr": "install_docker_prereq_btn",
+         "slot": "install_docker_prereq", "style": "docker"},
+        {"kind": "guidance", "attr": "docker_prereq_guidance"},
+    )},
+    {"kind": "group", "title": "Step 3: MemryX Driver Installation & Setup", "section": "memryx", "items": (
+        {"kind": "status_row", "title": "MemryX Status:", "text": "🔄 Checking MemryX status...",
+         "attr": "prereq_memryx_status", "recheck": "check_memryx_prereq_status"},
+        {"kind": "button", "text": "🧠 Install MemryX Drivers & Runtime", "attr": "install_memryx_prereq_btn",
+         "slot": "install_memryx_prereq", "style": "memryx"},
+        # Shown only when the MemryX drivers need a restart
+        {"kind": "button", "text": "🔄 Restart System Now", "attr": "restart_system_btn",
+         "slot": "restart_system", "style": "danger", "hidden": True},
+        {"kind": "guidance", "attr": "memryx_prereq_guidance"},
+    )},
+)
+
+_SETUP_TAB_SPEC = (
+    {"kind": "header", "text": "⚙️ This tab handles Frigate repository setup. Ensure you have completed the Prerequisites "
+                               "tab first (Docker, MemryX, and system tools must be installed). The Python environment "
+                               "is already configured by the launcher script."},
+)
+
+# PreConfigured Box Camera Setup group. Set on the group itself: it is the page of a scroll area
+# styled with _TRANSPARENT_SCROLL_QSS, whose transparent-page rule would beat the main window's
+_CAMERA_SETUP_GROUP_QSS = """
+    QGroupBox {
+        border: 2px solid #4a90a4;
+        border-radius: 12px;
+        font-weight: bold;
+        font-size: 14px;
+        margin-top: 12px;
+        padding-top: 20px;
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #f8f9fa, stop:1 #f0f7ff);
+    }
+    QGroupBox::title {
+        color: #2c6b7d;
+        subcontrol-origin: margin;
+        left: 15px;
+        padding: 0 8px 0 8px;
+        font-size: 15px;
+        font-weight: bold;
+        background: white;
+        border-radius: 6px;
+    }
+"""
+
+# PreConfigured Box tab styles, appended to the main window stylesheet so they are parsed once;
+# widgets opt in by object name, or with kind="warningBanner" for the system warning banners
+_PRECONFIGURED_QSS = """
+    /* Light red banners shown when something needs manual setup */
+    QLabel[kind="warningBanner"] {
+        background: #fef2f2;
+        color: #dc2626;
+        padding: 12px;
+        border-radius: 6px;
+        font-size: 13px;
+        border-left: 4px solid #fca5a5;
+        margin: 4px 0px;
+    }
+    QLabel#preconfWelcome {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #4a90a4, stop:0.5 #38758a, stop:1 #2c6b7d);
+        color: white;
+        padding: 18px;
+        border-radius: 15px;
+        font-size: 16px;
+        font-weight: bold;
+        margin-bottom: 15px;
+        border: 3px solid rgba(255,255,255,0.3);
+    }
+    QPushButton#manualSetupButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #fca5a5, stop:1 #f87171);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 12px;
+        font-size: 14px;
+        font-weight: 600;
+        margin: 8px 0px;
+    }
+    QPushButton#manualSetupButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #fed7d7, stop:1 #fca5a5);
+    }
+    QPushButton#manualSetupButton:pressed {
+        background: #f87171;
+    }
+    QLabel#cameraSetupInfo {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #f0f7ff, stop:0.5 #e8f2ff, stop:1 #e8f5e8);
+        color: #2c3e50;
+        padding: 18px;
+        border-radius: 12px;
+        font-size: 14px;
+        font-weight: 600;
+        border: 2px solid #a8c8e8;
+        margin: 8px 2px;
+    }
+    QPushButton#cameraGuideButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #007bff, stop:1 #0056b3);
+        color: white;
+        border: none;
+        border-radius: 10px;
+        padding: 14px 20px;
+        font-size: 14px;
+        font-weight: 600;
+        margin: 4px 0px;
+    }
+    QPushButton#cameraGuideButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #0084ff, stop:1 #0062cc);
+    }
+    QPushButton#cameraGuideButton:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #0062cc, stop:1 #004a9f);
+    }
+    QLabel#cameraGuideStep {
+        background: #e8f4fd;
+        color: #0f766e;
+        padding: 12px 15px;
+        border-radius: 8px;
+        font-size: 13px;
+        border: 1px solid #bfdbfe;
+        margin-left: 10px;
+    }
+    QPushButton#setupCamerasButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #48bb78, stop:1 #38a169);
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 16px 24px;
+        font-size: 16px;
+        font-weight: 600;
+        margin: 4px 0px;
+    }
+    QPushButton#setupCamerasButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #4bc985, stop:1 #3fba7a);
+    }
+    QPushButton#setupCamerasButton:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #3fba7a, stop:1 #309656);
+    }
+    QPushButton#setupCamerasButton:disabled {
+        background: #d4edda;
+        color: #6c757d;
+        border: 2px solid #c3e6cb;
+    }
+    QLabel#setupCamerasStep {
+        background: #f0f9f0;
+        color: #166534;
+        padding: 12px 15px;
+        border-radius: 8px;
+        font-size: 13px;
+        border: 1px solid #bbf7d0;
+        margin: 10px 0px;
+    }
+    QLabel#troubleshootingMessage {
+        background: #fffbf5;
+        color: #fb923c;
+        padding: 10px;
+        border-radius: 6px;
+        font-size: 12px;
+        font-weight: 500;
+        border: 2px solid #fde4cc;
+        margin: 2px 0px;
+    }
+    QPushButton#viewLogsButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #fb923c, stop:1 #f97316);
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 12px;
+        font-size: 12px;
+        font-weight: 600;
+        margin: 4px 0px;
+    }
+    QPushButton#viewLogsButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+            stop:0 #fdba74, stop:1 #fb923c);
+    }
+    QPushButton#viewLogsButton:pressed {
+        background: #ea580c;
+    }
+"""
+
+# Docker Manager container control buttons, one tuple per row (built by create_docker_manager_tab)
+_DOCKER_MANAGER_BUTTON_ROWS = (
+    (
+        {"attr": "docker_start_btn", "text": "▶️ Start", "slot": "docker_action", "args": ("start",),
+         "tooltip": (
+             "🔵 START FRIGATE\n\n"
+             "• Starts existing Frigate container if it exists\n"
+             "• Creates new container automatically if none exists\n"
+             "• Preserves all existing configuration and data\n"
+             "• Best for: Getting Frigate running (works in all situations)\n\n"
+             "✅ Smart Start Behavior:\n"
+             "• Container exists & stopped → Starts it\n"
+             "• Container exists & running → Nothing to do\n"
+             "• No container exists → Creates and starts new one\n\n"
+             "⚠️ Note: Other buttons will be disabled during this operation\n"
+             "✅ Stop button remains available for emergency use"
+         )},
+        {"attr": "docker_stop_btn", "text": "⏹️ Stop", "slot": "docker_action", "args": ("stop",),
+         "tooltip": (
+             "🔴 STOP CONTAINER\n\n"
+             "• Gracefully stops the running Frigate container\n"
+             "• Container remains available for future restart\n"
+             "• All configuration and data are preserved\n"
+             "• Best for: Temporary shutdown or before making config changes\n\n"
+             "✅ Emergency Stop: This button remains enabled during other operations\n"
+             "• Can be used to stop container even during rebuild/restart\n"
+             "• Useful for canceling long-running operations"
+         )},
+        {"attr": "docker_restart_btn", "text": "🔄 Restart", "slot": "docker_action", "args": ("restart",),
+         "tooltip": (
+             "🔄 RESTART CONTAINER\n\n"
+             "• Quick restart of the existing container\n"
+             "• Stops and immediately starts the same container\n"
+             "• Uses existing image and configuration\n"
+             "• Best for: Applying configuration changes or fixing temporary issues\n\n"
+             "❌ Will fail if: No container exists\n"
+             "💡 Solution: Use 'Start' to create and start new container\n"
+             "💡 Or use 'Rebuild' for complete fresh build\n\n"
+             "⚠️ Note: Other buttons will be disabled during this operation\n"
+             "✅ Stop button remains available for emergency use"
+         )},
+    ),
+    (
+        {"attr": "docker_rebuild_btn", "text": "🔨 Rebuild", "slot": "docker_action", "args": ("rebuild",),
+         "style": "dockerRebuild", "tooltip": (
+             "🔨 COMPLETE REBUILD\n\n"
+             "• Stops and removes existing container completely\n"
+             "• Builds fresh Docker image from latest source\n"
+             "• Creates and starts new container with current config\n"
+             "• Best for: Major updates, troubleshooting, or first-time setup\n\n"
+             "⚠️ WARNING: This is a destructive operation!\n"
+             "• Takes several minutes to complete\n"
+             "• Will interrupt any ongoing recordings\n"
+             "• Requires confirmation dialog\n"
+             "• Other buttons will be disabled during this operation\n"
+             "• Stop button remains available for emergency use"
+         )},
+        {"attr": "docker_remove_btn", "text": "🗑️ Remove", "slot": "docker_action", "args": ("remove",),
+         "style": "dockerRemove", "tooltip": (
+             "🗑️ REMOVE CONTAINER\n\n"
+             "• Stops and completely removes the Frigate container\n"
+             "• Container must be recreated with Rebuild to use again\n"
+             "• All container state is lost (config files remain)\n"
+             "• Best for: Complete cleanup or major troubleshooting\n\n"
+             "⚠️ WARNING: This is a destructive operation!\n"
+             "• Container cannot be recovered once removed\n"
+             "• Requires confirmation dialog\n"
+             "• Other buttons will be disabled during this operation\n"
+             "• Stop button remains available for emergency use"
+         )},
+        {"attr": "docker_open_ui_btn", "text": "🌐 Open Frigate Web UI", "slot": "open_frigate_web_ui",
+         "style": "dockerOpenUi", "tooltip": (
+             "🌐 OPEN WEB INTERFACE\n\n"
+             "• Opens Frigate's web interface in your default browser\n"
+             "• Access live camera feeds, recordings, and settings\n"
+             "• Default URL: http://localhost:5000\n"
+             "• Best for: Monitoring cameras and viewing recordings\n\n"
+             "📋 Note: This button stays enabled during operations\n"
+             "• You can open the web UI anytime to check status"
+         )},
+    ),
+)
+
+# How long (ms) to wait before reattaching the Frigate container event watcher when `docker events`
+# can't run or its stream ends (Docker missing, or the daemon restarting)
+_DOCKER_EVENTS_RETRY_MS = 30000
+# Frigate container events that change what the PreConfigured Box tab shows
+_DOCKER_LIFECYCLE_EVENTS = ('create', 'start', 'stop', 'die', 'destroy')
+
+# Characters read from config.yaml per insert when it is loaded into the config viewer
+_CONFIG_VIEW_CHUNK = 64 * 1024
+
+# How long (seconds) a Frigate web UI reachability probe stays valid for the Monitor Cameras button
+_FRIGATE_UI_CHECK_TTL = 5
+
+# Runs of characters Frigate doesn't accept in a camera name (anything but ASCII letters, digits, _ and -)
+_CAMERA_NAME_INVALID = re.compile(r'[^\w-]+', re.ASCII)
+
+# Installation progress logs: lines kept before the oldest are dropped, and how long (ms)
+# scroll-to-bottom requests are batched after a line is appended
+_PROGRESS_LOG_MAX_LINES = 2000
+# Docker image builds and the container log stream are far chattier, so they keep more
+_DOCKER_PROGRESS_MAX_LINES = 5000
+_DOCKER_LOGS_MAX_LINES = 20000
+_PROGRESS_SCROLL_DELAY_MS = 50
+
+# Docker Logs tab: lines shown when the log stream first attaches, how long (ms) streamed lines
+# are gathered into one append, and how long to wait before reattaching after the stream ends
+_DOCKER_LOGS_TAIL_LINES = 200
+_DOCKER_LOGS_BATCH_MS = 100
+_DOCKER_LOGS_RETRY_MS = 3000
+
+# Setup guide step cards built before the dialog opens; the rest are built as they scroll into
+# view, standing in as placeholders of roughly a card's height until then
+_SETUP_GUIDE_EAGER_CARDS = 2
+_SETUP_GUIDE_PLACEHOLDER_HEIGHT = 300
+
+# Status bar hints for the window modes, built once and reused by every mode switch
+_MSG_MAXIMIZED = ' | '.join(('Maximized mode - F11: Fullscreen', 'F5: Refresh', 'Ctrl+W: Windowed', 'Ctrl+?: Shortcuts'))
+_MSG_MAXIMIZED_FROM_FULLSCREEN = ' | '.join(('Maximized mode - F11: Fullscreen', 'F5: Refresh', 'ESC: Restore', 'Ctrl+?: Shortcuts'))
+_MSG_FULLSCREEN = ' | '.join(('Fullscreen mode - F11/ESC: Exit fullscreen', 'F5: Refresh', 'Ctrl+?: Shortcuts'))
+_MSG_WINDOWED = ' | '.join(('Windowed mode (3/4 screen) - F11: Fullscreen', 'F5: Refresh', 'Ctrl+M: Maximize', 'Ctrl+?: Shortcuts'))
+
+@functools.lru_cache(maxsize=None)
+def _default_config():
+    """Template shown by File → New Configuration (built once, then shared)"""
+    return """# New Frigate Configuration
+# Add your configuration here
+
+# Example basic configuration:
+# cameras:
+#   camera_name:
+#     ffmpeg:
+#       inputs:
+#         - path: rtsp://your_camera_ip:554/stream
+#           roles:
+#             - detect
+#             - record
+#     detect:
+#       width: 2560
+#       height: 1440
+#       fps: 5
+
+# objects:
+#   track:
+#     - person
+#     - car
+#     - cat
+#     - dog
+
+# record:
+#   enabled: True
+#   retain:
+#     days: 3
+#     mode: all
+
+# snapshots:
+#   enabled: True
+#   clean_copy: True
+#   retain:
+#     default: 10
+"""
+
+@dataclass
+class PreconfiguredState:
+    """Snapshot of every system probe the PreConfigured Box tab displays"""
+    memryx: Optional[str]  # get_memryx_devices() result, None if the check failed
+    frigate_exists: bool
+    frigate_has_git: bool
+    docker_installed: bool
+    container_exists: bool
+    container_running: bool
+    
+    @property
+    def memryx_ok(self):
+        """True when at least one MemryX device was detected"""
+        return self.memryx is not None and not ("No devices found" in self.memryx or self.memryx == "0")
+
+def _safe_write(path, text):
+    """Write a small marker file, ignoring failures (safe to call from a worker thread)"""
+    try:
+        with open(path, 'w') as f:
+            f.write(text)
+    except OSError:
+        pass  # Ignore errors creating the tracking file
+
+def _atomic_write(path, text):
+    """Replace a file's contents in one rename, so a crash mid-write never leaves it truncated"""
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+class _TTLCache:
+    """Remember the results of slow lookups for a few seconds, keyed by name"""
+    
+    def __init__(self):
+        self._entries = {}  # key -> (time.monotonic() when fetched, value)
+    
+    def get(self, key, ttl, fetch):
+        """Return the cached value for key, calling fetch() if it is missing or older than ttl seconds"""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is None or now - entry[0] >= ttl:
+            entry = (now, fetch())
+            self._entries[key] = entry
+        return entry[1]
+    
+    def invalidate(self):
+        """Forget every cached value so the next get() fetches afresh"""
+        self._entries.clear()
+
+class _RunnableFn(QRunnable):
+    """Run a plain Python callable on a QThreadPool thread"""
+    
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+    
+    def run(self):
+        self.fn()
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection that talks to a UNIX domain socket instead of TCP"""
+    
+    def __init__(self, socket_path, timeout):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+    
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+class DockerSocketClient:
+    """Minimal Docker Engine API client over the local socket.
+    
+    Keeps one keep-alive connection open so status probes don't fork the docker
+    CLI on every refresh. Not thread-safe: use it from the GUI thread only.
+    Raises OSError (or ValueError for bad JSON) so callers can fall back to the CLI.
+    """
+    SOCKET_PATH = '/var/run/docker.sock'
+    
+    def __init__(self, socket_path=SOCKET_PATH, timeout=5):
+        self._conn = _UnixHTTPConnection(socket_path, timeout)
+    
+    def get_json(self, path):
+        """GET an API path and return the decoded JSON body"""
+        for attempt in range(2):
+            try:
+                self._conn.request('GET', path)
+                response = self._conn.getresponse()
+                body = response.read()
+                break
+            except (http.client.HTTPException, ConnectionError):
+                # Daemon dropped the idle keep-alive connection - reconnect once
+                self._conn.close()
+                if attempt:
+                    raise OSError("Docker API connection failed")
+            except OSError:
+                self._conn.close()
+                raise
+        if response.status != 200:
+            raise OSError(f"Docker API returned HTTP {response.status}")
+        return json.loads(body)
+    
+    def list_containers(self, name, all=True):
+        """Return containers whose name contains `name` (same matching as `docker ps -f name=`)"""
+        filters = urllib.parse.quote(json.dumps({'name': [name]}))
+        return self.get_json(f"/containers/json?all={1 if all else 0}&filters={filters}")
+    
+    def close(self):
+        self._conn.close()
 
 class ModalOverlay(QWidget):
     """Semi-transparent overlay widget to dim the background when dialogs are shown"""
@@ -1180,8 +2747,7 @@ class MemryXInstallWorker(QThread):
             self.progress.emit("🚀 Starting MemryX driver and runtime installation...")
             
             # Detect architecture
-            arch_result = subprocess.run(['uname', '-m'], capture_output=True, text=True, check=True)
-            architecture = arch_result.stdout.strip()
+            architecture = _SYS_ARCH
             self.progress.emit(f"🏗️ Detected architecture: {architecture}")
             
             # Step 1: Purge existing packages and repo
@@ -1217,8 +2783,7 @@ class MemryXInstallWorker(QThread):
                 pass  # Key may not exist
             
             # Step 2: Install kernel headers
-            kernel_version_result = subprocess.run(['uname', '-r'], capture_output=True, text=True, check=True)
-            kernel_version = kernel_version_result.stdout.strip()
+            kernel_version = _SYS_KERNEL
             self.progress.emit(f"🔧 Installing kernel headers for: {kernel_version}")
             
             run_sudo_command(['sudo', 'apt', 'update'])
@@ -1451,6 +3016,131 @@ class StatusCheckWorker(QThread):
         except Exception:
             return {'text': '❓ Check Failed', 'style': 'background: #fdf6e3; color: #8b7355; padding: 6px; border-radius: 4px;'}
 
+class DockerLogsWorker(QThread):
+    """Follows the Frigate container log with one long-lived `docker logs -f` instead of polling"""
+    logs_received = Signal(str, bool)  # Text, and whether it replaces the display instead of appending
+    
+    def run(self):
+        """Stream the log until interruption is requested, reattaching whenever the stream ends"""
+        since = None  # When the last stream ended; reattaching resumes from there
+        shown_status = None  # Error message currently standing in for the log
+        while not self.isInterruptionRequested():
+            if since is None:
+                args = ['--tail', str(_DOCKER_LOGS_TAIL_LINES)]
+            else:
+                args = ['--since', f'{since:.6f}']
+            status = None
+            try:
+                proc = subprocess.Popen(['docker', 'logs', '-f', *args, 'frigate'],
+                                        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            except FileNotFoundError:
+                status = "Docker not found. Please ensure Docker is installed and running."
+            except Exception as e:
+                status = f"Error fetching logs: {str(e)}\n\nIs Frigate container running?"
+            else:
+                with proc:
+                    try:
+                        wrote = self._stream(proc, replace=shown_status is not None)
+                    finally:
+                        if proc.poll() is None:
+                            proc.terminate()
+                if self.isInterruptionRequested():
+                    return
+                if wrote or proc.returncode == 0:
+                    # The container stopped or restarted; pick up from here on the next attach
+                    since = time.time()
+                    if wrote:
+                        shown_status = None
+                else:
+                    status = "Unable to fetch logs. Is Frigate container running?"
+            
+            if status is not None:
+                if status != shown_status:
+                    self.logs_received.emit(status, True)
+                    shown_status = status
+                since = None  # The log was replaced, so show the full tail again once it's back
+            
+            # Wait before reattaching, in short steps so closing the window isn't held up
+            slept_ms = 0
+            while slept_ms < _DOCKER_LOGS_RETRY_MS:
+                if self.isInterruptionRequested():
+                    return
+                self.msleep(100)
+                slept_ms += 100
+    
+    def _stream(self, proc, replace):
+        """Emit the process output in whole-line batches until it exits; return whether there was any"""
+        fd = proc.stdout.fileno()
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        pending = ''
+        wrote = False
+        batch_timer = QElapsedTimer()
+        batch_timer.start()
+        while not self.isInterruptionRequested():
+            # Wake up regularly even when the log is quiet, to flush a batch or notice interruption
+            ready, _, _ = select.select([fd], [], [], _DOCKER_LOGS_BATCH_MS / 1000)
+            chunk = os.read(fd, 65536) if ready else None
+            eof = chunk == b''
+            if chunk is not None:
+                pending += decoder.decode(chunk, final=eof)
+            if eof:
+                text, pending = pending.rstrip('\n') or None, ''
+            elif '\n' in pending and batch_timer.elapsed() >= _DOCKER_LOGS_BATCH_MS:
+                # Hold back a partial last line until the rest of it arrives
+                text, _, pending = pending.rpartition('\n')
+            else:
+                text = None
+            if text is not None:
+                self.logs_received.emit(text, replace)
+                replace = False
+                wrote = True
+                batch_timer.restart()
+            if eof:
+                break
+        return wrote
+
+class DockerEventsWorker(QThread):
+    """Watches `docker events` for the Frigate container, so status refreshes follow real changes"""
+    container_changed = Signal(str)  # Event status (start, die, destroy, ...); "" after reattaching
+    
+    def __init__(self):
+        super().__init__()
+        self._proc = None
+        self._stopped = threading.Event()
+    
+    def stop(self):
+        """End the watch; ending `docker events` wakes the thread from its blocking read"""
+        self._stopped.set()
+        proc = self._proc
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+    
+    def run(self):
+        """Relay container events until stopped, reattaching whenever the stream ends"""
+        attached_before = False
+        while not self._stopped.is_set():
+            try:
+                # Lifecycle events only: the health check alone fires exec_* and health_status
+                # events every few seconds while Frigate runs
+                self._proc = subprocess.Popen(
+                    ['docker', 'events', '--filter', 'container=frigate',
+                     *(arg for event in _DOCKER_LIFECYCLE_EVENTS for arg in ('--filter', f'event={event}')),
+                     '--format', '{{.Status}}'],
+                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            except OSError:
+                self._proc = None
+            else:
+                with self._proc:
+                    if self._stopped.is_set():  # stop() ran before _proc was set
+                        self._proc.terminate()
+                    elif attached_before:
+                        # Anything could have changed while detached
+                        self.container_changed.emit("")
+                    attached_before = True
+                    for line in self._proc.stdout:
+                        self.container_changed.emit(line.strip())
+            self._stopped.wait(_DOCKER_EVENTS_RETRY_MS / 1000)
+
 class CameraSetupWizard(QDialog):
     """User-friendly camera setup wizard for PreConfigured Box"""
     
@@ -1483,12 +3173,12 @@ class CameraSetupWizard(QDialog):
         header_layout.setContentsMargins(25, 20, 25, 20)
         
         title = QLabel("🎥 Set Up Your Cameras")
-        title.setFont(QFont("Segoe UI", 20, QFont.Bold))
+        title.setFont(_font("Segoe UI", 20, QFont.Bold))
         title.setAlignment(Qt.AlignCenter)
         title.setStyleSheet("color: white; margin-bottom: 8px;")
         
         subtitle = QLabel("Add your cameras to start monitoring with Frigate")
-        subtitle.setFont(QFont("Segoe UI", 14))
+        subtitle.setFont(_font("Segoe UI", 14))
         subtitle.setAlignment(Qt.AlignCenter)
         subtitle.setStyleSheet("color: white; opacity: 0.9;")
         
@@ -1510,7 +3200,7 @@ class CameraSetupWizard(QDialog):
         
         # Cameras list title
         cameras_title = QLabel("📹 Your Cameras")
-        cameras_title.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        cameras_title.setFont(_font("Segoe UI", 16, QFont.Bold))
         cameras_title.setStyleSheet("color: #2d3748; margin-bottom: 15px;")
         cameras_layout.addWidget(cameras_title)
         
@@ -1519,14 +3209,7 @@ class CameraSetupWizard(QDialog):
         self.cameras_scroll.setWidgetResizable(True)
         self.cameras_scroll.setMinimumHeight(200)
         self.cameras_scroll.setMaximumHeight(400)  # Prevent excessive growth
-        self.cameras_scroll.setStyleSheet(f"""
-            QScrollArea {{
-                border: 1px solid #cbd5e0;
-                border-radius: 6px;
-                background: #f8f9fa;
-            }}
-            {self.scroll_bar_style}
-        """)
+        self.cameras_scroll.setStyleSheet(_CAMERAS_SCROLL_QSS)
         
         self.cameras_widget = QWidget()
         self.cameras_layout = QVBoxLayout(self.cameras_widget)
@@ -1537,7 +3220,7 @@ class CameraSetupWizard(QDialog):
         
         # Add camera button
         add_camera_btn = QPushButton("➕ Add Camera")
-        add_camera_btn.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        add_camera_btn.setFont(_font("Segoe UI", 14, QFont.Bold))
         add_camera_btn.setMinimumHeight(50)
         add_camera_btn.clicked.connect(self.add_camera)
         add_camera_btn.setStyleSheet("""
@@ -1693,7 +3376,7 @@ class CameraSetupWelcomeDialog(QDialog):
         
         # Welcome title with smaller size
         title = QLabel("🎥 Welcome to Your MemryX + Frigate Box!")
-        title.setFont(QFont("Segoe UI", 28, QFont.Bold))
+        title.setFont(_font("Segoe UI", 28, QFont.Bold))
         title.setAlignment(Qt.AlignCenter)
         title.setStyleSheet("""
             color: white; 
@@ -1719,7 +3402,7 @@ class CameraSetupWelcomeDialog(QDialog):
         # Main message with smaller text
         message = QLabel()
         message.setWordWrap(True)
-        message.setFont(QFont("Segoe UI", 14))
+        message.setFont(_font("Segoe UI", 14))
         message.setText(
             "🎯 To get started, first you need to setup your cameras.\n\n"
             "📋 Use this guide to setup Amcrest cameras first.\n"
@@ -1747,7 +3430,7 @@ class CameraSetupWelcomeDialog(QDialog):
         
         # Start Setup button - simplified to ensure text shows
         self.start_setup_btn = QPushButton("🚀 Start Amcrest Camera Setup")
-        self.start_setup_btn.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        self.start_setup_btn.setFont(_font("Segoe UI", 14, QFont.Bold))
         self.start_setup_btn.setMinimumHeight(70)
         self.start_setup_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.start_setup_btn.clicked.connect(self.start_camera_setup)
@@ -1772,7 +3455,7 @@ class CameraSetupWelcomeDialog(QDialog):
         
         # Already Setup button - simplified to ensure text shows
         self.already_setup_btn = QPushButton("✅ Skip - Already Configured")
-        self.already_setup_btn.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        self.already_setup_btn.setFont(_font("Segoe UI", 12, QFont.Bold))
         self.already_setup_btn.setMinimumHeight(50)
         self.already_setup_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.already_setup_btn.clicked.connect(self.mark_setup_complete)
@@ -1803,7 +3486,7 @@ class CameraSetupWelcomeDialog(QDialog):
         footer_note = QLabel(
             "💡 Don't worry - you can always access the camera setup guide later from the main screen."
         )
-        footer_note.setFont(QFont("Segoe UI", 11))
+        footer_note.setFont(_font("Segoe UI", 11))
         footer_note.setAlignment(Qt.AlignCenter)
         footer_note.setStyleSheet("""
             QLabel {
@@ -1864,7 +3547,7 @@ class CameraConfigWidget(QFrame):
         header_layout = QHBoxLayout()
         
         self.camera_title = QLabel(f"📷 Camera {self.camera_number}")
-        self.camera_title.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        self.camera_title.setFont(_font("Segoe UI", 14, QFont.Bold))
         self.camera_title.setStyleSheet("color: #2d3748;")
         
         remove_btn = QPushButton("🗑️ Remove")
@@ -1945,7 +3628,7 @@ class CameraConfigWidget(QFrame):
         # Objects to track
         objects_layout = QVBoxLayout()
         objects_label = QLabel("Objects to Track:")
-        objects_label.setFont(QFont("Segoe UI", 11, QFont.Bold))
+        objects_label.setFont(_font("Segoe UI", 11, QFont.Bold))
         objects_label.setStyleSheet("color: #4a5568; margin-top: 8px;")
         objects_layout.addWidget(objects_label)
         
@@ -2031,11 +3714,48 @@ class CameraConfigWidget(QFrame):
         }
 
 class FrigateLauncher(QMainWindow):
+    # Emitted from pool threads when a browser could not be launched: (title, message)
+    browser_open_failed = Signal(str, str)
+    # Emitted from a pool thread for each setup guide screenshot decoded in the background: (path, scaled image)
+    setup_image_loaded = Signal(str, QImage)
+    # Emitted from a pool thread with the result of a Frigate web UI reachability probe
+    frigate_ui_checked = Signal(bool)
+    # Emitted from a pool thread when a Prerequisites tab probe finishes: (probe name, result or exception)
+    prereq_probed = Signal(str, object)
+    
     def __init__(self):
         super().__init__()
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
+        
+        # Paths used throughout the launcher, joined once
+        self._config_path = os.path.join(self.script_dir, "frigate", "config", "config.yaml")
+        self._cam_assets_dir = os.path.join(self.script_dir, "cam_assets")
+        self._memryx_logo_path = os.path.join(self.script_dir, "assets", "memryx.png")
+        self._frigate_logo_path = os.path.join(self.script_dir, "assets", "frigate.png")
+        
         self.config_file_mtime = 0  # Track config file modification time
         self.suppress_config_change_popup = False  # Flag to suppress config change popup
+        self._config_preview_hash = None  # hash() of the text last loaded into config_preview
+        
+        self._pending_status_refresh = False  # A coalesced PreConfigured status refresh is queued
+        
+        # Running guidance highlight animations, keyed by button
+        self._button_highlights = {}
+        
+        # Scaled camera setup guide screenshots, keyed by image path
+        self._setup_pixmap_cache = {}
+        self._pixmap_preload_started = False
+        
+        # (time.monotonic(), reachable) of the last Frigate web UI probe, reused for a few seconds
+        self._frigate_url_last_check = None
+        
+        # Guidance dialogs are created on first use and then reused
+        self._start_guidance_dialog = None
+        self._web_ui_guidance_dialog = None
+        
+        # Whether the Web UI guidance was already dismissed; read once instead of on every Frigate start
+        self._web_ui_guidance_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.web_ui_guidance_shown')
+        self._web_ui_guidance_shown = os.path.exists(self._web_ui_guidance_file)
         
         # Setup completion tracking
         self.setup_complete_file = os.path.join(self.script_dir, '.camera_setup_complete')
@@ -2044,6 +3764,47 @@ class FrigateLauncher(QMainWindow):
         # Initialize worker thread reference
         self.docker_worker = None
         
+        # Persistent Docker API connection for frequent container status probes
+        self._docker_client = DockerSocketClient()
+        
+        # Short-lived disk readings for the system info panel
+        self._sys_cache = _TTLCache()
+        
+        # Prerequisites tab probe results, so back-to-back checks don't re-run the same commands
+        self._prereq_cache = _TTLCache()
+        
+        # Progress logs with a scroll-to-bottom already queued (see _queue_progress_scroll)
+        self._scroll_pending = set()
+        # Docker Manager console lines written before its (lazily built) tab exists
+        self._docker_progress_backlog = []
+        
+        # Keyboard shortcuts, looked up by keyPressEvent
+        self._function_key_table = {
+            Qt.Key_F11: self.toggle_fullscreen,  # F11 for fullscreen toggle
+            Qt.Key_F5: self.check_system_status,  # F5 for status refresh
+            Qt.Key_F1: self.open_frigate_documentation,  # F1 for documentation
+            Qt.Key_F2: self.open_memryx_documentation,  # F2 for MemryX documentation
+        }
+        self._key_table = self._create_key_table()
+        
+        # Browser launches run on the thread pool; failures are reported back here
+        self.browser_open_failed.connect(self._on_browser_open_failed)
+        self.setup_image_loaded.connect(self._on_setup_image_loaded)
+        self.frigate_ui_checked.connect(self._on_frigate_ui_checked)
+        
+        # Prerequisites tab probes run on the thread pool; results are shown by name
+        self.prereq_probed.connect(self._on_prereq_probed)
+        self._prereq_result_handlers = {
+            'git': self._show_git_prereq,
+            'build-tools': self._show_build_tools_prereq,
+            'docker': self._show_docker_prereq_status,
+            'memryx': self._show_memryx_prereq_status,
+        }
+        # Probes of the opening check still running (see _check_all_prerequisites)
+        self._prereq_initial_pending = set()
+        # Probes on the pool right now; a repeat request for one of these waits for its result
+        self._prereq_probes_running = set()
+        
         # Initialize loading state
         self.is_initializing = True
         
@@ -2054,57 +3815,31 @@ class FrigateLauncher(QMainWindow):
         self.button_base_text = ""
         self.button_operation_state = "idle"  # idle, starting, building, starting_container, running, stopping
         
+        # PreConfigured Box widgets and timer, filled in when that tab is built
+        self.preconfigured_start_btn = None
+        self.preconfigured_stop_btn = None
+        self.preconfigured_open_ui_btn = None
+        self._docker_events_worker = None  # Refreshes the tab when the Frigate container changes
+        self._preconfigured_refresh_paused = False  # Window minimized or hidden; refresh on return
+        self._preconfigured_shown_state = None  # PreconfiguredState the status labels last showed
+        self.warning_group = None
+        self.docker_warning = None
+        self.memryx_warning = None
+        self.frigate_warning = None
+        self.manual_setup_btn = None
+        self.troubleshooting_group = None
+        
         # Store references to container layouts for responsive resizing
         self.responsive_containers = []
+        # Coalesces a burst of resize/show/restore events into one responsive margin update
+        self._responsive_layout_timer = QTimer(self)
+        self._responsive_layout_timer.setSingleShot(True)
+        self._responsive_layout_timer.timeout.connect(self.update_responsive_layouts)
         
         # Modal overlay for dimming background during dialogs
         self.modal_overlay = ModalOverlay(self)
         self.modal_overlay.hide()  # Initially hidden
         
-        # Common scroll bar styling for consistency across all text areas
-        self.scroll_bar_style = """
-            QScrollBar:vertical {
-                background: #f0f0f0;
-                width: 12px;
-                border-radius: 6px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #4a90a4;
-                border-radius: 6px;
-                min-height: 20px;
-                margin: 2px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #38758a;
-            }
-            QScrollBar::handle:vertical:pressed {
-                background: #2c6b7d;
-            }
-            QScrollBar:horizontal {
-                background: #f0f0f0;
-                height: 12px;
-                border-radius: 6px;
-                margin: 0px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #4a90a4;
-                border-radius: 6px;
-                min-width: 20px;
-                margin: 2px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #38758a;
-            }
-            QScrollBar::handle:horizontal:pressed {
-                background: #2c6b7d;
-            }
-            QScrollBar::add-line, QScrollBar::sub-line {
-                border: none;
-                background: none;
-            }
-        """
-        
         # Create timers before setup_ui() so they're available during tab creation
         # Status check timer
         self.status_timer = QTimer()
@@ -2114,15 +3849,24 @@ class FrigateLauncher(QMainWindow):
         self.config_watcher_timer = QTimer()
         self.config_watcher_timer.timeout.connect(self.check_config_file_changes)
         
-        # Logs auto-refresh timer
-        self.logs_timer = QTimer()
-        self.logs_timer.timeout.connect(self.refresh_logs)
+        # Follows the Frigate container log for the Docker Logs tab once that tab is built
+        self._docker_logs_worker = None
+        
+        # Coalesces bursts of PreConfigured button-state refresh requests into one docker probe
+        self._preconf_dirty_timer = QTimer(self)
+        self._preconf_dirty_timer.setSingleShot(True)
+        self._preconf_dirty_timer.setInterval(100)
+        self._preconf_dirty_timer.timeout.connect(self._refresh_preconfigured_button_states)
         
         # Setup UI (this will create tabs and potentially start timers)
         self.setup_ui()
         
         # Defer heavy operations until after UI is shown to improve startup time
         QTimer.singleShot(100, self._initialize_async_components)
+        
+        # Decode the camera setup guide screenshots in the background as soon as the event loop
+        # runs, so the guide (reachable from the welcome dialog and the PreConfigured tab) opens warm
+        QTimer.singleShot(0, self.preload_setup_guide_images)
     
     def mark_setup_complete(self):
         """Mark the initial setup as complete to prevent the welcome dialog from showing again"""
@@ -2234,9 +3978,8 @@ class FrigateLauncher(QMainWindow):
         self.setWindowTitle("MemryX + Frigate Launcher - Full Control Center")
         
         # Set window icon if available
-        icon_path = os.path.join(self.script_dir, "assets", "frigate.png")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        if os.path.exists(self._frigate_logo_path):
+            self.setWindowIcon(QIcon(self._frigate_logo_path))
         
         # Get screen size and set window to maximize/fullscreen
         screen = QApplication.primaryScreen()
@@ -2466,7 +4209,7 @@ class FrigateLauncher(QMainWindow):
                 border: none;
                 background: none;
             }
-        """)
+        """ + _MANUAL_SETUP_QSS + _DOCKER_MANAGER_QSS + _PRECONFIGURED_QSS)
         
         # Central widget with tabs
         central_widget = QWidget()
@@ -2479,26 +4222,25 @@ class FrigateLauncher(QMainWindow):
         # Main tabs - new structure with 3 primary tabs using lazy loading
         self.main_tab_widget = QTabWidget()
         
-        # Initialize tab content tracking
-        self._tab_contents = {}
+        # Initialize tab content tracking (bit N set once tab N holds its real content)
+        self._tab_loaded_mask = 0
+        self._creating_tab_mask = 0
         
         # 1. PreConfigured Box tab (load immediately as it's the default)
         self.main_tab_widget.addTab(self.create_preconfigured_tab(), "📦 PreConfigured Box")
-        self._tab_contents[0] = True  # Mark as loaded
+        self._tab_loaded_mask |= 1 << 0  # Mark as loaded
         
         # 2. Manual Setup tab (lazy load)
         placeholder_manual = QLabel("Loading Manual Setup...")
         placeholder_manual.setAlignment(Qt.AlignCenter)
-        placeholder_manual.setStyleSheet("color: #666; font-size: 14px; padding: 50px;")
-        self.main_tab_widget.addTab(placeholder_manual, "🔧 Manual Setup")
-        self._tab_contents[1] = False  # Mark as not loaded
+        placeholder_manual.setStyleSheet(_TAB_PLACEHOLDER_QSS)
+        self.main_tab_widget.addTab(placeholder_manual, "🔧 Manual Setup")  # Bit 1 left clear: not loaded
         
         # 3. Advanced Settings tab (lazy load)
         placeholder_advanced = QLabel("Loading Advanced Settings...")
         placeholder_advanced.setAlignment(Qt.AlignCenter)
-        placeholder_advanced.setStyleSheet("color: #666; font-size: 14px; padding: 50px;")
-        self.main_tab_widget.addTab(placeholder_advanced, "⚙️ Advanced Settings")
-        self._tab_contents[2] = False  # Mark as not loaded
+        placeholder_advanced.setStyleSheet(_TAB_PLACEHOLDER_QSS)
+        self.main_tab_widget.addTab(placeholder_advanced, "⚙️ Advanced Settings")  # Bit 2 left clear: not loaded
         
         # Set PreConfigured Box as default tab (index 0)
         self.main_tab_widget.setCurrentIndex(0)
@@ -2564,7 +4306,7 @@ class FrigateLauncher(QMainWindow):
         start_docker_action = tools_menu.addAction('&Start Frigate')
         start_docker_action.setShortcut('Ctrl+Shift+S')
         start_docker_action.setStatusTip('Start Frigate Docker container')
-        start_docker_action.triggered.connect(lambda: self.docker_action('start'))
+        start_docker_action.triggered.connect(self._start_frigate)
         
         stop_docker_action = tools_menu.addAction('S&top Frigate')
         stop_docker_action.setShortcut('Ctrl+Shift+T')
@@ -2619,7 +4361,7 @@ class FrigateLauncher(QMainWindow):
         manual_setup_tab_action = view_menu.addAction('&Manual Setup Tab')
         manual_setup_tab_action.setShortcut('Ctrl+2')
         manual_setup_tab_action.setStatusTip('Switch to Manual Setup tab')
-        manual_setup_tab_action.triggered.connect(lambda: self.main_tab_widget.setCurrentIndex(1))
+        manual_setup_tab_action.triggered.connect(self._goto_manual_setup)
         
         advanced_tab_action = view_menu.addAction('&Advanced Settings Tab')
         advanced_tab_action.setShortcut('Ctrl+3')
@@ -2750,11 +4492,11 @@ class FrigateLauncher(QMainWindow):
         self.is_initializing = False
         
         # Re-enable buttons now that initialization is complete
-        if hasattr(self, 'preconfigured_start_btn'):
+        if self.preconfigured_start_btn is not None:
             self.preconfigured_start_btn.setEnabled(True)
-        if hasattr(self, 'preconfigured_stop_btn'):
+        if self.preconfigured_stop_btn is not None:
             self.preconfigured_stop_btn.setEnabled(True)
-        if hasattr(self, 'preconfigured_open_ui_btn'):
+        if self.preconfigured_open_ui_btn is not None:
             self.preconfigured_open_ui_btn.setEnabled(True)
         if hasattr(self, 'setup_cameras_btn'):
             self.setup_cameras_btn.setEnabled(True)
@@ -2763,8 +4505,7 @@ class FrigateLauncher(QMainWindow):
         
         # Update status bar to ready state
         if hasattr(self, 'status_label'):
-            self.status_label.setText("✅ Ready")
-            self.status_label.setStyleSheet("background: #e8f4f0; color: #2d5a4a; padding: 8px 12px; border-radius: 4px; font-weight: 600; font-size: 14px;")
+            self.status_label.setText("✅ Ready")  # Keeps the sheet it was created with
         
         self.statusBar().showMessage('Frigate+MemryX Control Center - Ready | F11: Fullscreen | F5: Refresh | F1: Help | Ctrl+Q: Exit')
         
@@ -2815,9 +4556,6 @@ class FrigateLauncher(QMainWindow):
             self.memryx_overview_status.setText(memryx_data['text'])
             self.memryx_overview_status.setStyleSheet(memryx_data['style'])
         
-        # Update system monitoring (non-blocking)
-        self.update_system_monitoring()
-        
         # Update button states
         self.update_button_states_from_status(status_data)
     
@@ -2842,19 +4580,25 @@ class FrigateLauncher(QMainWindow):
 
     def _load_tab_on_demand(self, index):
         """Load tab content on-demand when user switches to it"""
-        # Prevent loading if we're already in the process of creating this tab
-        if hasattr(self, '_creating_tab_index') and self._creating_tab_index == index:
+        if index < 0:  # No current tab
             return
-            
-        if index in self._tab_contents and not self._tab_contents[index]:
-            # Mark that we're creating this tab to prevent recursive calls
-            self._creating_tab_index = index
-            
-            # Tab hasn't been loaded yet, load it now using QTimer to avoid blocking
-            if index == 1:  # Manual Setup tab
-                QTimer.singleShot(10, lambda: self._create_tab_content(index, "manual"))
-            elif index == 2:  # Advanced Settings tab
-                QTimer.singleShot(10, lambda: self._create_tab_content(index, "advanced"))
+        
+        # Skip tabs that are already loaded or that we're in the process of creating
+        bit = 1 << index
+        if (self._tab_loaded_mask | self._creating_tab_mask) & bit:
+            return
+        
+        # Tab hasn't been loaded yet, load it now using QTimer to avoid blocking
+        if index == 1:  # Manual Setup tab
+            tab_type = "manual"
+        elif index == 2:  # Advanced Settings tab
+            tab_type = "advanced"
+        else:
+            return
+        
+        # Mark that we're creating this tab to prevent recursive calls
+        self._creating_tab_mask |= bit
+        QTimer.singleShot(10, lambda: self._create_tab_content(index, tab_type))
     
     def _create_tab_content(self, index, tab_type):
         """Create tab content and replace placeholder without triggering tab changes"""
@@ -2868,55 +4612,61 @@ class FrigateLauncher(QMainWindow):
             else:
                 return
             
-            # Store current tab index to restore it after replacement
-            current_index = self.main_tab_widget.currentIndex()
-            
             # Replace the placeholder with actual content (no signal needed)
-            old_widget = self.main_tab_widget.widget(index)
-            self.main_tab_widget.removeTab(index)
-            self.main_tab_widget.insertTab(index, content, tab_title)
-            
-            # Only change to this tab if user is actually on it, otherwise stay on current tab
-            if current_index == index:
-                self.main_tab_widget.setCurrentIndex(index)
-            else:
-                # Restore the original current tab
-                self.main_tab_widget.setCurrentIndex(current_index)
-            
-            # Clean up old placeholder widget
-            if old_widget:
-                old_widget.deleteLater()
+            self._replace_tab(index, content, tab_title)
             
             # Mark as loaded
-            self._tab_contents[index] = True
+            self._tab_loaded_mask |= 1 << index
             
             # Clear creation flag
-            if hasattr(self, '_creating_tab_index'):
-                delattr(self, '_creating_tab_index')
+            self._creating_tab_mask &= ~(1 << index)
             
         except Exception as e:
             # On error, show error message in tab
             error_widget = QLabel(f"Error loading tab: {str(e)}")
             error_widget.setAlignment(Qt.AlignCenter)
             error_widget.setStyleSheet("color: red; font-size: 14px; padding: 50px;")
-            
-            current_index = self.main_tab_widget.currentIndex()
-            old_widget = self.main_tab_widget.widget(index)
-            self.main_tab_widget.removeTab(index)
-            self.main_tab_widget.insertTab(index, error_widget, f"❌ Error")
-            
-            # Restore current tab or set to error tab if user was on it
-            if current_index == index:
-                self.main_tab_widget.setCurrentIndex(index)
-            else:
-                self.main_tab_widget.setCurrentIndex(current_index)
-            
-            if old_widget:
-                old_widget.deleteLater()
+            self._replace_tab(index, error_widget, f"❌ Error")
             
             # Clear creation flag
-            if hasattr(self, '_creating_tab_index'):
-                delattr(self, '_creating_tab_index')
+            self._creating_tab_mask &= ~(1 << index)
+    
+    def _on_sub_tab_changed(self, tabs, builders, index):
+        """Build a Manual Setup or Advanced Settings sub-tab the first time it is selected"""
+        if index not in builders:
+            return
+        QTimer.singleShot(0, lambda: self._create_sub_tab_content(tabs, builders, index))
+    
+    def _create_sub_tab_content(self, tabs, builders, index):
+        """Replace a sub-tab placeholder with its real content"""
+        builder = builders.pop(index, None)
+        if builder is None:
+            return
+        create_tab, tab_title = builder
+        self._replace_tab(index, create_tab(), tab_title, tabs)
+    
+    def _replace_tab(self, index, widget, title, tabs=None):
+        """Swap the widget shown in a tab (a main tab by default), keeping the user on whichever tab they are on"""
+        if tabs is None:
+            tabs = self.main_tab_widget
+        current_index = tabs.currentIndex()
+        old_widget = tabs.widget(index)
+        
+        # Remove + insert is one change as far as the user is concerned: repaint once, and don't
+        # report the current tab hopping to a neighbour and back while the placeholder is out
+        tabs.setUpdatesEnabled(False)
+        tabs.blockSignals(True)
+        try:
+            tabs.removeTab(index)
+            tabs.insertTab(index, widget, title)
+            tabs.setCurrentIndex(current_index)
+        finally:
+            tabs.blockSignals(False)
+            tabs.setUpdatesEnabled(True)
+        
+        # Clean up old placeholder widget
+        if old_widget:
+            old_widget.deleteLater()
     
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode"""
@@ -2925,10 +4675,10 @@ class FrigateLauncher(QMainWindow):
             # Maximize to use available screen space but show taskbar
             screen = QApplication.primaryScreen()
             self.setGeometry(screen.availableGeometry())
-            self.statusBar().showMessage('Maximized mode - F11: Fullscreen | F5: Refresh | ESC: Restore | Ctrl+?: Shortcuts')
+            self.statusBar().showMessage(_MSG_MAXIMIZED_FROM_FULLSCREEN)
         else:
             self.showFullScreen()
-            self.statusBar().showMessage('Fullscreen mode - F11/ESC: Exit fullscreen | F5: Refresh | Ctrl+?: Shortcuts')
+            self.statusBar().showMessage(_MSG_FULLSCREEN)
     
     def set_windowed_mode(self):
         """Set windowed mode (3/4 screen size, centered)"""
@@ -2945,16 +4695,18 @@ class FrigateLauncher(QMainWindow):
         window_width = int(screen_width * 0.75)
         window_height = int(screen_height * 0.75)
         
-        # Set window size
-        self.resize(window_width, window_height)
+        # Set window size (only if it changed, to avoid a needless relayout)
+        if (self.width(), self.height()) != (window_width, window_height):
+            self.resize(window_width, window_height)
         
         # Center the window on screen
         x = (screen_width - window_width) // 2
         y = (screen_height - window_height) // 2
-        self.move(x, y)
+        if (self.x(), self.y()) != (x, y):
+            self.move(x, y)
         
         # Update status bar
-        self.statusBar().showMessage('Windowed mode (3/4 screen) - F11: Fullscreen | F5: Refresh | Ctrl+M: Maximize | Ctrl+?: Shortcuts')
+        self.statusBar().showMessage(_MSG_WINDOWED)
     
     def show_about(self):
         """Show about dialog"""
@@ -3018,6 +4770,7 @@ class FrigateLauncher(QMainWindow):
         if hasattr(self, 'advanced_tab_widget'):
             self.advanced_tab_widget.setCurrentIndex(2)  # Docker Logs sub-tab
     
+    @Slot()
     def go_to_docker_logs(self):
         """Navigate directly to Advanced Settings → Docker Logs tab"""
         try:
@@ -3025,15 +4778,18 @@ class FrigateLauncher(QMainWindow):
             self.main_tab_widget.setCurrentIndex(2)
             
             # Add a small delay to ensure the advanced tab is fully loaded
-            def navigate_to_docker_logs():
+            def navigate_to_docker_logs(tries=0):
                 if hasattr(self, 'advanced_tab_widget'):
                     # Switch to Docker Logs sub-tab (index 2: Configuration, Docker Manager, Docker Logs)
                     self.advanced_tab_widget.setCurrentIndex(2)  # Docker Logs is the 3rd tab (index 2)
                     print("DEBUG: Navigated to Docker Logs tab (index 2)")
+                elif tries >= 10:
+                    # Give up instead of keeping a retry timer alive forever
+                    print("Warning: advanced_tab_widget never became available, giving up on Docker Logs navigation")
                 else:
                     print("DEBUG: advanced_tab_widget not found, retrying...")
-                    # If advanced tab isn't loaded yet, wait and try again
-                    QTimer.singleShot(500, navigate_to_docker_logs)
+                    # If advanced tab isn't loaded yet, wait and try again (exponential backoff, capped at 5s)
+                    QTimer.singleShot(min(500 * (2 ** tries), 5000), lambda: navigate_to_docker_logs(tries + 1))
             
             # Use a timer to ensure the tab switch happens after the main tab is loaded
             QTimer.singleShot(100, navigate_to_docker_logs)
@@ -3063,43 +4819,7 @@ class FrigateLauncher(QMainWindow):
             self.tab_widget.setCurrentIndex(2)
             # Clear the config editor (if it exists)
             if hasattr(self, 'config_preview'):
-                self.config_preview.clear()
-                self.config_preview.setPlainText("""# New Frigate Configuration
-# Add your configuration here
-
-# Example basic configuration:
-# cameras:
-#   camera_name:
-#     ffmpeg:
-#       inputs:
-#         - path: rtsp://your_camera_ip:554/stream
-#           roles:
-#             - detect
-#             - record
-#     detect:
-#       width: 2560
-#       height: 1440
-#       fps: 5
-
-# objects:
-#   track:
-#     - person
-#     - car
-#     - cat
-#     - dog
-
-# record:
-#   enabled: True
-#   retain:
-#     days: 3
-#     mode: all
-
-# snapshots:
-#   enabled: True
-#   clean_copy: True
-#   retain:
-#     default: 10
-""")
+                self.set_config_preview_text(_default_config())
                 self.statusBar().showMessage('New configuration created - Use Ctrl+S to save')
     
     def open_configuration(self):
@@ -3112,15 +4832,15 @@ class FrigateLauncher(QMainWindow):
         
         if filename:
             try:
-                with open(filename, 'r') as f:
-                    content = f.read()
+                # Single read with an explicit UTF-8 decode (no locale/charset guessing)
+                content = Path(filename).read_bytes().decode('utf-8', errors='replace')
                 
                 # Switch to Configuration tab
                 self.tab_widget.setCurrentIndex(2)
                 
                 # Load content into config editor (if it exists)
                 if hasattr(self, 'config_preview'):
-                    self.config_preview.setPlainText(content)
+                    self.set_config_preview_text(content)
                     self.statusBar().showMessage(f'Opened configuration: {os.path.basename(filename)}')
                 
             except Exception as e:
@@ -3243,9 +4963,11 @@ class FrigateLauncher(QMainWindow):
         if self.isFullScreen():
             self.showNormal()
         
-        screen = QApplication.primaryScreen()
-        self.setGeometry(screen.availableGeometry())
-        self.statusBar().showMessage('Maximized mode - F11: Fullscreen | F5: Refresh | Ctrl+W: Windowed | Ctrl+?: Shortcuts')
+        # Skip the resize/relayout pass when the window already fills the available area
+        target = QApplication.primaryScreen().availableGeometry()
+        if self.geometry() != target:
+            self.setGeometry(target)
+        self.statusBar().showMessage(_MSG_MAXIMIZED)
     
     def toggle_statusbar(self):
         """Toggle status bar visibility"""
@@ -3254,43 +4976,46 @@ class FrigateLauncher(QMainWindow):
         else:
             self.statusBar().hide()
     
+    def open_url_in_background(self, url, error_title, error_text, hint):
+        """Open url in the default browser without blocking the GUI thread on xdg-open"""
+        def open_url():
+            try:
+                webbrowser.open(url)
+            except Exception as e:
+                self.browser_open_failed.emit(error_title, f'{error_text}:\n{str(e)}\n\n{hint}')
+        
+        QThreadPool.globalInstance().start(_RunnableFn(open_url))
+    
+    def _on_browser_open_failed(self, title, message):
+        """Report a failed background browser launch"""
+        QMessageBox.critical(self, title, message)
+    
     def open_frigate_documentation(self):
         """Open Frigate documentation in browser"""
-        import webbrowser
-        try:
-            webbrowser.open('https://docs.frigate.video/')
-            self.statusBar().showMessage('Opened Frigate documentation in browser')
-        except Exception as e:
-            QMessageBox.critical(
-                self, 'Error Opening Documentation',
-                f'Could not open documentation:\n{str(e)}\n\nPlease visit: https://docs.frigate.video/'
-            )
+        self.statusBar().showMessage('Opened Frigate documentation in browser')
+        self.open_url_in_background(
+            'https://docs.frigate.video/', 'Error Opening Documentation',
+            'Could not open documentation', 'Please visit: https://docs.frigate.video/'
+        )
     
     def open_memryx_documentation(self):
         """Open MemryX documentation in browser"""
-        import webbrowser
-        try:
-            webbrowser.open('https://developer.memryx.com/')
-            self.statusBar().showMessage('Opened MemryX documentation in browser')
-        except Exception as e:
-            QMessageBox.critical(
-                self, 'Error Opening Documentation',
-                f'Could not open documentation:\n{str(e)}\n\nPlease visit: https://developer.memryx.com/'
-            )
+        self.statusBar().showMessage('Opened MemryX documentation in browser')
+        self.open_url_in_background(
+            'https://developer.memryx.com/', 'Error Opening Documentation',
+            'Could not open documentation', 'Please visit: https://developer.memryx.com/'
+        )
     
+    @Slot()
     def open_frigate_web_ui(self):
         """Open Frigate Web UI in browser"""
-        import webbrowser
-        try:
-            # Default Frigate web UI URL (localhost:5000)
-            frigate_url = 'http://localhost:5000'
-            webbrowser.open(frigate_url)
-            self.statusBar().showMessage('Opened Frigate Web UI in browser')
-        except Exception as e:
-            QMessageBox.critical(
-                self, 'Error Opening Web UI',
-                f'Could not open Frigate Web UI:\n{str(e)}\n\nPlease ensure Frigate is running and visit: http://localhost:5000'
-            )
+        # Default Frigate web UI URL (localhost:5000)
+        frigate_url = 'http://localhost:5000'
+        self.statusBar().showMessage('Opened Frigate Web UI in browser')
+        self.open_url_in_background(
+            frigate_url, 'Error Opening Web UI', 'Could not open Frigate Web UI',
+            f'Please ensure Frigate is running and visit: {frigate_url}'
+        )
     
     def show_shortcuts(self):
         """Show keyboard shortcuts reference"""
@@ -3362,8 +5087,8 @@ class FrigateLauncher(QMainWindow):
             
             <p><b>System:</b></p>
             <ul>
-            <li>OS: {platform.system()} {platform.release()}</li>
-            <li>Architecture: {platform.machine()}</li>
+            <li>OS: {_SYS_OS}</li>
+            <li>Architecture: {_SYS_ARCH}</li>
             <li>Processor: {platform.processor() or 'Unknown'}</li>
             <li>Python Implementation: {platform.python_implementation()}</li>
             </ul>
@@ -3386,64 +5111,134 @@ class FrigateLauncher(QMainWindow):
     
     # === PreConfigured Box Tab Methods ===
     
+    @Slot()
     def update_preconfigured_status(self):
-        """Update status indicators in PreConfigured Box tab using existing check methods"""
+        """Refresh the whole PreConfigured Box tab from a single pass over the system probes"""
+        # Any refresh queued by schedule_preconfigured_status_refresh() is satisfied by this one
+        self._pending_status_refresh = False
         try:
-            # MemryX devices check (using exact same logic as overview tab)
-            try:
-                memryx_devices = self.get_memryx_devices()
-                if "No devices found" in memryx_devices or memryx_devices == "0":
-                    self.preconfigured_memryx_status.setText("❌ No Devices")
-                    self.preconfigured_memryx_status.setStyleSheet("background: #fbeaea; color: #6b3737; padding: 6px; border-radius: 4px;")
-                else:
-                    self.preconfigured_memryx_status.setText(f"✅ {memryx_devices}")
-                    self.preconfigured_memryx_status.setStyleSheet("background: #e8f4f0; color: #2d5a4a; padding: 6px; border-radius: 4px;")
-            except Exception:
-                self.preconfigured_memryx_status.setText("❓ Check Failed")
-                self.preconfigured_memryx_status.setStyleSheet("background: #fef5e7; color: #8b5a00; padding: 6px; border-radius: 4px;")
+            state = self._collect_preconfigured_state()
             
-            # Frigate setup check (check if frigate repository exists)
-            try:
-                frigate_path = os.path.join(self.script_dir, 'frigate')
-                if os.path.exists(frigate_path):
-                    # Check if it's a valid git repository with proper structure
-                    git_dir = os.path.join(frigate_path, '.git')
-                    if os.path.exists(git_dir):
-                        self.preconfigured_frigate_status.setText("✅ Setup Complete")
-                        self.preconfigured_frigate_status.setStyleSheet("background: #e8f4f0; color: #2d5a4a; padding: 6px; border-radius: 4px;")
-                    else:
-                        self.preconfigured_frigate_status.setText("⚠️ Setup Incomplete")
-                        self.preconfigured_frigate_status.setStyleSheet("background: #fef5e7; color: #8b5a00; padding: 6px; border-radius: 4px;")
-                else:
-                    self.preconfigured_frigate_status.setText("❌ Setup Required")
-                    self.preconfigured_frigate_status.setStyleSheet("background: #fbeaea; color: #6b3737; padding: 6px; border-radius: 4px;")
-            except Exception:
-                self.preconfigured_frigate_status.setText("❓ Check Failed")
+            # Restyle the status labels only when a probe result changed since the last refresh
+            if state != self._preconfigured_shown_state:
+                self._update_preconfigured_status_labels(state)
+                self._preconfigured_shown_state = state
             
-            # Update button states based on container status
-            self.update_preconfigured_button_states()
+            # Update button states based on container status (satisfies any pending debounced refresh)
+            self._preconf_dirty_timer.stop()
+            self._apply_preconfigured_button_states(state)
             
             # Update warning messages based on system status
-            self.update_preconfigured_warnings()
+            self.update_preconfigured_warnings(state)
                 
         except Exception as e:
             # Fallback if something goes wrong
             print(f"Error updating preconfigured status: {e}")
 
+    def _collect_preconfigured_state(self):
+        """Run each PreConfigured Box probe exactly once and return the results"""
+        # MemryX devices check (using exact same logic as overview tab)
+        try:
+            memryx = self.get_memryx_devices()
+        except Exception:
+            memryx = None
+        
+        # Frigate setup check (check if frigate repository exists)
+        frigate_path = os.path.join(self.script_dir, 'frigate')
+        frigate_exists = os.path.exists(frigate_path)
+        frigate_has_git = frigate_exists and os.path.exists(os.path.join(frigate_path, '.git'))
+        
+        # One container listing answers installed / exists / running together
+        docker_installed = True
+        container_exists = False
+        container_running = False
+        try:
+            containers = self._list_frigate_containers()
+            container_exists = bool(containers)
+            container_running = any(container_state == 'running' for container_state in containers.values())
+        except FileNotFoundError:
+            # Docker command not found - truly not installed
+            docker_installed = False
+        except (subprocess.TimeoutExpired, OSError):
+            # Don't flag a slow or unreachable daemon as an installation issue - could be temporary
+            pass
+        
+        return PreconfiguredState(
+            memryx=memryx,
+            frigate_exists=frigate_exists,
+            frigate_has_git=frigate_has_git,
+            docker_installed=docker_installed,
+            container_exists=container_exists,
+            container_running=container_running,
+        )
+
+    def _list_frigate_containers(self):
+        """Return {name: state} for containers matching 'frigate', running or not.
+        
+        Uses the persistent Docker socket connection and falls back to the docker
+        CLI when the socket is unavailable (raises FileNotFoundError if Docker
+        isn't installed at all).
+        """
+        try:
+            return {
+                container_name.lstrip('/'): container.get('State', '')
+                for container in self._docker_client.list_containers('frigate')
+                for container_name in container.get('Names', [])[:1]
+            }
+        except (OSError, ValueError):
+            pass
+        
+        result = subprocess.run(['docker', 'ps', '-a', '--filter', 'name=frigate', '--format', '{{.Names}} {{.State}}'],
+                                capture_output=True, text=True, timeout=5)
+        containers = {}
+        for line in result.stdout.splitlines():
+            container_name, _, container_state = line.partition(' ')
+            if 'frigate' in container_name:
+                containers[container_name] = container_state.strip()
+        return containers
+
+    def _update_preconfigured_status_labels(self, state):
+        """Update the MemryX and Frigate status labels in PreConfigured Box tab"""
+        if state.memryx is None:
+            self.preconfigured_memryx_status.setText("❓ Check Failed")
+            self.preconfigured_memryx_status.setStyleSheet(_STATUS_UNKNOWN_SMALL_QSS)
+        elif not state.memryx_ok:
+            self.preconfigured_memryx_status.setText("❌ No Devices")
+            self.preconfigured_memryx_status.setStyleSheet(_STATUS_ERROR_SMALL_QSS)
+        else:
+            self.preconfigured_memryx_status.setText(f"✅ {state.memryx}")
+            self.preconfigured_memryx_status.setStyleSheet(_STATUS_OK_SMALL_QSS)
+        
+        if state.frigate_has_git:
+            self.preconfigured_frigate_status.setText("✅ Setup Complete")
+            self.preconfigured_frigate_status.setStyleSheet(_STATUS_OK_SMALL_QSS)
+        elif state.frigate_exists:
+            self.preconfigured_frigate_status.setText("⚠️ Setup Incomplete")
+            self.preconfigured_frigate_status.setStyleSheet(_STATUS_UNKNOWN_SMALL_QSS)
+        else:
+            self.preconfigured_frigate_status.setText("❌ Setup Required")
+            self.preconfigured_frigate_status.setStyleSheet(_STATUS_ERROR_SMALL_QSS)
+
+    @Slot()
     def update_preconfigured_button_states(self):
+        """Request a start/stop button state refresh; requests within 100 ms share one probe"""
+        if not self._preconf_dirty_timer.isActive():
+            self._preconf_dirty_timer.start()
+
+    def _refresh_preconfigured_button_states(self):
+        """Take a fresh snapshot and apply it to the PreConfigured buttons"""
+        try:
+            state = self._collect_preconfigured_state()
+        except Exception as e:
+            print(f"Error updating button states: {e}")
+            return
+        self._apply_preconfigured_button_states(state)
+
+    def _apply_preconfigured_button_states(self, state):
         """Update start/stop button states based on container status"""
         try:
-            # Check if container exists and is running
-            container_exists = self._check_container_exists_sync()
-            container_running = False
-            
-            if container_exists:
-                try:
-                    result = subprocess.run(['docker', 'ps', '--filter', 'name=frigate', '--format', '{{.Names}}'],
-                                          capture_output=True, text=True, timeout=5)
-                    container_running = 'frigate' in result.stdout
-                except:
-                    container_running = False
+            container_exists = state.container_exists
+            container_running = state.container_running
             
             # Track container status changes to show Web UI guidance
             if not hasattr(self, '_previous_container_running'):
@@ -3458,9 +5253,9 @@ class FrigateLauncher(QMainWindow):
             self._previous_container_running = container_running
             
             # Update button states using enhanced state management
-            if hasattr(self, 'preconfigured_start_btn') and hasattr(self, 'preconfigured_stop_btn'):
+            if self.preconfigured_start_btn is not None and self.preconfigured_stop_btn is not None:
                 # Skip if currently in an operation state (building, starting, stopping)
-                if hasattr(self, 'button_operation_state') and self.button_operation_state in ["building", "starting", "starting_container", "stopping"]:
+                if self.button_operation_state in ["building", "starting", "starting_container", "stopping"]:
                     return
                     
                 if container_running:
@@ -3480,127 +5275,129 @@ class FrigateLauncher(QMainWindow):
                     self.preconfigured_stop_btn.setToolTip("No container to stop")
             
             # Update Web UI button state - only enabled when container is running
-            if hasattr(self, 'preconfigured_open_ui_btn'):
+            if self.preconfigured_open_ui_btn is not None:
                 if container_running:
                     self.preconfigured_open_ui_btn.setEnabled(True)
                     self.preconfigured_open_ui_btn.setToolTip("Open Frigate Web UI (Frigate is running)")
-                    # Reset any highlighting style that might have been applied
-                    if hasattr(self, '_web_ui_btn_original_style'):
-                        self.preconfigured_open_ui_btn.setStyleSheet(self._web_ui_btn_original_style)
                 else:
                     self.preconfigured_open_ui_btn.setEnabled(False)
                     self.preconfigured_open_ui_btn.setToolTip("Start Frigate first to access Web UI")
-                    # Reset any highlighting style when disabled
-                    if hasattr(self, '_web_ui_btn_original_style'):
-                        self.preconfigured_open_ui_btn.setStyleSheet(self._web_ui_btn_original_style)
+                    # Drop any highlight when disabled
+                    self._clear_button_highlight(self.preconfigured_open_ui_btn)
             
             # Show/hide troubleshooting section based on container status
-            if hasattr(self, 'troubleshooting_group'):
+            if self.troubleshooting_group is not None:
                 # Show troubleshooting ONLY when Frigate container is running
                 # (same condition as when Web UI button is enabled)
                 self.troubleshooting_group.setVisible(container_running)
                     
         except Exception as e:
             # On error, show idle state and enable start button
-            if hasattr(self, 'preconfigured_start_btn') and hasattr(self, 'preconfigured_stop_btn'):
+            if self.preconfigured_start_btn is not None and self.preconfigured_stop_btn is not None:
                 self.update_preconfigured_button_state("idle")
-            if hasattr(self, 'preconfigured_open_ui_btn'):
+            if self.preconfigured_open_ui_btn is not None:
                 self.preconfigured_open_ui_btn.setEnabled(False)
                 self.preconfigured_open_ui_btn.setToolTip("Unable to check Frigate status")
             # Hide troubleshooting section on error
-            if hasattr(self, 'troubleshooting_group'):
+            if self.troubleshooting_group is not None:
                 self.troubleshooting_group.setVisible(False)
             print(f"Error updating button states: {e}")
     
-    def update_preconfigured_warnings(self):
+    def update_preconfigured_warnings(self, state):
         """Show/hide warning messages based on system status"""
         try:
-            docker_issue = False
-            memryx_issue = False
-            frigate_issue = False
-            
-            # Check Docker status - only flag true installation issues
-            try:
-                docker_status = self._check_docker_status()
-                # Only show warning for actual installation issues, not temporary problems
-                if "Not Installed" in docker_status['text']:
-                    docker_issue = True
-                # Don't flag "Not Available" or "Timeout" as installation issues - could be temporary
-            except Exception:
-                # Exception during check could mean Docker is not installed
+            # Only flag true installation issues, not temporary problems
+            docker_issue = not state.docker_installed
+            memryx_issue = not state.memryx_ok
+            frigate_issue = not state.frigate_has_git
+            
+            needs_setup = docker_issue or memryx_issue or frigate_issue
+            
+            # Show/hide warning messages, touching only the widgets whose visibility changes
+            visibility = (
+                (self.docker_warning, docker_issue),
+                (self.memryx_warning, memryx_issue),
+                (self.frigate_warning, frigate_issue),
+                (self.manual_setup_btn, needs_setup),
+                (self.warning_group, needs_setup),
+            )
+            changed = [(widget, visible) for widget, visible in visibility
+                       if widget is not None and widget.isHidden() == visible]
+            if changed:
+                # Hold painting of the panel so the toggles relayout and repaint once
+                panel = self.warning_group.parentWidget() if self.warning_group is not None else None
+                if panel is not None:
+                    panel.setUpdatesEnabled(False)
                 try:
-                    # Double-check with simpler command
-                    import subprocess
-                    subprocess.run(['docker', '--version'], capture_output=True, text=True, timeout=5, check=True)
-                    # If docker --version works, it's installed but maybe service issue
-                    docker_issue = False
-                except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-                    # Docker command not found - truly not installed
-                    docker_issue = True
-            
-            # Check MemryX status
-            try:
-                memryx_devices = self.get_memryx_devices()
-                if "No devices found" in memryx_devices or memryx_devices == "0":
-                    memryx_issue = True
-            except Exception:
-                memryx_issue = True
+                    for widget, visible in changed:
+                        widget.setVisible(visible)
+                finally:
+                    if panel is not None:
+                        panel.setUpdatesEnabled(True)
             
-            # Check Frigate status
-            try:
-                frigate_path = os.path.join(self.script_dir, 'frigate')
-                if not os.path.exists(frigate_path):
-                    frigate_issue = True
-                else:
-                    git_dir = os.path.join(frigate_path, '.git')
-                    if not os.path.exists(git_dir):
-                        frigate_issue = True
-            except Exception:
-                frigate_issue = True
-            
-            # Show/hide warning messages
-            if hasattr(self, 'docker_warning'):
-                self.docker_warning.setVisible(docker_issue)
-            if hasattr(self, 'memryx_warning'):
-                self.memryx_warning.setVisible(memryx_issue)
-            if hasattr(self, 'frigate_warning'):
-                self.frigate_warning.setVisible(frigate_issue)
-            if hasattr(self, 'manual_setup_btn'):
-                self.manual_setup_btn.setVisible(docker_issue or memryx_issue or frigate_issue)
-            if hasattr(self, 'warning_group'):
-                self.warning_group.setVisible(docker_issue or memryx_issue or frigate_issue)
-                
+            if self.warning_group is not None:
                 # Disable start button if system setup is required
-                if hasattr(self, 'preconfigured_start_btn'):
-                    if docker_issue or memryx_issue or frigate_issue:
+                if self.preconfigured_start_btn is not None:
+                    if needs_setup:
                         self.preconfigured_start_btn.setEnabled(False)
                         self.preconfigured_start_btn.setToolTip("System setup required before starting Frigate")
                     else:
                         # Only enable if no warnings and not in a disabled state
-                        if hasattr(self, 'button_operation_state') and self.button_operation_state not in ['building', 'starting', 'starting_container', 'stopping']:
+                        if self.button_operation_state not in ['building', 'starting', 'starting_container', 'stopping']:
                             self.preconfigured_start_btn.setEnabled(True)
                             self.preconfigured_start_btn.setToolTip("Start Frigate container")
                 
-        except Exception as e:
-            print(f"Error updating warnings: {e}")
+        except Exception:
+            logger.debug("Error updating warnings", exc_info=True)
     
     def on_main_tab_changed(self, index):
         """Handle main tab changes to optimize refresh timer"""
         try:
-            if hasattr(self, 'preconfigured_refresh_timer'):
-                if index == 0:  # PreConfigured Box tab
-                    # Start/resume the refresh timer when on PreConfigured tab
-                    if not self.preconfigured_refresh_timer.isActive():
-                        self.preconfigured_refresh_timer.start()
-                    # Also trigger an immediate refresh when switching to the tab
-                    QTimer.singleShot(100, self.update_preconfigured_status)
-                else:
-                    # Stop the refresh timer when not on PreConfigured tab to save resources
-                    if self.preconfigured_refresh_timer.isActive():
-                        self.preconfigured_refresh_timer.stop()
-        except Exception as e:
-            print(f"Error handling tab change: {e}")
+            if index == 0 and self._docker_events_worker is not None:
+                # Container events are ignored while another tab is shown, so catch up on the way back
+                self.schedule_preconfigured_status_refresh()
+        except RuntimeError:
+            # Widgets/timers already deleted during shutdown
+            logger.debug("Error handling tab change", exc_info=True)
+    
+    def schedule_preconfigured_status_refresh(self):
+        """Queue one PreConfigured status refresh, coalescing repeated requests"""
+        if self._pending_status_refresh:
+            return
+        self._pending_status_refresh = True
+        QTimer.singleShot(100, self._do_status_refresh)
+    
+    def _do_status_refresh(self):
+        """Run a queued status refresh unless another refresh already handled it"""
+        if self._pending_status_refresh:
+            self.update_preconfigured_status()
+    
+    @Slot(str)
+    def _on_frigate_container_changed(self, status):
+        """Refresh the PreConfigured Box tab after a Frigate container event, if it is on screen"""
+        if status and status not in _DOCKER_LIFECYCLE_EVENTS:
+            return  # Not a state change (the watcher filters these out; this guards the slot too)
+        if self._preconfigured_refresh_paused or self.main_tab_widget.currentIndex() != 0:
+            return
+        # A single action fires several events (kill, die, stop, destroy); they share one refresh
+        self.schedule_preconfigured_status_refresh()
     
+    def pause_preconfigured_refresh(self):
+        """Ignore container events while the window is minimized or hidden"""
+        self._preconfigured_refresh_paused = True
+    
+    def resume_preconfigured_refresh(self):
+        """Refresh the PreConfigured Box tab once the window is visible again"""
+        if not self._preconfigured_refresh_paused or self._docker_events_worker is None:
+            return
+        if self.isMinimized() or not self.isVisible():
+            return
+        self._preconfigured_refresh_paused = False
+        if self.main_tab_widget.currentIndex() == 0:
+            # Catch up on anything that changed while events were ignored
+            self.schedule_preconfigured_status_refresh()
+    
+    @Slot()
     def open_simple_camera_gui(self):
         """Open the simple camera GUI"""
         # Check if application is still initializing
@@ -3610,7 +5407,8 @@ class FrigateLauncher(QMainWindow):
                 "The application is still initializing. Please wait for the initialization to complete."
             )
             return
-            
+        
+        SimpleCameraGUI = _load_simple_camera_gui()
         if SimpleCameraGUI is None:
             self.show_message_box(
                 QMessageBox.Critical, 'Simple Camera GUI Unavailable',
@@ -3625,22 +5423,8 @@ class FrigateLauncher(QMainWindow):
             # Pass reference to this launcher so camera GUI can suppress popups
             self.camera_gui.launcher_parent = self
             
-            # Wrap the save_config method to detect successful saves
-            original_save_config = self.camera_gui.save_config
-            
-            def enhanced_save_config():
-                try:
-                    # Call the original save_config method
-                    original_save_config()
-                    # If we get here, save was successful (no exception thrown)
-                    # Trigger our guidance dialog
-                    self.on_camera_config_saved()
-                except Exception as e:
-                    # If save failed, re-raise the exception to maintain original behavior
-                    raise e
-            
-            # Replace the save_config method with our enhanced version
-            self.camera_gui.save_config = enhanced_save_config
+            # Show the start guidance once the camera configuration is saved
+            self.camera_gui.config_saved.connect(self.on_camera_config_saved)
             
             # Show with overlay
             self.show_external_gui(self.camera_gui)
@@ -3663,6 +5447,15 @@ class FrigateLauncher(QMainWindow):
 
     def show_start_frigate_guidance(self):
         """Show guidance dialog to start Frigate after camera configuration"""
+        # The dialog is built once and reused on later saves
+        if self._start_guidance_dialog is None:
+            self._start_guidance_dialog = self._create_start_frigate_guidance_dialog()
+        
+        # Show guidance dialog with modal overlay
+        self.show_dialog(self._start_guidance_dialog)
+
+    def _create_start_frigate_guidance_dialog(self):
+        """Build the "Cameras Configured!" guidance dialog"""
         guidance_dialog = QDialog(self)
         guidance_dialog.setWindowTitle("Cameras Configured!")
         guidance_dialog.setFixedSize(500, 350)
@@ -3674,26 +5467,7 @@ class FrigateLauncher(QMainWindow):
         layout.setContentsMargins(30, 30, 30, 30)
         
         # Icon and title
-        title_layout = QHBoxLayout()
-        
-        # Icon label
-        icon_label = QLabel("🎉")
-        icon_label.setStyleSheet("font-size: 32px;")
-        title_layout.addWidget(icon_label)
-        
-        # Title
-        title_label = QLabel("Great! Cameras Configured!")
-        title_label.setStyleSheet("""
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 18px;
-            font-weight: 700;
-            color: #0694a2;
-            margin-left: 10px;
-        """)
-        title_layout.addWidget(title_label)
-        title_layout.addStretch()
-        
-        layout.addLayout(title_layout)
+        layout.addLayout(_build_header("🎉", "Great! Cameras Configured!"))
         
         # Guidance text
         guidance_text = QLabel(
@@ -3702,16 +5476,7 @@ class FrigateLauncher(QMainWindow):
             "🚀 <b>Click the \"Start Frigate\" button</b> to begin monitoring your cameras!<br><br>"
         )
         guidance_text.setTextFormat(Qt.RichText)
-        guidance_text.setStyleSheet("""
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 14px;
-            color: #2d3748;
-            line-height: 1.5;
-            padding: 15px;
-            background: #f0fff4;
-            border-radius: 8px;
-            border-left: 4px solid #0694a2;
-        """)
+        guidance_text.setStyleSheet(_GUIDANCE_TEXT_QSS)
         guidance_text.setWordWrap(True)
         layout.addWidget(guidance_text)
         
@@ -3720,42 +5485,12 @@ class FrigateLauncher(QMainWindow):
         
         # Highlight button
         highlight_btn = QPushButton("🔥 Show Me Start Frigate")
-        highlight_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #0694a2, stop: 1 #0f766e);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #0891b2, stop: 1 #164e63);
-            }
-        """)
+        highlight_btn.setStyleSheet(_GUIDANCE_HIGHLIGHT_BTN_QSS)
         highlight_btn.clicked.connect(lambda: self.highlight_start_frigate_button(guidance_dialog))
         
         # Got it button
         got_it_btn = QPushButton("Let's Go!")
-        got_it_btn.setStyleSheet("""
-            QPushButton {
-                background: #e2e8f0;
-                color: #2d3748;
-                border: 1px solid #cbd5e0;
-                border-radius: 6px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background: #cbd5e0;
-            }
-        """)
+        got_it_btn.setStyleSheet(_GUIDANCE_GOT_IT_BTN_QSS)
         got_it_btn.clicked.connect(guidance_dialog.accept)
         
         button_layout.addWidget(highlight_btn)
@@ -3764,50 +5499,66 @@ class FrigateLauncher(QMainWindow):
         
         layout.addLayout(button_layout)
         
-        # Show guidance dialog with modal overlay
-        self.show_dialog(guidance_dialog)
+        return guidance_dialog
 
     def highlight_start_frigate_button(self, guidance_dialog):
         """Highlight the Start Frigate button"""
         guidance_dialog.accept()  # Close guidance dialog
         
         # Find the Start Frigate button and highlight it
-        if hasattr(self, 'preconfigured_start_btn'):
-            # Store original stylesheet
-            original_style = self.preconfigured_start_btn.styleSheet()
-            
-            # Apply highlight style
-            highlight_style = """
-                QPushButton {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                        stop: 0 #c084fc, stop: 1 #a855f7);
-                    color: white;
-                    border: 3px solid #c084fc;
-                    border-radius: 8px;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    font-size: 16px;
-                    font-weight: 700;
-                    text-align: center;
-                    padding: 8px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                        stop: 0 #ddd6fe, stop: 1 #8b5cf6);
-                }
-            """
-            
-            self.preconfigured_start_btn.setStyleSheet(highlight_style)
-            
-            # Reset to original style after 5 seconds
-            QTimer.singleShot(5000, lambda: self.preconfigured_start_btn.setStyleSheet(original_style))
+        if self.preconfigured_start_btn is not None:
+            self._pulse_button_highlight(self.preconfigured_start_btn)
+    
+    def _pulse_button_highlight(self, button, hold_ms=5000):
+        """Tint a button purple for a few seconds without touching its stylesheet"""
+        # Nothing to show on a hidden button, and a running highlight already covers a repeat request
+        if button in self._button_highlights or not button.isVisible():
+            return
+        
+        effect = QGraphicsColorizeEffect(button)
+        effect.setColor(QColor("#a855f7"))
+        effect.setStrength(0.0)
+        button.setGraphicsEffect(effect)
+        
+        # Fade in, hold, fade back out
+        highlight = QSequentialAnimationGroup(button)
+        for start, end in ((0.0, 1.0), (1.0, 0.0)):
+            fade = QPropertyAnimation(effect, b"strength")
+            fade.setDuration(300)
+            fade.setStartValue(start)
+            fade.setEndValue(end)
+            highlight.addAnimation(fade)
+            if end:
+                highlight.addPause(hold_ms)
+        highlight.finished.connect(lambda: self._clear_button_highlight(button))
+        
+        self._button_highlights[button] = highlight
+        highlight.start()
+    
+    def _clear_button_highlight(self, button):
+        """Stop a running highlight and remove its effect from the button"""
+        highlight = self._button_highlights.pop(button, None)
+        if highlight is None:
+            return
+        highlight.stop()
+        highlight.deleteLater()
+        button.setGraphicsEffect(None)  # Deletes the colorize effect
 
     def show_web_ui_guidance(self):
         """Show guidance dialog to open Frigate Web UI after Frigate starts"""
         # Check if we should show this guidance (not shown before)
-        web_ui_guidance_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.web_ui_guidance_shown')
-        if os.path.exists(web_ui_guidance_file):
+        if self._web_ui_guidance_shown:
             return  # Don't show again
         
+        # The dialog is built once and reused if it's requested again before "Got It!"
+        if self._web_ui_guidance_dialog is None:
+            self._web_ui_guidance_dialog = self._create_web_ui_guidance_dialog()
+        
+        # Show guidance dialog with modal overlay
+        self.show_dialog(self._web_ui_guidance_dialog)
+
+    def _create_web_ui_guidance_dialog(self):
+        """Build the "Frigate is Now Running!" guidance dialog"""
         guidance_dialog = QDialog(self)
         guidance_dialog.setWindowTitle("Frigate is Now Running!")
         guidance_dialog.setFixedSize(520, 350)
@@ -3819,26 +5570,7 @@ class FrigateLauncher(QMainWindow):
         layout.setContentsMargins(30, 30, 30, 30)
         
         # Icon and title
-        title_layout = QHBoxLayout()
-        
-        # Icon label
-        icon_label = QLabel("🎉")
-        icon_label.setStyleSheet("font-size: 32px;")
-        title_layout.addWidget(icon_label)
-        
-        # Title
-        title_label = QLabel("Frigate is Now Running!")
-        title_label.setStyleSheet("""
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 18px;
-            font-weight: 700;
-            color: #0694a2;
-            margin-left: 10px;
-        """)
-        title_layout.addWidget(title_label)
-        title_layout.addStretch()
-        
-        layout.addLayout(title_layout)
+        layout.addLayout(_build_header("🎉", "Frigate is Now Running!"))
         
         # Guidance text
         guidance_text = QLabel(
@@ -3846,16 +5578,7 @@ class FrigateLauncher(QMainWindow):
             "🌐 Click the <b>\"Open Frigate Web UI\" button</b> to view your camera feeds and manage settings.<br><br>"
         )
         guidance_text.setTextFormat(Qt.RichText)
-        guidance_text.setStyleSheet("""
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 14px;
-            color: #2d3748;
-            line-height: 1.5;
-            padding: 15px;
-            background: #f0fff4;
-            border-radius: 8px;
-            border-left: 4px solid #0694a2;
-        """)
+        guidance_text.setStyleSheet(_GUIDANCE_TEXT_QSS)
         guidance_text.setWordWrap(True)
         layout.addWidget(guidance_text)
         
@@ -3864,43 +5587,13 @@ class FrigateLauncher(QMainWindow):
         
         # Highlight button
         highlight_btn = QPushButton("🔍 Show Me Web UI Button")
-        highlight_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #0694a2, stop: 1 #0f766e);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #0891b2, stop: 1 #164e63);
-            }
-        """)
+        highlight_btn.setStyleSheet(_GUIDANCE_HIGHLIGHT_BTN_QSS)
         highlight_btn.clicked.connect(lambda: self.highlight_web_ui_button(guidance_dialog))
         
         # Got it button
         got_it_btn = QPushButton("Got It!")
-        got_it_btn.setStyleSheet("""
-            QPushButton {
-                background: #e2e8f0;
-                color: #2d3748;
-                border: 1px solid #cbd5e0;
-                border-radius: 6px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background: #cbd5e0;
-            }
-        """)
-        got_it_btn.clicked.connect(lambda: self.close_web_ui_guidance(guidance_dialog, web_ui_guidance_file))
+        got_it_btn.setStyleSheet(_GUIDANCE_GOT_IT_BTN_QSS)
+        got_it_btn.clicked.connect(lambda: self.close_web_ui_guidance(guidance_dialog))
         
         button_layout.addWidget(highlight_btn)
         button_layout.addStretch()
@@ -3908,69 +5601,70 @@ class FrigateLauncher(QMainWindow):
         
         layout.addLayout(button_layout)
         
-        # Show guidance dialog with modal overlay
-        self.show_dialog(guidance_dialog)
+        return guidance_dialog
 
     def highlight_web_ui_button(self, guidance_dialog):
         """Highlight the Open Frigate Web UI button"""
         guidance_dialog.accept()  # Close guidance dialog
         
         # Find the Web UI button and highlight it
-        if hasattr(self, 'preconfigured_open_ui_btn'):
-            # Store original stylesheet for proper restoration
-            self._web_ui_btn_original_style = self.preconfigured_open_ui_btn.styleSheet()
-            
-            # Apply highlight style
-            highlight_style = """
-                QPushButton {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                        stop: 0 #c084fc, stop: 1 #a855f7);
-                    color: white;
-                    border: 3px solid #c084fc;
-                    border-radius: 8px;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    font-size: 16px;
-                    font-weight: 700;
-                    text-align: center;
-                    padding: 8px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                        stop: 0 #ddd6fe, stop: 1 #8b5cf6);
-                }
-                QPushButton:disabled {
-                    background: #e2e8f0;
-                    color: #a0aec0;
-                    border: 1px solid #cbd5e0;
-                }
-            """
-            
-            self.preconfigured_open_ui_btn.setStyleSheet(highlight_style)
-            
-            # Reset to original style after 5 seconds
-            QTimer.singleShot(5000, lambda: self.preconfigured_open_ui_btn.setStyleSheet(self._web_ui_btn_original_style))
+        if self.preconfigured_open_ui_btn is not None:
+            self._pulse_button_highlight(self.preconfigured_open_ui_btn)
 
-    def close_web_ui_guidance(self, dialog, guidance_file):
+    def close_web_ui_guidance(self, dialog):
         """Close the Web UI guidance and mark as shown"""
         dialog.accept()
-        # Create file to mark that guidance has been shown
-        try:
-            with open(guidance_file, 'w') as f:
-                f.write("shown")
-        except:
-            pass  # Ignore errors creating the tracking file
+        self._web_ui_guidance_shown = True
+        
+        # Create file to mark that guidance has been shown, off the GUI thread
+        QThreadPool.globalInstance().start(
+            _RunnableFn(functools.partial(_safe_write, self._web_ui_guidance_file, "shown")))
+
+    def preload_setup_guide_images(self):
+        """Decode and scale the camera setup guide screenshots on a pool thread, once"""
+        if self._pixmap_preload_started:
+            return
+        self._pixmap_preload_started = True
+        
+        image_paths = [
+            os.path.join(self._cam_assets_dir, step["image"])
+            for step in _CAMERA_SETUP_STEPS + _FRIGATE_SETUP_STEPS
+            if step["image"]
+        ]
+        
+        def load_images():
+            # QImage is safe to use off the GUI thread; QPixmap conversion happens in the slot
+            for image_path in image_paths:
+                image = _load_setup_guide_image(image_path)
+                if image is not None:
+                    self.setup_image_loaded.emit(image_path, image)
+        
+        QThreadPool.globalInstance().start(_RunnableFn(load_images))
+    
+    def _on_setup_image_loaded(self, image_path, image):
+        """Store a background-decoded setup guide screenshot in the pixmap cache"""
+        if self._setup_pixmap_cache.get(image_path) is None:
+            self._setup_pixmap_cache[image_path] = QPixmap.fromImage(image)
+    
+    def _get_setup_guide_pixmap(self, image_path):
+        """Return the scaled screenshot for a setup guide step, loading it only once"""
+        if image_path in self._setup_pixmap_cache:
+            return self._setup_pixmap_cache[image_path]
+        
+        image = _load_setup_guide_image(image_path)
+        scaled_pixmap = QPixmap.fromImage(image) if image is not None else None
+        
+        # Missing/unreadable images are cached as None so they aren't retried on every open
+        self._setup_pixmap_cache[image_path] = scaled_pixmap
+        return scaled_pixmap
 
+    @Slot()
     def show_camera_setup_guide(self):
         """Display the camera setup guide in a professional dialog with modern styling"""
         dialog = QDialog(self)
         dialog.setWindowTitle("Amcrest Camera Setup Guide")
         dialog.resize(1100, 800)  # Slightly smaller for better fit
-        dialog.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #f8fafc, stop: 1 #e2e8f0);
-            }
-        """)
+        dialog.setStyleSheet(_SETUP_GUIDE_QSS)  # One sheet for the whole guide
         
         # Create main layout
         main_layout = QVBoxLayout(dialog)
@@ -3980,48 +5674,22 @@ class FrigateLauncher(QMainWindow):
         # Modern header with gradient and shadow
         header_frame = QFrame()
         header_frame.setFixedHeight(85)  # Smaller header
-        header_frame.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 #0694a2, stop: 1 #0f766e);
-                border: none;
-                border-bottom: 2px solid rgba(0,0,0,0.15);
-            }
-        """)
+        header_frame.setObjectName("guideHeader")
         
         header_layout = QHBoxLayout(header_frame)
         header_layout.setContentsMargins(25, 15, 25, 15)
         
         # Header icon and title
         icon_label = QLabel("📹")
-        icon_label.setStyleSheet("""
-            font-size: 28px;
-            color: white;
-            background: rgba(255,255,255,0.15);
-            border-radius: 20px;
-            padding: 6px;
-            margin-right: 12px;
-        """)
+        icon_label.setObjectName("guideHeaderIcon")
         icon_label.setFixedSize(40, 40)
         icon_label.setAlignment(Qt.AlignCenter)
         
         title_label = QLabel("Amcrest Camera Setup Guide")
-        title_label.setStyleSheet("""
-            font-family: 'Segoe UI', 'SF Pro Display', Arial, sans-serif;
-            font-size: 24px;
-            font-weight: 700;
-            color: white;
-            background: none;
-        """)
+        title_label.setObjectName("guideHeaderTitle")
         
         subtitle_label = QLabel("Complete step-by-step setup instructions for Amcrest IP cameras")
-        subtitle_label.setStyleSheet("""
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 14px;
-            color: rgba(255,255,255,0.9);
-            background: none;
-            margin-top: 3px;
-        """)
+        subtitle_label.setObjectName("guideHeaderSubtitle")
         
         title_container = QVBoxLayout()
         title_container.addWidget(title_label)
@@ -4038,26 +5706,7 @@ class FrigateLauncher(QMainWindow):
         # Content area with modern card-style design
         content_scroll = QScrollArea()
         content_scroll.setWidgetResizable(True)
-        content_scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: #e2e8f0;
-                width: 12px;
-                border-radius: 6px;
-                margin: 2px;
-            }
-            QScrollBar::handle:vertical {
-                background: #cbd5e0;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #a0aec0;
-            }
-        """)
+        content_scroll.setObjectName("guideScroll")
         
         content_widget = QWidget()
         content_layout = QVBoxLayout(content_widget)
@@ -4066,28 +5715,13 @@ class FrigateLauncher(QMainWindow):
         
         # Add introduction section for Amcrest cameras
         intro_frame = QFrame()
-        intro_frame.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #e6f7ff, stop: 1 #bae7ff);
-                border: 2px solid #1890ff;
-                border-radius: 12px;
-                padding: 20px;
-                margin-bottom: 10px;
-            }
-        """)
+        intro_frame.setObjectName("guideIntro")
         
         intro_layout = QVBoxLayout(intro_frame)
         intro_layout.setSpacing(10)
         
         intro_title = QLabel("📹 Amcrest Camera Setup Guide")
-        intro_title.setStyleSheet("""
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 20px;
-            font-weight: 700;
-            color: #003a8c;
-            margin-bottom: 8px;
-        """)
+        intro_title.setObjectName("guideIntroTitle")
         
         intro_text = QLabel(
             "This guide is specifically designed for <b>Amcrest IP cameras</b> included with your MemryX box.\n\n"
@@ -4097,453 +5731,57 @@ class FrigateLauncher(QMainWindow):
         )
         intro_text.setWordWrap(True)
         intro_text.setOpenExternalLinks(True)
-        intro_text.setStyleSheet("""
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 14px;
-            color: #003a8c;
-            line-height: 1.5;
-        """)
+        intro_text.setObjectName("guideIntroText")
         
         intro_layout.addWidget(intro_title)
         intro_layout.addWidget(intro_text)
         content_layout.addWidget(intro_frame)
         
-        # Get cam_assets directory
-        cam_assets_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cam_assets")
-        
-        # Step data with modern styling
-        steps = [
-            {
-                "title": "STEP 1: Power On Camera",
-                "description": "Connect the power adapter to your camera's power port and wait 30 seconds for initialization.",
-                "points": [
-                    "Look for the green LED light on the camera's back",
-                    "Camera may rotate during startup (normal behavior)",
-                    "Green LED solid = ready for setup"
-                ],
-                "image": None
-            },
-            {
-                "title": "STEP 2: Install Mobile App",
-                "description": "Download 'Amcrest View Pro' from your device's app store.",
-                "points": [
-                    "iOS: App Store | Android: Google Play Store",
-                    "Search for 'Amcrest View Pro'",
-                    "Install and open the app"
-                ],
-                "image": "setup_1.png"
-            },
-            {
-                "title": "STEP 3: App Initial Setup",
-                "description": "Launch the app and follow the welcome screens.",
-                "points": [
-                    "Allow required permissions (camera, location)",
-                    "Tap 'Start' to begin setup"
-                ],
-                "image": "setup_2.jpg"
-            },
-            {
-                "title": "STEP 4: Select WiFi Camera",
-                "description": "Choose WiFi Camera setup option.",
-                "points": [
-                    "Select 'WiFi Camera' from menu"
-                ],
-                "image": "setup_3.jpg"
-            },
-            {
-                "title": "STEP 4.1: WiFi Configuration Setup",
-                "description": "Select WiFi configuration setup option.",
-                "points": [
-                    "Choose WiFi configuration setup",
-                    "<b>Important: Your phone must be connected to the WiFi network you want the camera to use</b>"
-                ],
-                "image": "setup_4.jpg"
-            },
-            {
-                "title": "STEP 5: Scan Camera QR Code",
-                "description": "Find and scan the QR code on your camera's back.",
-                "points": [
-                    "Allow camera access for QR scanning",
-                    "Locate QR code on camera's back and scan it"
-                ],
-                "image": "setup_5.jpg"
-            },
-            {
-                "title": "STEP 6: Configure Camera Settings",
-                "description": "Set up camera name and credentials.",
-                "points": [
-                    "Enter a descriptive camera name (e.g., 'Front Door', 'Garage')",
-                    "Default username/password: admin/admin"
-                ],
-                "image": "setup_7.jpg"
-            },
-            {
-                "title": "STEP 6.1: Enter WiFi Password",
-                "description": "Enter your WiFi network password.",
-                "points": [
-                    "Enter your WiFi network password carefully",
-                    "Ensure password is correct",
-                    "Double-check for typos"
-                ],
-                "image": "setup_8.jpg"
-            },
-            {
-                "title": "STEP 7: Network Connection",
-                "description": "Connect camera to your network.",
-                "points": [
-                    "Allow app to find local network devices",
-                    "Wait for WiFi connection process (30-60 seconds)"
-                ],
-                "image": "setup_9.jpg"
-            },
-            {
-                "title": "STEP 7.1: Connection Success",
-                "description": "Camera setup completed successfully.",
-                "points": [
-                    "Connection successful! Camera is now online",
-                    "Click on 'Start Live View' to proceed",
-                    "Camera is ready for use"
-                ],
-                "image": "setup_11.jpg"
-            },
-            {
-                "title": "STEP 8: Set Security Password",
-                "description": "Create a secure password for camera access.",
-                "points": [
-                    "Tap 'Start Live View'",
-                    "Create strong password (8-32 characters)",
-                    "Use mix of letters and numbers"
-                ],
-                "image": "setup_12.jpg"
-            }
-        ]
-        
-        # Create step cards
-        for i, step in enumerate(steps):
-            step_frame = QFrame()
-            step_frame.setStyleSheet("""
-                QFrame {
-                    background: white;
-                    border: 1px solid #e2e8f0;
-                    border-radius: 10px;
-                    padding: 0;
-                    margin: 3px 0;
-                }
-                QFrame:hover {
-                    border: 1px solid #0694a2;
-                    background: #f8faff;
-                }
-            """)
-            
-            step_layout = QHBoxLayout(step_frame)
-            step_layout.setContentsMargins(18, 12, 18, 12)
-            step_layout.setSpacing(16)
-            
-            # Left content area
-            left_content = QVBoxLayout()
-            left_content.setSpacing(8)
-            
-            # Step header
-            step_header = QLabel(step["title"])
-            step_header.setStyleSheet("""
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 18px;
-                font-weight: 700;
-                color: #1a365d;
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #0694a2, stop: 1 #0f766e);
-                color: white;
-                padding: 10px 18px;
-                border-radius: 6px;
-                margin-bottom: 5px;
-            """)
-            
-            # Description
-            desc_label = QLabel(step["description"])
-            desc_label.setStyleSheet("""
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 16px;
-                font-weight: 600;
-                color: #2d3748;
-                margin-bottom: 8px;
-            """)
-            desc_label.setWordWrap(True)
-            
-            # Points list
-            points_widget = QWidget()
-            points_layout = QVBoxLayout(points_widget)
-            points_layout.setContentsMargins(0, 0, 0, 0)
-            points_layout.setSpacing(3)
-            
-            for point in step["points"]:
-                point_label = QLabel(f"<span style='color: #0694a2; font-weight: bold;'>•</span> {point}")
-                point_label.setStyleSheet("""
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    font-size: 15px;
-                    color: #4a5568;
-                    padding: 3px 0;
-                """)
-                point_label.setWordWrap(True)
-                points_layout.addWidget(point_label)
-            
-            left_content.addWidget(step_header)
-            left_content.addWidget(desc_label)
-            left_content.addWidget(points_widget)
-            left_content.addStretch()
-            
-            step_layout.addLayout(left_content, 2)
-            
-            # Right image area
-            if step["image"]:
-                image_label = QLabel()
-                image_path = os.path.join(cam_assets_dir, step["image"])
-                
-                if os.path.exists(image_path):
-                    pixmap = QPixmap(image_path)
-                    if not pixmap.isNull():
-                        # Scale image to fit nicely
-                        scaled_pixmap = pixmap.scaled(250, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        image_label.setPixmap(scaled_pixmap)
-                        image_label.setStyleSheet("""
-                            border: 2px solid #e2e8f0;
-                            border-radius: 8px;
-                            padding: 5px;
-                            background: #f7fafc;
-                        """)
-                        image_label.setAlignment(Qt.AlignCenter)
-                        step_layout.addWidget(image_label, 1)
-                
-            content_layout.addWidget(step_frame)
+        # Step cards are built as they scroll into view (see below); these hold their places
+        hardware_steps_widget = QWidget()
+        hardware_steps_layout = QVBoxLayout(hardware_steps_widget)
+        hardware_steps_layout.setContentsMargins(0, 0, 0, 0)
+        hardware_steps_layout.setSpacing(content_layout.spacing())
+        content_layout.addWidget(hardware_steps_widget)
         
         # Completion section
         completion_frame = QFrame()
-        completion_frame.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #0694a2, stop: 1 #0f766e);
-                border: none;
-                border-radius: 10px;
-                padding: 15px;
-                margin: 8px 0;
-            }
-        """)
+        completion_frame.setObjectName("guideCompletion")
         
         completion_layout = QVBoxLayout(completion_frame)
         completion_layout.setSpacing(8)
         
         completion_title = QLabel("🎉 SETUP COMPLETE!")
-        completion_title.setStyleSheet("""
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 18px;
-            font-weight: 700;
-            color: white;
-        """)
+        completion_title.setObjectName("guideCompletionTitle")
         
         credentials_text = QLabel("Your camera credentials: Username: admin | Password: [your secure password]")
-        credentials_text.setStyleSheet("""
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 16px;
-            color: white;
-            background: rgba(255,255,255,0.1);
-            padding: 10px;
-            border-radius: 6px;
-        """)
+        credentials_text.setObjectName("guideCredentials")
         
         completion_layout.addWidget(completion_title)
         completion_layout.addWidget(credentials_text)
         
         content_layout.addWidget(completion_frame)
         
-        # Frigate Integration Steps (after hardware setup completion)
-        frigate_steps = [
-            {
-                "title": "NEXT STEPS: Configure Camera in Frigate",
-                "description": "Now that your camera is set up, add it to Frigate for AI detection.",
-                "points": [
-                    "Camera hardware setup is complete",
-                    "Next: Add camera to Frigate application",
-                    "Use the 'Set Up Your Cameras' button below"
-                ],
-                "image": "gui_1.png"
-            },
-            {
-                "title": "STEP 9: Open Camera Setup Tool", 
-                "description": "Go to setup your camera button to add cameras to Frigate.",
-                "points": [
-                    "Click on 'Set Up Your Cameras' button",
-                    "This opens the camera configuration interface",
-                    "You'll configure detection and recording settings"
-                ],
-                "image": "gui_2.png"
-            },
-            {
-                "title": "STEP 10: Discover Camera IP Address",
-                "description": "Inside the setup tool, click on discover camera button to identify IP addresses.",
-                "points": [
-                    "Click on 'Discover Camera' button",
-                    "This will scan your network for IP cameras",
-                    "Automatically finds camera IP addresses"
-                ],
-                "image": "gui_3.png"
-            },
-            {
-                "title": "STEP 11: Start Network Scan",
-                "description": "Start scan to identify the IP addresses of cameras connected in your house.",
-                "points": [
-                    "Click 'Start Scan' to begin network discovery",
-                    "Wait for scan to complete (may take 30-60 seconds)",
-                    "All connected IP cameras will be detected"
-                ],
-                "image": "gui_4.png"
-            },
-            {
-                "title": "STEP 12: Select Camera and Configure",
-                "description": "Select your IP camera and enter username/password to complete setup.",
-                "points": [
-                    "You will see detected IP cameras in the list",
-                    "Select your camera from the discovered devices",
-                    "Enter the username and password you created earlier",
-                    "Click to proceed and complete camera integration"
-                ],
-                "image": "gui_5.png"
-            }
-        ]
-        
-        # Create Frigate integration step cards
-        for i, step in enumerate(frigate_steps):
-            step_frame = QFrame()
-            step_frame.setStyleSheet("""
-                QFrame {
-                    background: white;
-                    border: 1px solid #e2e8f0;
-                    border-radius: 10px;
-                    padding: 0;
-                    margin: 3px 0;
-                }
-                QFrame:hover {
-                    border: 1px solid #0694a2;
-                    background: #f9fafb;
-                }
-            """)
-            
-            step_layout = QHBoxLayout(step_frame)
-            step_layout.setContentsMargins(20, 15, 20, 15)
-            step_layout.setSpacing(20)
-            
-            # Left content area
-            left_content = QVBoxLayout()
-            left_content.setSpacing(8)
-            
-            # Step header
-            step_header = QLabel(step["title"])
-            step_header.setStyleSheet("""
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 18px;
-                font-weight: 700;
-                color: #1a365d;
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #0694a2, stop: 1 #0f766e);
-                color: white;
-                padding: 10px 18px;
-                border-radius: 6px;
-                margin-bottom: 5px;
-            """)
-            
-            # Description
-            desc_label = QLabel(step["description"])
-            desc_label.setStyleSheet("""
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 16px;
-                font-weight: 600;
-                color: #2d3748;
-                margin-bottom: 8px;
-            """)
-            desc_label.setWordWrap(True)
-            
-            # Points list
-            points_widget = QWidget()
-            points_layout = QVBoxLayout(points_widget)
-            points_layout.setContentsMargins(0, 0, 0, 0)
-            points_layout.setSpacing(3)
-            
-            for point in step["points"]:
-                point_label = QLabel(f"<span style='color: #0694a2; font-weight: bold;'>•</span> {point}")
-                point_label.setStyleSheet("""
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    font-size: 15px;
-                    color: #4a5568;
-                    padding: 3px 0;
-                """)
-                point_label.setWordWrap(True)
-                points_layout.addWidget(point_label)
-            
-            left_content.addWidget(step_header)
-            left_content.addWidget(desc_label)
-            left_content.addWidget(points_widget)
-            left_content.addStretch()
-            
-            step_layout.addLayout(left_content, 2)
-            
-            # Right image area
-            if step["image"]:
-                image_label = QLabel()
-                image_path = os.path.join(cam_assets_dir, step["image"])
-                
-                if os.path.exists(image_path):
-                    pixmap = QPixmap(image_path)
-                    if not pixmap.isNull():
-                        # Scale image to fit nicely
-                        scaled_pixmap = pixmap.scaled(250, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        image_label.setPixmap(scaled_pixmap)
-                        image_label.setStyleSheet("""
-                            border: 2px solid #e2e8f0;
-                            border-radius: 8px;
-                            padding: 5px;
-                            background: #f7fafc;
-                        """)
-                        image_label.setAlignment(Qt.AlignCenter)
-                        step_layout.addWidget(image_label, 1)
-                
-            content_layout.addWidget(step_frame)
+        # Frigate integration step cards (after hardware setup completion)
+        frigate_steps_widget = QWidget()
+        frigate_steps_layout = QVBoxLayout(frigate_steps_widget)
+        frigate_steps_layout.setContentsMargins(0, 0, 0, 0)
+        frigate_steps_layout.setSpacing(content_layout.spacing())
+        content_layout.addWidget(frigate_steps_widget)
         
         # Troubleshooting section
         trouble_frame = QFrame()
-        trouble_frame.setStyleSheet("""
-            QFrame {
-                background: #fef2f2;
-                border: 1px solid #fca5a5;
-                border-radius: 12px;
-                padding: 15px;
-                margin: 10px 0;
-            }
-        """)
+        trouble_frame.setObjectName("guideTroubleshooting")
         
         trouble_layout = QVBoxLayout(trouble_frame)
         trouble_title = QLabel("🛠️ Quick Troubleshooting")
-        trouble_title.setStyleSheet("""
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 16px;
-            font-weight: 700;
-            color: #b91c1c;
-            margin-bottom: 6px;
-        """)
-        
-        trouble_points = [
-            "Camera won't power on: Check power connection, try different outlet",
-            "Can't find camera: Restart camera (unplug 10 seconds), ensure same WiFi network",
-            "WiFi won't connect: Verify password, use 2.4GHz network, move closer to router",
-            "App issues: Restart app, check internet, update to latest version"
-        ]
+        trouble_title.setObjectName("guideTroubleshootingTitle")
         
         trouble_layout.addWidget(trouble_title)
-        for point in trouble_points:
+        for point in _TROUBLESHOOTING_POINTS:
             point_label = QLabel(f"• {point}")
-            point_label.setStyleSheet("""
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 13px;
-                color: #b91c1c;
-                padding: 2px 0;
-            """)
+            point_label.setTextFormat(Qt.PlainText)  # Plain tips; skip the rich-text sniffing
+            point_label.setProperty("class", "guideTroubleshootingPoint")
             point_label.setWordWrap(True)
             trouble_layout.addWidget(point_label)
         
@@ -4555,12 +5793,7 @@ class FrigateLauncher(QMainWindow):
         # Modern footer with close button
         footer_frame = QFrame()
         footer_frame.setFixedHeight(70)  # Smaller footer
-        footer_frame.setStyleSheet("""
-            QFrame {
-                background: white;
-                border-top: 1px solid #e2e8f0;
-            }
-        """)
+        footer_frame.setObjectName("guideFooter")
         
         footer_layout = QHBoxLayout(footer_frame)
         footer_layout.setContentsMargins(20, 15, 20, 15)
@@ -4568,33 +5801,123 @@ class FrigateLauncher(QMainWindow):
         
         close_btn = QPushButton("✕ Close Guide")
         close_btn.setFixedSize(150, 40)  # Smaller button
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #0694a2, stop: 1 #0f766e);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 14px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #4b5563, stop: 1 #0694a2);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #0f766e, stop: 1 #111827);
-            }
-        """)
+        close_btn.setObjectName("guideCloseButton")
         close_btn.clicked.connect(lambda: self.close_guide_with_guidance(dialog))
         
         footer_layout.addWidget(close_btn)
         main_layout.addWidget(footer_frame)
         
+        # Build the first cards now so the dialog opens with content; every other card starts
+        # as a fixed-height placeholder and is only built once it scrolls near the viewport
+        cards = [
+            (hardware_steps_layout, step, (18, 12, 18, 12), 16)
+            for step in _CAMERA_SETUP_STEPS
+        ] + [
+            (frigate_steps_layout, step, (20, 15, 20, 15), 20)
+            for step in _FRIGATE_SETUP_STEPS
+        ]
+        pending_cards = []
+        for n, (layout, step, margins, spacing) in enumerate(cards):
+            if n < _SETUP_GUIDE_EAGER_CARDS:
+                layout.addWidget(self._build_setup_step_card(step, margins, spacing))
+                continue
+            slot = QWidget()
+            QVBoxLayout(slot).setContentsMargins(0, 0, 0, 0)
+            slot.setMinimumHeight(_SETUP_GUIDE_PLACEHOLDER_HEIGHT)
+            layout.addWidget(slot)
+            pending_cards.append((slot, step, margins, spacing))
+        
+        scroll_bar = content_scroll.verticalScrollBar()
+        
+        def build_visible_cards(*_):
+            if not pending_cards or not dialog.isVisible():
+                return
+            # Make sure the placeholder positions are current before comparing them; the scroll
+            # area resizes the content to fit cards built on the last pass and reports it via rangeChanged
+            content_layout.invalidate()
+            for steps_layout in (content_layout, hardware_steps_layout, frigate_steps_layout):
+                steps_layout.activate()
+            
+            # Build everything down to one viewport below the visible area, repainting once at the end
+            viewport_height = content_scroll.viewport().height()
+            horizon = scroll_bar.value() + 2 * viewport_height
+            content_widget.setUpdatesEnabled(False)
+            try:
+                while pending_cards:
+                    slot, step, margins, spacing = pending_cards[0]
+                    if slot.mapTo(content_widget, QPoint(0, 0)).y() > horizon:
+                        break
+                    pending_cards.pop(0)
+                    slot.layout().addWidget(self._build_setup_step_card(step, margins, spacing))
+                    slot.setMinimumHeight(0)
+            finally:
+                content_widget.setUpdatesEnabled(True)
+            if not pending_cards:
+                # Every card is built; stop relaying out the guide on each scroll step
+                scroll_bar.valueChanged.disconnect(build_visible_cards)
+                scroll_bar.rangeChanged.disconnect(build_visible_cards)
+        
+        scroll_bar.valueChanged.connect(build_visible_cards)
+        scroll_bar.rangeChanged.connect(build_visible_cards)  # Dialog resized or cards laid out
+        QTimer.singleShot(0, build_visible_cards)  # Initial fill once the dialog is showing
+        
         # Show dialog with modal overlay
         self.show_dialog(dialog)
+    
+    def _build_setup_step_card(self, step, margins, spacing):
+        """Build one step card (text on the left, screenshot on the right) for the camera setup guide"""
+        step_frame = QFrame()
+        step_frame.setProperty("class", "stepCard")
+        
+        step_layout = QHBoxLayout(step_frame)
+        step_layout.setContentsMargins(*margins)
+        step_layout.setSpacing(spacing)
+        
+        # Left content area
+        left_content = QVBoxLayout()
+        left_content.setSpacing(8)
+        
+        # Step header
+        step_header = QLabel(step["title"])
+        step_header.setTextFormat(Qt.PlainText)
+        step_header.setProperty("class", "stepHeader")
+        
+        # Description
+        desc_label = QLabel(step["description"])
+        desc_label.setTextFormat(Qt.PlainText)
+        desc_label.setProperty("class", "stepDescription")
+        desc_label.setWordWrap(True)
+        
+        # Points list (one rich-text label per step rather than one label per point)
+        if isinstance(step["points"], str):
+            # A one-item "points" missing its trailing comma would be rendered a character per bullet
+            raise TypeError(f"Setup step {step['title']!r} has a bare string for points; use a tuple")
+        points_label = QLabel()
+        points_label.setTextFormat(Qt.RichText)  # Known HTML; skip the rich-text sniffing
+        points_label.setText("".join(_STEP_POINT_HTML.format(point) for point in step["points"]))
+        points_label.setProperty("class", "stepPoints")
+        points_label.setWordWrap(True)
+        
+        left_content.addWidget(step_header)
+        left_content.addWidget(desc_label)
+        left_content.addWidget(points_label)
+        left_content.addStretch()
+        
+        step_layout.addLayout(left_content, 2)
+        
+        # Right image area
+        if step["image"]:
+            image_label = QLabel()
+            image_path = os.path.join(self._cam_assets_dir, step["image"])
+            
+            scaled_pixmap = self._get_setup_guide_pixmap(image_path)
+            if scaled_pixmap is not None:
+                image_label.setPixmap(scaled_pixmap)
+                image_label.setProperty("class", "stepImage")
+                image_label.setAlignment(Qt.AlignCenter)
+                step_layout.addWidget(image_label, 1)
+        
+        return step_frame
 
     def close_guide_with_guidance(self, dialog):
         """Close the guide and show next steps guidance"""
@@ -4612,44 +5935,13 @@ class FrigateLauncher(QMainWindow):
         layout.setContentsMargins(30, 30, 30, 30)
         
         # Icon and title
-        title_layout = QHBoxLayout()
-        
-        # Icon label
-        icon_label = QLabel("🎯")
-        icon_label.setStyleSheet("font-size: 32px;")
-        title_layout.addWidget(icon_label)
-        
-        # Title
-        title_label = QLabel("Ready to Set Up Your Cameras!")
-        title_label.setStyleSheet("""
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 18px;
-            font-weight: 700;
-            color: #0694a2;
-            margin-left: 10px;
-        """)
-        title_layout.addWidget(title_label)
-        title_layout.addStretch()
-        
-        layout.addLayout(title_layout)
+        layout.addLayout(_build_header("🎯", "Ready to Set Up Your Cameras!"))
         
         # Guidance text
-        guidance_text = QLabel(
-            "Now you're ready for the next step:<br><br>"
-            "👉 <b>Click the \"🎥 Set Up Your Cameras\" button</b> below to start adding your cameras to Frigate.<br><br>"
-            "This will open the camera configuration tool where you can discover and configure your Amcrest cameras."
-        )
+        guidance_text = QLabel()
         guidance_text.setTextFormat(Qt.RichText)  # Enable HTML rendering
-        guidance_text.setStyleSheet("""
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 14px;
-            color: #2d3748;
-            line-height: 1.5;
-            padding: 15px;
-            background: #f7fafc;
-            border-radius: 8px;
-            border-left: 4px solid #0694a2;
-        """)
+        guidance_text.setText(_NEXT_STEPS_GUIDANCE_HTML)
+        guidance_text.setStyleSheet(_NEXT_STEPS_TEXT_QSS)
         guidance_text.setWordWrap(True)
         layout.addWidget(guidance_text)
         
@@ -4658,42 +5950,12 @@ class FrigateLauncher(QMainWindow):
         
         # Highlight button
         highlight_btn = QPushButton("💡 Show Me the Button")
-        highlight_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #0694a2, stop: 1 #0f766e);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #0891b2, stop: 1 #164e63);
-            }
-        """)
+        highlight_btn.setStyleSheet(_GUIDANCE_HIGHLIGHT_BTN_QSS)
         highlight_btn.clicked.connect(lambda: self.highlight_setup_button(guidance_dialog))
         
         # Got it button
         got_it_btn = QPushButton("Got It!")
-        got_it_btn.setStyleSheet("""
-            QPushButton {
-                background: #e2e8f0;
-                color: #2d3748;
-                border: 1px solid #cbd5e0;
-                border-radius: 6px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background: #cbd5e0;
-            }
-        """)
+        got_it_btn.setStyleSheet(_GUIDANCE_GOT_IT_BTN_QSS)
         got_it_btn.clicked.connect(guidance_dialog.accept)
         
         button_layout.addWidget(highlight_btn)
@@ -4711,89 +5973,57 @@ class FrigateLauncher(QMainWindow):
         
         # Add temporary highlight animation to the setup button
         if hasattr(self, 'setup_cameras_btn'):
-            # Store original stylesheet
-            original_style = self.setup_cameras_btn.styleSheet()
-            
-            # Apply highlight style
-            highlight_style = """
-                QPushButton {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                        stop: 0 #c084fc, stop: 1 #a855f7);
-                    color: white;
-                    border: 3px solid #c084fc;
-                    border-radius: 8px;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    font-size: 16px;
-                    font-weight: 700;
-                    text-align: center;
-                    padding: 8px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                        stop: 0 #ddd6fe, stop: 1 #8b5cf6);
-                }
-            """
-            
-            self.setup_cameras_btn.setStyleSheet(highlight_style)
-            
-            # Scroll to the button to make sure it's visible
-            if hasattr(self, 'scroll_area'):
-                self.setup_cameras_btn.ensurePolished()
-                # Force update
-                self.setup_cameras_btn.update()
-            
-            # Reset to original style after 5 seconds
-            QTimer.singleShot(5000, lambda: self.setup_cameras_btn.setStyleSheet(original_style))
+            self._pulse_button_highlight(self.setup_cameras_btn)
 
     def launch_simple_gui(self):
         """Launch the monitoring GUI - this could open Frigate web UI or monitoring interface"""
-        try:
-            # Check if Frigate is running and web interface is available
-            import webbrowser
-            
+        # Reuse a recent probe; otherwise check on the thread pool so the GUI never waits on the request
+        if self._frigate_url_last_check is not None:
+            checked_at, reachable = self._frigate_url_last_check
+            if time.monotonic() - checked_at < _FRIGATE_UI_CHECK_TTL:
+                self._on_frigate_ui_checked(reachable)
+                return
+        
+        def probe():
+            reachable = False
             # Try to import requests, fallback if not available
             try:
                 import requests
-                REQUESTS_AVAILABLE = True
-            except ImportError:
-                REQUESTS_AVAILABLE = False
-            
-            # Try to access Frigate web interface (usually on port 5000)
-            frigate_url = "http://localhost:5000"
-            
-            if REQUESTS_AVAILABLE:
                 try:
                     # Quick check if Frigate web interface is accessible
-                    response = requests.get(frigate_url, timeout=3)
-                    if response.status_code == 200:
-                        # Open Frigate web interface
-                        webbrowser.open(frigate_url)
-                        return
+                    reachable = requests.get("http://localhost:5000", timeout=3).status_code == 200
                 except requests.exceptions.RequestException:
                     pass
-            
-            # If Frigate web interface is not available, show message
-            QMessageBox.information(
-                self, 'Monitor Cameras',
-                'To monitor your cameras, please ensure Frigate is running first.\n\n'
-                'You can start Frigate using the "Start Frigate" button, '
-                'then access the monitoring interface at:\nhttp://localhost:5000'
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self, 'Error Opening Monitor',
-                f'Could not open the monitoring interface:\n{str(e)}'
+            except ImportError:
+                pass
+            self._frigate_url_last_check = (time.monotonic(), reachable)
+            self.frigate_ui_checked.emit(reachable)
+        
+        QThreadPool.globalInstance().start(_RunnableFn(probe))
+    
+    def _on_frigate_ui_checked(self, reachable):
+        """Open the Frigate web interface if it answered, otherwise explain how to start it"""
+        if reachable:
+            self.open_url_in_background(
+                "http://localhost:5000", 'Error Opening Monitor', 'Could not open the monitoring interface',
+                'Please ensure Frigate is running and visit: http://localhost:5000'
             )
+            return
+        
+        # If Frigate web interface is not available, show message
+        QMessageBox.information(
+            self, 'Monitor Cameras',
+            'To monitor your cameras, please ensure Frigate is running first.\n\n'
+            'You can start Frigate using the "Start Frigate" button, '
+            'then access the monitoring interface at:\nhttp://localhost:5000'
+        )
     
     def view_current_config(self):
         """Show current Frigate configuration in a dialog"""
-        config_path = os.path.join(self.script_dir, "frigate", "config", "config.yaml")
+        config_path = self._config_path
         
         if os.path.exists(config_path):
             try:
-                with open(config_path, 'r') as f:
-                    config_content = f.read()
-                
                 dialog = QDialog(self)
                 dialog.setWindowTitle("Current Frigate Configuration")
                 dialog.setModal(True)
@@ -4802,9 +6032,19 @@ class FrigateLauncher(QMainWindow):
                 layout = QVBoxLayout(dialog)
                 
                 text_edit = QTextEdit()
-                text_edit.setPlainText(config_content)
                 text_edit.setReadOnly(True)
-                text_edit.setFont(QFont("Consolas", 10))
+                text_edit.setUndoRedoEnabled(False)  # Read-only view; don't keep an undo copy of the file
+                text_edit.setFont(_font("Consolas", 10))
+                
+                # Stream the file in chunks rather than holding it as one string on top of the document
+                cursor = QTextCursor(text_edit.document())
+                text_edit.setUpdatesEnabled(False)
+                try:
+                    with open(config_path, 'r') as f:
+                        for chunk in iter(functools.partial(f.read, _CONFIG_VIEW_CHUNK), ''):
+                            cursor.insertText(chunk)
+                finally:
+                    text_edit.setUpdatesEnabled(True)
                 layout.addWidget(text_edit)
                 
                 button_layout = QHBoxLayout()
@@ -4836,11 +6076,10 @@ class FrigateLauncher(QMainWindow):
             config_yaml = self.generate_frigate_config(cameras)
             
             # Save to config file
-            config_path = os.path.join(self.script_dir, "frigate", "config", "config.yaml")
+            config_path = self._config_path
             os.makedirs(os.path.dirname(config_path), exist_ok=True)
             
-            with open(config_path, 'w') as f:
-                f.write(config_yaml)
+            _atomic_write(config_path, config_yaml)
             
             QMessageBox.information(
                 self, 'Configuration Applied',
@@ -4860,52 +6099,41 @@ class FrigateLauncher(QMainWindow):
     
     def generate_frigate_config(self, cameras):
         """Generate Frigate configuration YAML from camera list"""
+        import yaml
+        
         # Get unique objects from all cameras
         all_objects = set()
         for camera in cameras:
             all_objects.update(camera.get('objects', ['person']))
         
-        config = f"""# MemryX + Frigate Configuration
-# Generated automatically by PreConfigured Box setup
-
-# MemryX detector configuration
-detectors:
-  memx0:
-    type: memryx
-    device: PCIe:0
-    
-# Object tracking configuration
-objects:
-  track:
-"""
-        
-        for obj in sorted(all_objects):
-            config += f"    - {obj}\n"
-        
-        config += """
-# Recording configuration
-record:
-  enabled: true
-  retain:
-    days: 7
-    mode: active_objects
-  events:
-    retain:
-      default: 30
-      
-# Snapshots configuration
-snapshots:
-  enabled: true
-  clean_copy: true
-  retain:
-    default: 30
-
-# Camera configurations
-cameras:
-"""
+        config = {
+            # MemryX detector configuration
+            'detectors': {
+                'memx0': {'type': 'memryx', 'device': 'PCIe:0'},
+            },
+            # Object tracking configuration
+            'objects': {
+                'track': sorted(all_objects),
+            },
+            # Recording configuration
+            'record': {
+                'enabled': True,
+                'retain': {'days': 7, 'mode': 'active_objects'},
+                'events': {'retain': {'default': 30}},
+            },
+            # Snapshots configuration
+            'snapshots': {
+                'enabled': True,
+                'clean_copy': True,
+                'retain': {'default': 30},
+            },
+            # Camera configurations
+            'cameras': {},
+        }
         
         for i, camera in enumerate(cameras):
-            camera_name = camera.get('name', f'camera_{i+1}').replace(' ', '_').lower()
+            fallback_name = f'camera_{i+1}'
+            camera_name = _CAMERA_NAME_INVALID.sub('_', camera.get('name', fallback_name)).strip('_').lower() or fallback_name
             username = camera.get('username', '')
             password = camera.get('password', '')
             ip_address = camera.get('ip_address', '')
@@ -4918,127 +6146,75 @@ cameras:
             else:
                 rtsp_url = f"rtsp://{ip_address}:{port}{stream_path}"
             
-            config += f"""  {camera_name}:
-    ffmpeg:
-      inputs:
-        - path: {rtsp_url}
-          roles:
-            - detect
-            - record
-    detect:
-      width: 2560
-      height: 1440
-      fps: 5
-    objects:
-      track:
-"""
-            
-            camera_objects = camera.get('objects', ['person'])
-            for obj in camera_objects:
-                config += f"        - {obj}\n"
+            config['cameras'][camera_name] = {
+                'ffmpeg': {
+                    'inputs': [{'path': rtsp_url, 'roles': ['detect', 'record']}],
+                },
+                'detect': {'width': 2560, 'height': 1440, 'fps': 5},
+                'objects': {'track': list(camera.get('objects', ['person']))},
+            }
         
-        return config
+        # Let PyYAML quote user-supplied values (credentials, paths); use libyaml when it is available
+        dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+        return (
+            "# MemryX + Frigate Configuration\n"
+            "# Generated automatically by PreConfigured Box setup\n\n"
+            + yaml.dump(config, Dumper=dumper, default_flow_style=False, sort_keys=False)
+        )
 
+    def _create_key_table(self):
+        """Map (modifiers, key) to the handler for each keyboard shortcut"""
+        ctrl = Qt.ControlModifier
+        ctrl_shift = Qt.ControlModifier | Qt.ShiftModifier
+        ctrl_alt = Qt.ControlModifier | Qt.AltModifier
+        return {
+            # Ctrl shortcuts
+            (ctrl, Qt.Key_Q): self.close_application,
+            (ctrl, Qt.Key_W): self.set_windowed_mode,
+            (ctrl, Qt.Key_M): self.maximize_window,
+            (ctrl, Qt.Key_N): lambda: None,  # Removed new configuration - use config GUI instead
+            (ctrl, Qt.Key_O): self.open_config,
+            (ctrl, Qt.Key_S): self.save_configuration,
+            (ctrl, Qt.Key_L): self.clear_progress_logs,
+            (ctrl, Qt.Key_Question): self.show_shortcuts,  # Ctrl+?
+            (ctrl, Qt.Key_1): lambda: self.main_tab_widget.setCurrentIndex(0),  # PreConfigured Box
+            (ctrl, Qt.Key_2): lambda: self.main_tab_widget.setCurrentIndex(1),  # Manual Setup
+            (ctrl, Qt.Key_3): lambda: self.main_tab_widget.setCurrentIndex(2),  # Advanced Settings
+            # Ctrl+Shift shortcuts
+            (ctrl_shift, Qt.Key_S): lambda: self.docker_action('start'),
+            (ctrl_shift, Qt.Key_T): lambda: self.docker_action('stop'),
+            (ctrl_shift, Qt.Key_R): lambda: self.docker_action('restart'),
+            (ctrl_shift, Qt.Key_1): self.go_to_advanced_config,
+            (ctrl_shift, Qt.Key_2): self.go_to_advanced_docker,
+            (ctrl_shift, Qt.Key_3): self.go_to_advanced_logs,
+            # Ctrl+Alt shortcuts
+            (ctrl_alt, Qt.Key_T): self.open_terminal,
+        }
+    
+    def _exit_fullscreen(self):
+        """Leave fullscreen for the maximized window"""
+        self.showNormal()
+        screen = QApplication.primaryScreen()
+        self.setGeometry(screen.availableGeometry())
+        self.statusBar().showMessage(_MSG_MAXIMIZED)
+    
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts"""
         key = event.key()
-        modifiers = event.modifiers()
-        
-        # F11 for fullscreen toggle
-        if key == Qt.Key_F11:
-            self.toggle_fullscreen()
-            event.accept()
-        # F5 for status refresh
-        elif key == Qt.Key_F5:
-            self.check_system_status()
-            event.accept()
-        # F1 for documentation
-        elif key == Qt.Key_F1:
-            self.open_frigate_documentation()
-            event.accept()
-        # F2 for MemryX documentation
-        elif key == Qt.Key_F2:
-            self.open_memryx_documentation()
-            event.accept()
-        # ESC to exit fullscreen
-        elif key == Qt.Key_Escape and self.isFullScreen():
-            self.showNormal()
-            screen = QApplication.primaryScreen()
-            self.setGeometry(screen.availableGeometry())
-            self.statusBar().showMessage('Maximized mode - F11: Fullscreen | F5: Refresh | Ctrl+W: Windowed | Ctrl+?: Shortcuts')
-            event.accept()
         
-        # Ctrl shortcuts
-        elif modifiers == Qt.ControlModifier:
-            if key == Qt.Key_Q:
-                self.close_application()
-                event.accept()
-            elif key == Qt.Key_W:
-                self.set_windowed_mode()
-                event.accept()
-            elif key == Qt.Key_M:
-                self.maximize_window()
-                event.accept()
-            elif key == Qt.Key_N:
-                # Removed new configuration - use config GUI instead
-                event.accept()
-            elif key == Qt.Key_O:
-                self.open_config()
-                event.accept()
-            elif key == Qt.Key_S:
-                self.save_configuration()
-                event.accept()
-            elif key == Qt.Key_L:
-                self.clear_progress_logs()
-                event.accept()
-            elif key == Qt.Key_Question:  # Ctrl+?
-                self.show_shortcuts()
-                event.accept()
-            elif key == Qt.Key_1:
-                self.main_tab_widget.setCurrentIndex(0)  # PreConfigured Box
-                event.accept()
-            elif key == Qt.Key_2:
-                self.main_tab_widget.setCurrentIndex(1)  # Manual Setup
-                event.accept()
-            elif key == Qt.Key_3:
-                self.main_tab_widget.setCurrentIndex(2)  # Advanced Settings
-                event.accept()
-            else:
-                super().keyPressEvent(event)
-        
-        # Ctrl+Shift shortcuts
-        elif modifiers == (Qt.ControlModifier | Qt.ShiftModifier):
-            if key == Qt.Key_S:
-                self.docker_action('start')
-                event.accept()
-            elif key == Qt.Key_T:
-                self.docker_action('stop')
-                event.accept()
-            elif key == Qt.Key_R:
-                self.docker_action('restart')
-                event.accept()
-            elif key == Qt.Key_1:
-                self.go_to_advanced_config()
-                event.accept()
-            elif key == Qt.Key_2:
-                self.go_to_advanced_docker()
-                event.accept()
-            elif key == Qt.Key_3:
-                self.go_to_advanced_logs()
-                event.accept()
-            else:
-                super().keyPressEvent(event)
-        
-        # Ctrl+Alt shortcuts
-        elif modifiers == (Qt.ControlModifier | Qt.AltModifier):
-            if key == Qt.Key_T:
-                self.open_terminal()
-                event.accept()
+        # Function keys work whatever modifiers are held
+        handler = self._function_key_table.get(key)
+        if handler is None:
+            if key == Qt.Key_Escape and self.isFullScreen():
+                handler = self._exit_fullscreen  # ESC to exit fullscreen
             else:
-                super().keyPressEvent(event)
+                handler = self._key_table.get((event.modifiers(), key))
         
-        else:
+        if handler is None:
             super().keyPressEvent(event)
+            return
+        handler()
+        event.accept()
 
     def create_header(self, layout):
         header_frame = QFrame()
@@ -5054,15 +6230,14 @@ cameras:
         header_layout = QHBoxLayout(header_frame)
         
         # Logos
-        memryx_logo_path = os.path.join(self.script_dir, "assets", "memryx.png")
-        if os.path.exists(memryx_logo_path):
+        if os.path.exists(self._memryx_logo_path):
             memryx_logo = QLabel()
-            memryx_logo.setPixmap(QPixmap(memryx_logo_path).scaledToHeight(60, Qt.SmoothTransformation))
+            memryx_logo.setPixmap(QPixmap(self._memryx_logo_path).scaledToHeight(60, Qt.SmoothTransformation))
             header_layout.addWidget(memryx_logo)
         
         # Title with improved professional formatting
         title = QLabel("MemryX + Frigate Control Center")
-        title.setFont(QFont("Segoe UI", 22, QFont.Bold))
+        title.setFont(_font("Segoe UI", 22, QFont.Bold))
         title.setAlignment(Qt.AlignCenter)
         title.setStyleSheet("""
             color: #2d3748; 
@@ -5074,10 +6249,9 @@ cameras:
         """)
         header_layout.addWidget(title, 1)
         
-        frigate_logo_path = os.path.join(self.script_dir, "assets", "frigate.png")
-        if os.path.exists(frigate_logo_path):
+        if os.path.exists(self._frigate_logo_path):
             frigate_logo = QLabel()
-            frigate_logo.setPixmap(QPixmap(frigate_logo_path).scaledToHeight(60, Qt.SmoothTransformation))
+            frigate_logo.setPixmap(QPixmap(self._frigate_logo_path).scaledToHeight(60, Qt.SmoothTransformation))
             header_layout.addWidget(frigate_logo)
         
         layout.addWidget(header_frame)
@@ -5133,7 +6307,7 @@ cameras:
         config_btn.setToolTip("Open the configuration editor")
         
         start_btn = QPushButton("▶️ Start Frigate")
-        start_btn.clicked.connect(lambda: self.docker_action('start'))
+        start_btn.clicked.connect(self._start_frigate)
         start_btn.setMinimumHeight(40)
         start_btn.setToolTip("Start Frigate container")
         
@@ -5160,384 +6334,152 @@ cameras:
         info_layout.addRow("Config Path:", QLabel(os.path.join(self.script_dir, "frigate", "config")))
         
         # Add more system details
-        import platform
-        
-        info_layout.addRow("Operating System:", QLabel(f"{platform.system()} {platform.release()}"))
-        info_layout.addRow("Architecture:", QLabel(platform.machine()))
-        info_layout.addRow("Python Version:", QLabel(platform.python_version()))
+        info_layout.addRow("Operating System:", QLabel(_SYS_OS))
+        info_layout.addRow("Architecture:", QLabel(_SYS_ARCH))
+        info_layout.addRow("Python Version:", QLabel(_SYS_PY))
         
         # System resources (if psutil is available)
         if PSUTIL_AVAILABLE:
-            info_layout.addRow("CPU Cores:", QLabel(str(psutil.cpu_count())))
-            memory_gb = psutil.virtual_memory().total / (1024**3)
-            info_layout.addRow("Total Memory:", QLabel(f"{memory_gb:.1f} GB"))
+            info_layout.addRow("CPU Cores:", QLabel(_SYS_CPU))
+            info_layout.addRow("Total Memory:", QLabel(f"{_SYS_MEM_GB:.1f} GB"))
             
             # Disk space for project directory
-            disk_usage = psutil.disk_usage(self.script_dir)
+            disk_usage = self._disk_usage()
             free_gb = disk_usage.free / (1024**3)
             total_gb = disk_usage.total / (1024**3)
             info_layout.addRow("Disk Space (Free/Total):", QLabel(f"{free_gb:.1f} GB / {total_gb:.1f} GB"))
         
         layout.addWidget(info_group)
         
-        # Live System Monitor (if psutil is available)
-        if PSUTIL_AVAILABLE:
-            monitor_group = QGroupBox("📈 Live System Monitor")
-            monitor_layout = QFormLayout(monitor_group)
-            monitor_layout.setFieldGrowthPolicy(QFormLayout.ExpandingFieldsGrow)
-            monitor_layout.setSpacing(8)
-            
-            self.cpu_usage_label = QLabel("Calculating...")
-            self.memory_usage_label = QLabel("Calculating...")
-            self.disk_usage_label = QLabel("Calculating...")
-            
-            monitor_layout.addRow("CPU Usage:", self.cpu_usage_label)
-            monitor_layout.addRow("Memory Usage:", self.memory_usage_label)
-            monitor_layout.addRow("Disk Usage:", self.disk_usage_label)
-            
-            layout.addWidget(monitor_group)
-        
         layout.addStretch()
         
         return widget
     
 
     
+    def _make_status_row(self, title, checking_text, refresh_slot):
+        """Build a "Title: <status> [Refresh]" row; returns (layout, status label)"""
+        row = QHBoxLayout()
+        
+        title_label = QLabel(title)
+        title_label.setFont(_font("Arial", 10, QFont.Bold))
+        row.addWidget(title_label)
+        
+        status_label = QLabel(checking_text)
+        status_label.setProperty("status", "repo")
+        status_label.setWordWrap(True)
+        row.addWidget(status_label, 1)
+        
+        refresh_btn = _emoji_button("🔄 Refresh")
+        refresh_btn.clicked.connect(refresh_slot)
+        refresh_btn.setMaximumWidth(125)  # Wide enough to show the full text
+        row.addWidget(refresh_btn)
+        
+        return row, status_label
+    
+    def _make_install_button(self, label, slot, kind, min_height=38):
+        """Build a Prerequisites tab action button styled by its "kind" in _MANUAL_SETUP_QSS"""
+        button = _emoji_button(label)
+        button.clicked.connect(slot)
+        button.setMinimumHeight(min_height)
+        if kind is not None:
+            button.setProperty("kind", kind)
+        return button
+    
+    def _spec_slot(self, item):
+        """Resolve a spec item's "recheck" or "slot"/"args" entry to a callable"""
+        if "recheck" in item:
+            check = getattr(self, item["recheck"])
+            return lambda: self.recheck_prerequisites(check)
+        slot = getattr(self, item["slot"])
+        args = item.get("args", ())
+        return lambda: slot(*args)
+    
+    def _spec_button(self, item):
+        """Build a button described by a spec item, storing it under item["attr"] if given"""
+        button = self._make_install_button(item["text"], self._spec_slot(item), item.get("style"),
+                                           item.get("min_height", 38))
+        if "tooltip" in item:
+            button.setToolTip(item["tooltip"])
+        if item.get("hidden"):
+            button.setVisible(False)
+        if "attr" in item:
+            setattr(self, item["attr"], button)
+        return button
+    
+    def _build_from_spec(self, spec, layout):
+        """Build the widgets described by a tab spec (see _PREREQ_TAB_SPEC) into layout"""
+        for item in spec:
+            kind = item["kind"]
+            if kind == "header":
+                label = QLabel(item["text"])
+                label.setWordWrap(True)
+                label.setProperty("kind", "tabHeader")
+                layout.addWidget(label)
+            elif kind == "group":
+                group = QGroupBox(item["title"])
+                group_layout = QVBoxLayout(group)
+                group.setProperty("section", item["section"])
+                self._build_from_spec(item["items"], group_layout)
+                layout.addWidget(group)
+            elif kind == "check_grid":
+                # Rows of "Title: <status> [Install]", the install button shown only when missing
+                grid = QGridLayout()
+                grid.setSpacing(6)
+                for row, check in enumerate(item["rows"]):
+                    grid.addWidget(QLabel(check["title"]), row, 0)
+                    status_label = QLabel("🔄 Verifying...")
+                    status_label.setProperty("status", True)
+                    if "tooltip" in check:
+                        status_label.setToolTip(check["tooltip"])
+                    setattr(self, check["attr"], status_label)
+                    grid.addWidget(status_label, row, 1)
+                    button = self._spec_button(dict(check["button"], min_height=30, hidden=True))
+                    button.setMaximumWidth(110)
+                    grid.addWidget(button, row, 2)
+                layout.addLayout(grid)
+            elif kind == "info":
+                label = QLabel(item["text"])
+                label.setWordWrap(True)
+                label.setProperty("kind", "info")
+                layout.addWidget(label)
+            elif kind == "button":
+                layout.addWidget(self._spec_button(item))
+            elif kind == "status_row":
+                row, status_label = self._make_status_row(item["title"], item["text"], self._spec_slot(item))
+                setattr(self, item["attr"], status_label)
+                layout.addLayout(row)
+            elif kind == "guidance":
+                label = QLabel()
+                label.setWordWrap(True)
+                label.setProperty("kind", "guidance")
+                setattr(self, item["attr"], label)
+                layout.addWidget(label)
+    
     def create_prerequisites_tab(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(15, 15, 15, 15)  # Slightly reduced margins
         layout.setSpacing(8)  # Reduced spacing to be more compact
         
-        # Header description - made more compact
-        header_label = QLabel(
-            "🔧 This tab handles system-level prerequisites required before setting up Frigate. "
-            "Complete these steps first before proceeding to Frigate Setup."
-        )
-        header_label.setWordWrap(True)
-        header_label.setStyleSheet("""
-            QLabel {
-                background: #e8f4f0;
-                color: #2d5a4a;
-                padding: 10px;
-                border-radius: 6px;
-                font-size: 12px;
-                font-weight: bold;
-                margin-bottom: 5px;
-            }
-        """)
-        layout.addWidget(header_label)
-        
-        # Step 1: System Prerequisites Check
-        prereq_step_group = QGroupBox("Step 1: System Prerequisites Check")
-        prereq_step_layout = QVBoxLayout(prereq_step_group)
-        prereq_step_group.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #b3d9d0;
-                border-radius: 6px;
-                font-weight: bold;
-                margin-top: 5px;
-                padding-top: 10px;
-                padding-bottom: 8px;
-                min-height: 160px;
-                max-height: 180px;
-            }
-            QGroupBox::title {
-                color: #5a9b8a;
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 6px 0 6px;
-                font-size: 12px;
-            }
-        """)
-        
-        # Prerequisites grid with status and install buttons
-        prereq_grid = QGridLayout()
-        prereq_grid.setSpacing(6)  # Better spacing
-        
-        # Git row
-        prereq_grid.addWidget(QLabel("Git:"), 0, 0)
-        self.prereq_git_check = QLabel("🔄 Verifying...")
-        self.prereq_git_check.setProperty("status", True)
-        prereq_grid.addWidget(self.prereq_git_check, 0, 1)
-        
-        self.install_git_btn = QPushButton("📦 Install Git")
-        self.install_git_btn.clicked.connect(lambda: self.install_system_prereq('git'))
-        self.install_git_btn.setMaximumWidth(110)  # Slightly wider
-        self.install_git_btn.setMinimumHeight(30)  # Better height
-        self.install_git_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #dc3545, stop:1 #c82333);
-                color: white;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #e3444e, stop:1 #dc3545);
-            }
-        """)
-        self.install_git_btn.setVisible(False)  # Initially hidden
-        prereq_grid.addWidget(self.install_git_btn, 0, 2)
-        
-        # Build Tools row
-        prereq_grid.addWidget(QLabel("Build Tools:"), 1, 0)
-        self.prereq_build_check = QLabel("🔄 Verifying...")
-        self.prereq_build_check.setProperty("status", True)
-        self.prereq_build_check.setToolTip("Build Tools include GCC, Make, and other compilation tools needed for DKMS and package building")
-        prereq_grid.addWidget(self.prereq_build_check, 1, 1)
-        
-        self.install_build_btn = QPushButton("🔧 Install Build Tools")
-        self.install_build_btn.clicked.connect(lambda: self.install_system_prereq('build-tools'))
-        self.install_build_btn.setMaximumWidth(110)  # Slightly wider
-        self.install_build_btn.setMinimumHeight(30)  # Better height
-        self.install_build_btn.setToolTip("Installs build-essential package (GCC, Make, G++, etc.) required for compiling software")
-        self.install_build_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #28a745, stop:1 #1e7e34);
-                color: white;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #34ce57, stop:1 #28a745);
-            }
-        """)
-        self.install_build_btn.setVisible(False)  # Initially hidden
-        prereq_grid.addWidget(self.install_build_btn, 1, 2)
-        
-        prereq_step_layout.addLayout(prereq_grid)
-        
-        # Add explanation for Build Tools - better sized
-        build_tools_info = QLabel(
-            "💡 Includes GCC, Make, and tools for MemryX driver compilation and Docker builds."
-        )
-        build_tools_info.setWordWrap(True)
-        build_tools_info.setStyleSheet("""
-            QLabel {
-                background: #f8f9fa;
-                color: #495057;
-                padding: 6px;
-                border-radius: 4px;
-                font-size: 10px;
-                border-left: 3px solid #28a745;
-                margin: 4px 0px;
-            }
-        """)
-        prereq_step_layout.addWidget(build_tools_info)
-        
-        check_prereq_btn = QPushButton("🔍 Check System Prerequisites")
-        check_prereq_btn.clicked.connect(self.check_system_prerequisites)
-        check_prereq_btn.setMinimumHeight(45)  # Better height
-        prereq_step_layout.addWidget(check_prereq_btn)
-        
-        layout.addWidget(prereq_step_group)
-        
-        # Step 2: Docker Setup
-        docker_step_group = QGroupBox("Step 2: Docker Installation & Setup")
-        docker_step_layout = QVBoxLayout(docker_step_group)
-        docker_step_group.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #c8d4e3;
-                border-radius: 6px;
-                font-weight: bold;
-                margin-top: 8px;
-                padding-top: 10px;
-                padding-bottom: 8px;
-                min-height: 140px;
-                max-height: 160px;
-            }
-            QGroupBox::title {
-                color: #7a8fab;
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 6px 0 6px;
-                font-size: 12px;
-            }
-        """)
-        
-        # Docker status section
-        docker_status_layout = QHBoxLayout()
-        
-        docker_status_title = QLabel("Docker Status:")
-        docker_status_title.setFont(QFont("Arial", 10, QFont.Bold))  # Better font size
-        docker_status_layout.addWidget(docker_status_title)
-        
-        self.prereq_docker_status = QLabel("🔄 Checking Docker status...")
-        self.prereq_docker_status.setProperty("status", "repo")
-        self.prereq_docker_status.setWordWrap(True)
-        docker_status_layout.addWidget(self.prereq_docker_status, 1)
-        
-        refresh_docker_btn = QPushButton("🔄 Refresh")
-        refresh_docker_btn.clicked.connect(self.check_docker_prereq_status)
-        refresh_docker_btn.setMaximumWidth(125)  # Wider to show full text
-        docker_status_layout.addWidget(refresh_docker_btn)
-        
-        docker_step_layout.addLayout(docker_status_layout)
-        
-        # Docker installation button (only shown when needed)
-        self.install_docker_prereq_btn = QPushButton("🐳 Install Docker from Scratch")
-        self.install_docker_prereq_btn.clicked.connect(self.install_docker_prereq)
-        self.install_docker_prereq_btn.setMinimumHeight(38)  # Better height
-        self.install_docker_prereq_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #2563eb, stop:1 #1d4ed8);
-                color: white;
-                font-size: 12px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #0694a2, stop:1 #2563eb);
-            }
-            QPushButton:pressed {
-                background: #0f766e;
-            }
-        """)
-        self.install_docker_prereq_btn.setVisible(True)
-        docker_step_layout.addWidget(self.install_docker_prereq_btn)
-        
-        # Docker setup guidance
-        self.docker_prereq_guidance = QLabel()
-        self.docker_prereq_guidance.setWordWrap(True)
-        self.docker_prereq_guidance.setStyleSheet("color: #6c757d; font-size: 10px; padding: 4px; line-height: 1.3;")  # Better sizing
-        docker_step_layout.addWidget(self.docker_prereq_guidance)
-        
-        layout.addWidget(docker_step_group)
-        
-        # Step 3: MemryX Driver Setup
-        memryx_step_group = QGroupBox("Step 3: MemryX Driver Installation & Setup")
-        memryx_step_layout = QVBoxLayout(memryx_step_group)
-        memryx_step_group.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #d6c8e3;
-                border-radius: 6px;
-                font-weight: bold;
-                margin-top: 8px;
-                padding-top: 10px;
-                padding-bottom: 8px;
-                min-height: 160px;
-                max-height: 180px;
-            }
-            QGroupBox::title {
-                color: #8a7fab;
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 6px 0 6px;
-                font-size: 12px;
-            }
-        """)
-        
-        # MemryX status section
-        memryx_status_layout = QHBoxLayout()
-        
-        memryx_status_title = QLabel("MemryX Status:")
-        memryx_status_title.setFont(QFont("Arial", 10, QFont.Bold))  # Better font size
-        memryx_status_layout.addWidget(memryx_status_title)
-        
-        self.prereq_memryx_status = QLabel("🔄 Checking MemryX status...")
-        self.prereq_memryx_status.setProperty("status", "repo")
-        self.prereq_memryx_status.setWordWrap(True)
-        memryx_status_layout.addWidget(self.prereq_memryx_status, 1)
-        
-        refresh_memryx_btn = QPushButton("🔄 Refresh")
-        refresh_memryx_btn.clicked.connect(self.check_memryx_prereq_status)
-        refresh_memryx_btn.setMaximumWidth(125)  # Wider to show full text
-        memryx_status_layout.addWidget(refresh_memryx_btn)
-        
-        memryx_step_layout.addLayout(memryx_status_layout)
-        
-        # MemryX installation button (only shown when needed)
-        self.install_memryx_prereq_btn = QPushButton("🧠 Install MemryX Drivers & Runtime")
-        self.install_memryx_prereq_btn.clicked.connect(self.install_memryx_prereq)
-        self.install_memryx_prereq_btn.setMinimumHeight(38)  # Better height
-        self.install_memryx_prereq_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #7c3aed, stop:1 #6d28d9);
-                color: white;
-                font-size: 12px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #8b5cf6, stop:1 #7c3aed);
-            }
-            QPushButton:pressed {
-                background: #5b21b6;
-            }
-        """)
-        self.install_memryx_prereq_btn.setVisible(True)
-        memryx_step_layout.addWidget(self.install_memryx_prereq_btn)
-        
-        # System restart button (shown when MemryX drivers need restart)
-        self.restart_system_btn = QPushButton("🔄 Restart System Now")
-        self.restart_system_btn.clicked.connect(self.restart_system)
-        self.restart_system_btn.setMinimumHeight(38)  # Better height
-        self.restart_system_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #dc3545, stop:1 #c82333);
-                color: white;
-                font-size: 12px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #e85d75, stop:1 #dc3545);
-            }
-            QPushButton:pressed {
-                background: #bd2130;
-            }
-        """)
-        self.restart_system_btn.setVisible(False)  # Hidden by default
-        memryx_step_layout.addWidget(self.restart_system_btn)
-        
-        # MemryX setup guidance
-        self.memryx_prereq_guidance = QLabel()
-        self.memryx_prereq_guidance.setWordWrap(True)
-        self.memryx_prereq_guidance.setStyleSheet("color: #6c757d; font-size: 10px; padding: 4px; line-height: 1.3;")  # Better sizing
-        memryx_step_layout.addWidget(self.memryx_prereq_guidance)
-        
-        layout.addWidget(memryx_step_group)
+        self._build_from_spec(_PREREQ_TAB_SPEC, layout)
         
         # Progress area - optimized size for better balance
         progress_group = QGroupBox("Installation Progress")
         progress_layout = QVBoxLayout(progress_group)
         progress_layout.setContentsMargins(10, 10, 10, 10)
         
-        self.prereq_progress = QTextEdit()
-        self.prereq_progress.setPlainText("Ready to begin prerequisites setup...")
-        # MemryX setup guidance
-        self.memryx_prereq_guidance = QLabel()
-        self.memryx_prereq_guidance.setWordWrap(True)
-        self.memryx_prereq_guidance.setStyleSheet("color: #6c757d; font-size: 10px; padding: 4px; line-height: 1.3;")  # Better sizing
-        memryx_step_layout.addWidget(self.memryx_prereq_guidance)
-        
-        layout.addWidget(memryx_step_group)
-        
-        # Progress area - optimized size for better balance
-        progress_group = QGroupBox("Installation Progress")
-        progress_layout = QVBoxLayout(progress_group)
-        progress_layout.setContentsMargins(10, 10, 10, 10)
-        
-        self.prereq_progress = QTextEdit()
+        # Append-only log: QPlainTextEdit only lays out what is visible
+        self.prereq_progress = QPlainTextEdit()
+        self.prereq_progress.setReadOnly(True)
+        self.prereq_progress.setMaximumBlockCount(_PROGRESS_LOG_MAX_LINES)
+        self.prereq_progress.setUndoRedoEnabled(False)  # Nothing to undo in a read-only log
         self.prereq_progress.setPlainText("Ready to begin prerequisites setup...")
         self.prereq_progress.setMinimumHeight(250)  # Slightly reduced to balance with taller step sections
         # Set a preferred size that will expand to fill available space
         self.prereq_progress.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        
-        # Enable auto-scroll to bottom when new text is added
-        self.prereq_progress.textChanged.connect(self.auto_scroll_prereq_progress)
         self.prereq_progress.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background: #fafbfc;
                 border: 1px solid #e5e8eb;
                 border-radius: 6px;
@@ -5546,6 +6488,8 @@ cameras:
                 color: #2d3748;
                 padding: 12px;
                 line-height: 1.3;
+                selection-background-color: #bee3f8;
+                selection-color: #2a4365;
             }
         """)
         progress_layout.addWidget(self.prereq_progress)
@@ -5555,9 +6499,7 @@ cameras:
         layout.addWidget(progress_group, 1)  # Stretch factor of 1 to take remaining space
         
         # Initial checks
-        self.check_system_prerequisites()
-        self.check_docker_prereq_status()
-        self.check_memryx_prereq_status()
+        self._check_all_prerequisites()
         
         return widget
     
@@ -5567,25 +6509,7 @@ cameras:
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(6)
         
-        # Header description
-        header_label = QLabel(
-            "⚙️ This tab handles Frigate repository setup. Ensure you have completed the Prerequisites "
-            "tab first (Docker, MemryX, and system tools must be installed). The Python environment "
-            "is already configured by the launcher script."
-        )
-        header_label.setWordWrap(True)
-        header_label.setStyleSheet("""
-            QLabel {
-                background: #e8f4f0;
-                color: #2d5a4a;
-                padding: 10px;
-                border-radius: 6px;
-                font-size: 12px;
-                font-weight: bold;
-                margin-bottom: 5px;
-            }
-        """)
-        layout.addWidget(header_label)
+        self._build_from_spec(_SETUP_TAB_SPEC, layout)
         
         # Create splitter for resizable sections
         splitter = QSplitter(Qt.Vertical)
@@ -5602,41 +6526,13 @@ cameras:
         step1_layout = QVBoxLayout(step1_group)
         step1_layout.setSpacing(6)  # Slightly increased for guidance text readability
         step1_layout.setContentsMargins(8, 8, 8, 8)  # Keep compact margins
-        step1_group.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #c8d4e3;
-                border-radius: 6px;
-                font-weight: bold;
-                margin-top: 6px;
-                padding-top: 8px;
-            }
-            QGroupBox::title {
-                color: #7a8fab;
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 6px 0 6px;
-                font-size: 12px;
-            }
-        """)
+        step1_group.setProperty("section", "repo")
         
         # Repository status section
-        repo_status_layout = QHBoxLayout()
+        repo_status_layout, self.repo_status_label = self._make_status_row(
+            "Repository Status:", "🔄 Checking repository status...", self.check_repo_status)
         repo_status_layout.setSpacing(8)  # Reduced spacing
         
-        repo_status_label = QLabel("Repository Status:")
-        repo_status_label.setFont(QFont("Arial", 10, QFont.Bold))
-        repo_status_layout.addWidget(repo_status_label)
-        
-        self.repo_status_label = QLabel("🔄 Checking repository status...")
-        self.repo_status_label.setProperty("status", "repo")
-        self.repo_status_label.setWordWrap(True)
-        repo_status_layout.addWidget(self.repo_status_label, 1)
-        
-        refresh_status_btn = QPushButton("🔄 Refresh")
-        refresh_status_btn.clicked.connect(self.check_repo_status)
-        refresh_status_btn.setMaximumWidth(125)  # Wider to show full text
-        repo_status_layout.addWidget(refresh_status_btn)
-        
         step1_layout.addLayout(repo_status_layout)
         
         # Repository action buttons
@@ -5645,7 +6541,7 @@ cameras:
         repo_buttons_layout.setContentsMargins(0, 4, 0, 4)  # Minimal margins
         
         # Clone Frigate button
-        self.clone_frigate_btn = QPushButton("📥 Clone Fresh Repository")
+        self.clone_frigate_btn = _emoji_button("📥 Clone Fresh Repository")
         self.clone_frigate_btn.clicked.connect(lambda: self.install_frigate('clone_only'))
         self.clone_frigate_btn.setMinimumHeight(35)  # Reduced height
         self.clone_frigate_btn.setToolTip(
@@ -5656,7 +6552,7 @@ cameras:
         )
         
         # Update Frigate button
-        self.update_frigate_btn = QPushButton("🔄 Update Existing Repository")
+        self.update_frigate_btn = _emoji_button("🔄 Update Existing Repository")
         self.update_frigate_btn.clicked.connect(lambda: self.install_frigate('update_only'))
         self.update_frigate_btn.setMinimumHeight(35)  # Reduced height
         self.update_frigate_btn.setToolTip(
@@ -5673,7 +6569,7 @@ cameras:
         # Step 1 guidance
         step1_guidance = QLabel()
         step1_guidance.setWordWrap(True)
-        step1_guidance.setStyleSheet("color: #6c757d; font-size: 10px; padding: 4px;")
+        step1_guidance.setProperty("kind", "guidance")
         self.step2_guidance = step1_guidance  # Store reference for updates (keeping same name for compatibility)
         step1_layout.addWidget(step1_guidance)
         
@@ -5688,25 +6584,14 @@ cameras:
         progress_layout = QVBoxLayout(progress_group)
         progress_layout.setContentsMargins(6, 6, 6, 6)
         
-        self.install_progress = QTextEdit()
+        self.install_progress = QPlainTextEdit()
+        self.install_progress.setReadOnly(True)
+        self.install_progress.setMaximumBlockCount(_PROGRESS_LOG_MAX_LINES)
+        self.install_progress.setUndoRedoEnabled(False)  # Nothing to undo in a read-only log
         self.install_progress.setPlainText("Ready to begin setup process...")
-        # Enable auto-scroll to bottom when new text is added
-        self.install_progress.textChanged.connect(self.auto_scroll_install_progress)
         self.install_progress.setMinimumHeight(200)  # Good size for installation progress
         self.install_progress.setMaximumHeight(350)  # Prevent excessive growth
-        self.install_progress.setStyleSheet(f"""
-            QTextEdit {{
-                background: #fafbfc;
-                border: 1px solid #e5e8eb;
-                border-radius: 6px;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 12px;
-                color: #2d3748;
-                padding: 10px;
-                line-height: 1.3;
-            }}
-            {self.scroll_bar_style}
-        """)
+        self.install_progress.setStyleSheet(_INSTALL_PROGRESS_QSS)
         progress_layout.addWidget(self.install_progress)
         
         splitter.addWidget(progress_group)
@@ -5731,68 +6616,23 @@ cameras:
             "Use the <b>Advanced Settings</b> tab for detailed configuration editing and Docker logs monitoring."
         )
         next_steps_message.setWordWrap(True)
-        next_steps_message.setStyleSheet("""
-            QLabel {
-                background: #e8f4f0;
-                color: #2d5a4a;
-                padding: 12px;
-                border-radius: 6px;
-                font-size: 13px;
-                border-left: 4px solid #48bb78;
-            }
-        """)
+        next_steps_message.setProperty("kind", "nextSteps")
         
         # Buttons layout
         buttons_layout = QHBoxLayout()
         buttons_layout.setSpacing(10)
         
         # Button to go to PreConfigured Box
-        go_to_preconfigured_btn = QPushButton("📦 Go to PreConfigured Box")
+        go_to_preconfigured_btn = _emoji_button("📦 Go to PreConfigured Box")
         go_to_preconfigured_btn.clicked.connect(lambda: self.main_tab_widget.setCurrentIndex(0))
         go_to_preconfigured_btn.setMinimumHeight(35)
-        go_to_preconfigured_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #48bb78, stop:1 #38a169);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 15px;
-                font-size: 13px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #68d391, stop:1 #48bb78);
-            }
-            QPushButton:pressed {
-                background: #2f855a;
-            }
-        """)
+        go_to_preconfigured_btn.setProperty("kind", "success")
         
         # Button to go to Advanced Settings
-        go_to_advanced_btn = QPushButton("⚙️ Go to Advanced Settings")
+        go_to_advanced_btn = _emoji_button("⚙️ Go to Advanced Settings")
         go_to_advanced_btn.clicked.connect(lambda: self.main_tab_widget.setCurrentIndex(2))
         go_to_advanced_btn.setMinimumHeight(35)
-        go_to_advanced_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #4a90a4, stop:1 #38758a);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 15px;
-                font-size: 13px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #5b9bb0, stop:1 #428299);
-            }
-            QPushButton:pressed {
-                background: #2d6374;
-            }
-        """)
+        go_to_advanced_btn.setProperty("kind", "primary")
         
         buttons_layout.addWidget(go_to_preconfigured_btn)
         buttons_layout.addWidget(go_to_advanced_btn)
@@ -5842,7 +6682,7 @@ cameras:
         # Configuration editor section header
         editor_header_layout = QHBoxLayout()
         preview_label = QLabel("Configuration Editor:")
-        preview_label.setFont(QFont("Arial", 12, QFont.Bold))
+        preview_label.setFont(_font("Arial", 12, QFont.Bold))
         
         # Auto-reload indicator
         auto_reload_label = QLabel("🔄 Auto-reload enabled")
@@ -5939,41 +6779,22 @@ cameras:
         # Create splitter for resizable sections
         splitter = QSplitter(Qt.Vertical)
         
-        # Add header to splitter (small, fixed-ish)
+        # Add header to splitter; it never grows, so the editor absorbs all resizing
         splitter.addWidget(header_widget)
+        header_widget.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
         
         # Configuration editor - now takes most of the space
         self.config_preview = QTextEdit()
-        self.config_preview.setPlainText("Loading configuration...")
-        self.config_preview.setReadOnly(True)  # Start in read-only mode
-        self.config_preview.setMinimumHeight(300)  # Good minimum height for config editing
-        self.config_preview.setStyleSheet(f"""
-            QTextEdit {{
-                background: #fafbfc;
-                border: 1px solid #cbd5e0;
-                border-radius: 6px;
-                font-family: 'Consolas', 'Monaco', 'Liberation Mono', monospace;
-                font-size: 13px;
-                color: #2d3748;
-                padding: 12px;
-                line-height: 1.5;
-            }}
-            QTextEdit[readOnly="true"] {{
-                background: #f8f9fa;
-                color: #495057;
-            }}
-            {self.scroll_bar_style}
-        """)
+        self.set_config_preview_text("Loading configuration...")
+        self.config_preview.setReadOnly(True)  # Start in read-only mode
+        self.config_preview.setUndoRedoEnabled(False)  # Undo history is only kept in edit mode
+        self.config_preview.setMinimumHeight(300)  # Good minimum height for config editing
+        self.config_preview.setStyleSheet(_CONFIG_EDITOR_QSS)
         self.config_is_read_only = True  # Track edit state
         self.load_config_preview()
         
         splitter.addWidget(self.config_preview)
         
-        # Set splitter proportions - most space to editor
-        splitter.setSizes([120, 700])  # Header small, editor large
-        splitter.setStretchFactor(0, 0)  # Header doesn't stretch
-        splitter.setStretchFactor(1, 1)  # Editor gets all extra space
-        
         layout.addWidget(splitter)
         
         return widget
@@ -5998,173 +6819,18 @@ cameras:
         # Control buttons - organized in two rows for better UX
         controls_layout = QVBoxLayout()
         
-        # Primary controls row
+        # Primary (lifecycle) and secondary rows; the buttons are stored as instance variables so we can disable/enable them
         primary_controls = QHBoxLayout()
-        
-        # Store button references as instance variables so we can disable/enable them
-        self.docker_start_btn = QPushButton("▶️ Start")
-        self.docker_start_btn.clicked.connect(lambda: self.docker_action('start'))
-        self.docker_start_btn.setToolTip(
-            "🔵 START FRIGATE\n\n"
-            "• Starts existing Frigate container if it exists\n"
-            "• Creates new container automatically if none exists\n"
-            "• Preserves all existing configuration and data\n"
-            "• Best for: Getting Frigate running (works in all situations)\n\n"
-            "✅ Smart Start Behavior:\n"
-            "• Container exists & stopped → Starts it\n"
-            "• Container exists & running → Nothing to do\n"
-            "• No container exists → Creates and starts new one\n\n"
-            "⚠️ Note: Other buttons will be disabled during this operation\n"
-            "✅ Stop button remains available for emergency use"
-        )
-        
-        self.docker_stop_btn = QPushButton("⏹️ Stop")
-        self.docker_stop_btn.clicked.connect(lambda: self.docker_action('stop'))
-        self.docker_stop_btn.setToolTip(
-            "🔴 STOP CONTAINER\n\n"
-            "• Gracefully stops the running Frigate container\n"
-            "• Container remains available for future restart\n"
-            "• All configuration and data are preserved\n"
-            "• Best for: Temporary shutdown or before making config changes\n\n"
-            "✅ Emergency Stop: This button remains enabled during other operations\n"
-            "• Can be used to stop container even during rebuild/restart\n"
-            "• Useful for canceling long-running operations"
-        )
-        
-        self.docker_restart_btn = QPushButton("🔄 Restart")
-        self.docker_restart_btn.clicked.connect(lambda: self.docker_action('restart'))
-        self.docker_restart_btn.setToolTip(
-            "🔄 RESTART CONTAINER\n\n"
-            "• Quick restart of the existing container\n"
-            "• Stops and immediately starts the same container\n"
-            "• Uses existing image and configuration\n"
-            "• Best for: Applying configuration changes or fixing temporary issues\n\n"
-            "❌ Will fail if: No container exists\n"
-            "💡 Solution: Use 'Start' to create and start new container\n"
-            "💡 Or use 'Rebuild' for complete fresh build\n\n"
-            "⚠️ Note: Other buttons will be disabled during this operation\n"
-            "✅ Stop button remains available for emergency use"
-        )
-        
-        primary_controls.addWidget(self.docker_start_btn)
-        primary_controls.addWidget(self.docker_stop_btn)
-        primary_controls.addWidget(self.docker_restart_btn)
-        
-        # Secondary controls row
         secondary_controls = QHBoxLayout()
-        
-        self.docker_rebuild_btn = QPushButton("🔨 Rebuild")
-        self.docker_rebuild_btn.clicked.connect(lambda: self.docker_action('rebuild'))
-        self.docker_rebuild_btn.setToolTip(
-            "🔨 COMPLETE REBUILD\n\n"
-            "• Stops and removes existing container completely\n"
-            "• Builds fresh Docker image from latest source\n"
-            "• Creates and starts new container with current config\n"
-            "• Best for: Major updates, troubleshooting, or first-time setup\n\n"
-            "⚠️ WARNING: This is a destructive operation!\n"
-            "• Takes several minutes to complete\n"
-            "• Will interrupt any ongoing recordings\n"
-            "• Requires confirmation dialog\n"
-            "• Other buttons will be disabled during this operation\n"
-            "• Stop button remains available for emergency use"
-        )
-        self.docker_rebuild_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #fde68a, stop:1 #fcd34d);
-                color: #92400e;
-                border: 1px solid #f59e0b;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #fef3c7, stop:1 #fde68a);
-                border: 1px solid #d97706;
-            }
-            QPushButton:pressed {
-                background: #f59e0b;
-                color: white;
-            }
-            QPushButton:disabled {
-                background: #f3f4f6;
-                color: #9ca3af;
-                border: 1px solid #d1d5db;
-            }
-        """)
-        
-        self.docker_remove_btn = QPushButton("🗑️ Remove")
-        self.docker_remove_btn.clicked.connect(lambda: self.docker_action('remove'))
-        self.docker_remove_btn.setToolTip(
-            "🗑️ REMOVE CONTAINER\n\n"
-            "• Stops and completely removes the Frigate container\n"
-            "• Container must be recreated with Rebuild to use again\n"
-            "• All container state is lost (config files remain)\n"
-            "• Best for: Complete cleanup or major troubleshooting\n\n"
-            "⚠️ WARNING: This is a destructive operation!\n"
-            "• Container cannot be recovered once removed\n"
-            "• Requires confirmation dialog\n"
-            "• Other buttons will be disabled during this operation\n"
-            "• Stop button remains available for emergency use"
-        )
-        self.docker_remove_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #fecaca, stop:1 #fca5a5);
-                color: #991b1b;
-                border: 1px solid #dc2626;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #fee2e2, stop:1 #fecaca);
-                border: 1px solid #b91c1c;
-            }
-            QPushButton:pressed {
-                background: #dc2626;
-                color: white;
-            }
-            QPushButton:disabled {
-                background: #f3f4f6;
-                color: #9ca3af;
-                border: 1px solid #d1d5db;
-            }
-        """)
-        
-        self.docker_open_ui_btn = QPushButton("🌐 Open Frigate Web UI")
-        self.docker_open_ui_btn.clicked.connect(self.open_frigate_web_ui)
-        self.docker_open_ui_btn.setToolTip(
-            "🌐 OPEN WEB INTERFACE\n\n"
-            "• Opens Frigate's web interface in your default browser\n"
-            "• Access live camera feeds, recordings, and settings\n"
-            "• Default URL: http://localhost:5000\n"
-            "• Best for: Monitoring cameras and viewing recordings\n\n"
-            "📋 Note: This button stays enabled during operations\n"
-            "• You can open the web UI anytime to check status"
-        )
-        self.docker_open_ui_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #bfdbfe, stop:1 #93c5fd);
-                color: #0f766e;
-                border: 1px solid #0694a2;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #dbeafe, stop:1 #bfdbfe);
-                border: 1px solid #2563eb;
-            }
-            QPushButton:pressed {
-                background: #0694a2;
-                color: white;
-            }
-            QPushButton:disabled {
-                background: #f3f4f6;
-                color: #9ca3af;
-                border: 1px solid #d1d5db;
-            }
-        """)
-        
-        secondary_controls.addWidget(self.docker_rebuild_btn)
-        secondary_controls.addWidget(self.docker_remove_btn)
-        secondary_controls.addWidget(self.docker_open_ui_btn)
+        for row_layout, row in zip((primary_controls, secondary_controls), _DOCKER_MANAGER_BUTTON_ROWS):
+            for item in row:
+                button = QPushButton(item["text"])
+                button.clicked.connect(self._spec_slot(item))
+                button.setToolTip(item["tooltip"])
+                if "style" in item:
+                    button.setProperty("kind", item["style"])  # Styled by _DOCKER_MANAGER_QSS
+                setattr(self, item["attr"], button)
+                row_layout.addWidget(button)
         secondary_controls.addStretch()  # Push buttons to the left
         
         controls_layout.addLayout(primary_controls)
@@ -6173,17 +6839,7 @@ cameras:
         docker_group_layout.addLayout(controls_layout)
         # Operation status indicator
         self.operation_status_label = QLabel("🟢 Ready - All operations available")
-        self.operation_status_label.setStyleSheet("""
-            QLabel {
-                background: #e8f4f0;
-                color: #2d5a4a;
-                padding: 8px;
-                border-radius: 6px;
-                font-size: 11px;
-                font-weight: bold;
-                margin: 4px 0px;
-            }
-        """)
+        self.operation_status_label.setStyleSheet(_OPERATION_READY_QSS)
         docker_group_layout.addWidget(self.operation_status_label)
         docker_layout.addWidget(docker_group)
         
@@ -6208,11 +6864,10 @@ cameras:
         # Progress display with header
         progress_header_layout = QHBoxLayout()
         progress_label = QLabel("Docker Operations Progress:")
-        progress_label.setFont(QFont("Arial", 11, QFont.Bold))
+        progress_label.setFont(_font("Arial", 11, QFont.Bold))
         
         # Clear progress button
         clear_progress_btn = QPushButton("🗑️ Clear")
-        clear_progress_btn.clicked.connect(lambda: self.docker_progress.clear())
         clear_progress_btn.setMaximumWidth(120)  # Wider to show full text
         clear_progress_btn.setToolTip("Clear the progress display")
         
@@ -6222,25 +6877,19 @@ cameras:
         
         progress_layout.addLayout(progress_header_layout)
         
-        # Progress display - now takes much more space
-        self.docker_progress = QTextEdit()
+        # Progress display - now takes much more space (append-only, so a QPlainTextEdit)
+        self.docker_progress = QPlainTextEdit()
+        self.docker_progress.setReadOnly(True)
+        self.docker_progress.setMaximumBlockCount(_DOCKER_PROGRESS_MAX_LINES)
+        self.docker_progress.setUndoRedoEnabled(False)  # Nothing to undo in a read-only log
         self.docker_progress.setPlainText("🐳 Docker Manager Console Ready\n\nSelect a container operation above to view detailed progress logs and real-time status updates.\n\nSupported Operations:\n• Start/Stop/Restart: Standard container lifecycle management\n• Rebuild: Complete container regeneration with latest image\n• Remove: Complete container cleanup and removal")
-        # Enable auto-scroll to bottom when new text is added
-        self.docker_progress.textChanged.connect(self.auto_scroll_docker_progress)
         self.docker_progress.setMinimumHeight(250)  # Good size for docker logs
-        self.docker_progress.setStyleSheet(f"""
-            QTextEdit {{
-                background: #fafbfc;
-                border: 1px solid #e5e8eb;
-                border-radius: 6px;
-                font-family: 'Consolas', 'Monaco', 'Liberation Mono', monospace;
-                font-size: 12px;
-                color: #2d3748;
-                padding: 12px;
-                line-height: 1.4;
-            }}
-            {self.scroll_bar_style}
-        """)
+        self.docker_progress.setStyleSheet(_DOCKER_PROGRESS_QSS)
+        clear_progress_btn.clicked.connect(self.docker_progress.clear)
+        if self._docker_progress_backlog:
+            # Operations started from the PreConfigured Box tab before this tab was first opened
+            self.docker_progress.setPlainText('\n'.join(self._docker_progress_backlog))
+            self._docker_progress_backlog.clear()
         progress_layout.addWidget(self.docker_progress)
         
         splitter.addWidget(progress_widget)
@@ -6254,6 +6903,14 @@ cameras:
         
         return widget
     
+    def _build_docker_manager_tab(self):
+        """Build the Docker Manager sub-tab, catching it up with the container and any operation already running"""
+        widget = self.create_docker_manager_tab()
+        if self.docker_worker is not None and self.docker_worker.isRunning():
+            self.set_docker_buttons_enabled(False, keep_stop_enabled=self.current_docker_action != 'stop')
+        self.start_background_status_check()
+        return widget
+    
     def create_logs_tab(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -6261,53 +6918,25 @@ cameras:
         
         # Simple clear button for convenience
         clear_btn = QPushButton("🗑️ Clear Display")
-        clear_btn.clicked.connect(lambda: self.logs_display.clear())
         clear_btn.setMaximumWidth(160)
-        clear_btn.setToolTip("Clear the current log display (logs will reload automatically)")
+        clear_btn.setToolTip("Clear the current log display (new log lines keep streaming in)")
         layout.addWidget(clear_btn)
         
         # Logs display - takes up most of the space
-        self.logs_display = QTextEdit()
-        self.logs_display.setFont(QFont("Consolas", 10))
+        self.logs_display = QPlainTextEdit()
+        self.logs_display.setFont(_font("Consolas", 10))
         self.logs_display.setMinimumHeight(300)
         self.logs_display.setPlaceholderText("Docker logs will appear here automatically...\n\nIf no logs appear, make sure the Frigate container is running.")
         
         # Configure text edit for better auto-scrolling
         self.logs_display.setReadOnly(True)  # Make it read-only for better performance
-        self.logs_display.setLineWrapMode(QTextEdit.WidgetWidth)
-        
-        # Apply enhanced scroll styling
-        self.logs_display.setStyleSheet(f"""
-            QTextEdit {{
-                background: #fafbfc;
-                border: 1px solid #e5e8eb;
-                border-radius: 6px;
-                font-family: 'Consolas', 'Monaco', 'Liberation Mono', monospace;
-                font-size: 10px;
-                color: #2d3748;
-                padding: 8px;
-                line-height: 1.3;
-            }}
-            {self.scroll_bar_style}
-        """)
+        self.logs_display.setMaximumBlockCount(_DOCKER_LOGS_MAX_LINES)
+        self.logs_display.setUndoRedoEnabled(False)  # Nothing to undo in a read-only log
+        self.logs_display.setLineWrapMode(QPlainTextEdit.NoWrap)  # Log lines keep their shape; no rewrap on resize
         
         # Apply enhanced scroll styling
-        self.logs_display.setStyleSheet(f"""
-            QTextEdit {{
-                background: #fafbfc;
-                border: 1px solid #e5e8eb;
-                border-radius: 6px;
-                font-family: 'Consolas', 'Monaco', 'Liberation Mono', monospace;
-                font-size: 10px;
-                color: #2d3748;
-                padding: 8px;
-                line-height: 1.3;
-            }}
-            {self.scroll_bar_style}
-        """)
-        
-        # Enable auto-scroll to bottom when new text is added (same as Prerequisites tab)
-        self.logs_display.textChanged.connect(self.auto_scroll_logs_display)
+        self.logs_display.setStyleSheet(_DOCKER_LOGS_QSS)
+        clear_btn.clicked.connect(self.logs_display.clear)
         
         layout.addWidget(self.logs_display)
         
@@ -6360,44 +6989,10 @@ cameras:
         )
         welcome_message.setWordWrap(True)
         welcome_message.setAlignment(Qt.AlignCenter)  # Center the text
-        welcome_message.setStyleSheet("""
-            QLabel {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #4a90a4, stop:0.5 #38758a, stop:1 #2c6b7d);
-                color: white;
-                padding: 18px;
-                border-radius: 15px;
-                font-size: 16px;
-                font-weight: bold;
-                margin-bottom: 15px;
-                border: 3px solid rgba(255,255,255,0.3);
-            }
-        """)
+        welcome_message.setObjectName("preconfWelcome")
         header_layout.addWidget(welcome_message)
         left_layout.addWidget(header_group)
         
-        # System Issues Warning section (hidden by default)
-        status_group = QGroupBox("📊 System Status")
-        status_layout = QGridLayout(status_group)
-        status_layout.setSpacing(12)
-        
-        # System status indicators
-        self.preconfigured_status_docker = QLabel("🔄 Checking...")
-        self.preconfigured_status_memryx = QLabel("🔄 Checking...")
-        self.preconfigured_status_frigate = QLabel("🔄 Checking...")
-        
-        # Create status labels using existing style from Overview tab
-
-        self.preconfigured_memryx_status = QLabel("🔄 Initializing...")
-        self.preconfigured_memryx_status.setProperty("status", True)
-        self.preconfigured_frigate_status = QLabel("🔄 Initializing...")
-        self.preconfigured_frigate_status.setProperty("status", True)
-        
-        status_layout.addWidget(QLabel("MemryX Devices:"), 0, 0)
-        status_layout.addWidget(self.preconfigured_memryx_status, 0, 1)
-        status_layout.addWidget(QLabel("Frigate Setup:"), 1, 0)
-        status_layout.addWidget(self.preconfigured_frigate_status, 1, 1)
-        
         # System Issues Warning section (hidden by default)
         self.warning_group = QGroupBox("⚠️ System Setup Required")
         self.warning_group.setVisible(False)  # Hidden by default
@@ -6408,73 +7003,24 @@ cameras:
         self.docker_warning = QLabel("🐳 Docker not installed or not running. Docker setup required.")
         self.docker_warning.setVisible(False)
         self.docker_warning.setWordWrap(True)
-        self.docker_warning.setStyleSheet("""
-            QLabel {
-                background: #fef2f2;
-                color: #dc2626;
-                padding: 12px;
-                border-radius: 6px;
-                font-size: 13px;
-                border-left: 4px solid #fca5a5;
-                margin: 4px 0px;
-            }
-        """)
+        self.docker_warning.setProperty("kind", "warningBanner")
         
         self.memryx_warning = QLabel("🔧 MemryX device not detected. Manual setup required.")
         self.memryx_warning.setVisible(False)
         self.memryx_warning.setWordWrap(True)
-        self.memryx_warning.setStyleSheet("""
-            QLabel {
-                background: #fef2f2;
-                color: #dc2626;
-                padding: 12px;
-                border-radius: 6px;
-                font-size: 13px;
-                border-left: 4px solid #fca5a5;
-                margin: 4px 0px;
-            }
-        """)
+        self.memryx_warning.setProperty("kind", "warningBanner")
         
         self.frigate_warning = QLabel("🎥 Frigate not properly configured. Manual setup recommended.")
         self.frigate_warning.setVisible(False)
         self.frigate_warning.setWordWrap(True)
-        self.frigate_warning.setStyleSheet("""
-            QLabel {
-                background: #fef2f2;
-                color: #dc2626;
-                padding: 12px;
-                border-radius: 6px;
-                font-size: 13px;
-                border-left: 4px solid #fca5a5;
-                margin: 4px 0px;
-            }
-        """)
+        self.frigate_warning.setProperty("kind", "warningBanner")
         
         # Manual setup suggestion button
         self.manual_setup_btn = QPushButton("🛠️ Go to Manual Setup")
         self.manual_setup_btn.setVisible(False)
-        self.manual_setup_btn.clicked.connect(lambda: self.main_tab_widget.setCurrentIndex(1))  # Switch to Manual Setup tab
+        self.manual_setup_btn.clicked.connect(self._goto_manual_setup)
         self.manual_setup_btn.setMinimumHeight(40)
-        self.manual_setup_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #fca5a5, stop:1 #f87171);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 12px;
-                font-size: 14px;
-                font-weight: 600;
-                margin: 8px 0px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #fed7d7, stop:1 #fca5a5);
-            }
-            QPushButton:pressed {
-                background: #f87171;
-            }
-        """)
+        self.manual_setup_btn.setObjectName("manualSetupButton")
         
         warning_layout.addWidget(self.docker_warning)
         warning_layout.addWidget(self.memryx_warning)
@@ -6487,66 +7033,11 @@ cameras:
         camera_setup_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         camera_setup_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         camera_setup_scroll.setFrameShape(QFrame.NoFrame)  # Remove frame for cleaner look
-        camera_setup_scroll.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollArea > QWidget > QWidget {
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: #f0f0f0;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: #4a90a4;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #38758a;
-            }
-            QScrollBar:horizontal {
-                background: #f0f0f0;
-                height: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #4a90a4;
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #38758a;
-            }
-        """)
+        camera_setup_scroll.setStyleSheet(_TRANSPARENT_SCROLL_QSS)
         
         setup_group = QGroupBox("🎥 Camera Setup")
         setup_group.setMinimumHeight(220)  # Ensure adequate height to prevent squeezing
-        setup_group.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #4a90a4;
-                border-radius: 12px;
-                font-weight: bold;
-                font-size: 14px;
-                margin-top: 12px;
-                padding-top: 20px;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #f8f9fa, stop:1 #f0f7ff);
-            }
-            QGroupBox::title {
-                color: #2c6b7d;
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 8px 0 8px;
-                font-size: 15px;
-                font-weight: bold;
-                background: white;
-                border-radius: 6px;
-            }
-        """)
+        setup_group.setStyleSheet(_CAMERA_SETUP_GROUP_QSS)
         setup_layout = QVBoxLayout(setup_group)
         setup_layout.setSpacing(25)  # Increased spacing to prevent cramping
         setup_layout.setContentsMargins(15, 15, 15, 15)  # Add margins for breathing room
@@ -6558,19 +7049,7 @@ cameras:
         )
         info_label.setWordWrap(True)
         info_label.setAlignment(Qt.AlignCenter)  # Center the info text
-        info_label.setStyleSheet("""
-            QLabel {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #f0f7ff, stop:0.5 #e8f2ff, stop:1 #e8f5e8);
-                color: #2c3e50;
-                padding: 18px;
-                border-radius: 12px;
-                font-size: 14px;
-                font-weight: 600;
-                border: 2px solid #a8c8e8;
-                margin: 8px 2px;
-            }
-        """)
+        info_label.setObjectName("cameraSetupInfo")
         setup_layout.addWidget(info_label)
         
         # Camera Setup Guide section (FIRST - for learning how to setup cameras)
@@ -6591,27 +7070,7 @@ cameras:
         self.camera_guide_btn.setMaximumWidth(250)  # Prevent excessive stretching
         self.camera_guide_btn.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
         self.camera_guide_btn.clicked.connect(self.show_camera_setup_guide)
-        self.camera_guide_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #007bff, stop:1 #0056b3);
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 14px 20px;
-                font-size: 14px;
-                font-weight: 600;
-                margin: 4px 0px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #0084ff, stop:1 #0062cc);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #0062cc, stop:1 #004a9f);
-            }
-        """)
+        self.camera_guide_btn.setObjectName("cameraGuideButton")
         
         # Guide description - with responsive text wrapping
         guide_description = QLabel(
@@ -6619,17 +7078,7 @@ cameras:
         )
         guide_description.setWordWrap(True)
         guide_description.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        guide_description.setStyleSheet("""
-            QLabel {
-                background: #e8f4fd;
-                color: #0f766e;
-                padding: 12px 15px;
-                border-radius: 8px;
-                font-size: 13px;
-                border: 1px solid #bfdbfe;
-                margin-left: 10px;
-            }
-        """)
+        guide_description.setObjectName("cameraGuideStep")
         
         guide_row_layout.addWidget(self.camera_guide_btn)
         guide_row_layout.addWidget(guide_description, 1)  # Stretch factor 1
@@ -6658,32 +7107,7 @@ cameras:
         self.setup_cameras_btn.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
         self.setup_cameras_btn.clicked.connect(self.open_simple_camera_gui)
         self.setup_cameras_btn.setEnabled(False)  # Disabled during initialization
-        self.setup_cameras_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #48bb78, stop:1 #38a169);
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 16px 24px;
-                font-size: 16px;
-                font-weight: 600;
-                margin: 4px 0px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #4bc985, stop:1 #3fba7a);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #3fba7a, stop:1 #309656);
-            }
-            QPushButton:disabled {
-                background: #d4edda;
-                color: #6c757d;
-                border: 2px solid #c3e6cb;
-            }
-        """)
+        self.setup_cameras_btn.setObjectName("setupCamerasButton")
         
         # Add the button to the layout!
         setup_button_layout.addWidget(self.setup_cameras_btn)
@@ -6701,17 +7125,7 @@ cameras:
         setup_description.setWordWrap(True)
         setup_description.setAlignment(Qt.AlignCenter)
         setup_description.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        setup_description.setStyleSheet("""
-            QLabel {
-                background: #f0f9f0;
-                color: #166534;
-                padding: 12px 15px;
-                border-radius: 8px;
-                font-size: 13px;
-                border: 1px solid #bbf7d0;
-                margin: 10px 0px;
-            }
-        """)
+        setup_description.setObjectName("setupCamerasStep")
         
         setup_container_layout.addWidget(setup_description)
         setup_layout.addWidget(setup_container)
@@ -6732,41 +7146,18 @@ cameras:
         
         # Start Frigate button (65% width)
         self.preconfigured_start_btn = QPushButton("▶️ Start Frigate")
-        self.preconfigured_start_btn.clicked.connect(lambda: self.docker_action('start'))
+        self.preconfigured_start_btn.clicked.connect(self._start_frigate)
         self.preconfigured_start_btn.setMinimumHeight(45)
         self.preconfigured_start_btn.setToolTip("Start Frigate container")
         self.preconfigured_start_btn.setEnabled(False)  # Disabled during initialization
         
         # Stop Frigate button (35% width) 
         self.preconfigured_stop_btn = QPushButton("⏹️ Stop")
-        self.preconfigured_stop_btn.clicked.connect(lambda: self.docker_action('remove'))
+        self.preconfigured_stop_btn.clicked.connect(self._remove_frigate)
         self.preconfigured_stop_btn.setMinimumHeight(45)
         self.preconfigured_stop_btn.setToolTip("Stop and remove Frigate container completely")
         self.preconfigured_stop_btn.setEnabled(False)  # Disabled during initialization
-        self.preconfigured_stop_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #f87171, stop:1 #ef4444);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 14px 16px;
-                font-weight: 600;
-                font-size: 14px;
-                font-family: 'Segoe UI', 'Inter', sans-serif;
-            }
-            QPushButton:hover:enabled {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #fca5a5, stop:1 #f87171);
-            }
-            QPushButton:pressed {
-                background: #dc2626;
-            }
-            QPushButton:disabled {
-                background: #a0aec0;
-                color: #718096;
-            }
-        """)
+        self.preconfigured_stop_btn.setStyleSheet(_STOP_BTN_QSS)
         
         # Add buttons with stretch factors (65% and 35%)
         docker_buttons_layout.addWidget(self.preconfigured_start_btn, 65)
@@ -6781,9 +7172,6 @@ cameras:
         self.preconfigured_open_ui_btn.setToolTip("Open Frigate Web UI (enabled only when Frigate is running)")
         self.preconfigured_open_ui_btn.setEnabled(False)  # Disabled during initialization
         
-        # Store the original style for proper restoration after highlighting
-        self._web_ui_btn_original_style = self.preconfigured_open_ui_btn.styleSheet()
-        
         actions_layout.addWidget(self.preconfigured_open_ui_btn)
         left_layout.addWidget(actions_group)
         
@@ -6830,13 +7218,11 @@ cameras:
         system_info_layout.setSpacing(6)  # Tighter spacing
         system_info_layout.setContentsMargins(8, 8, 8, 8)  # Smaller margins for compact sidebar
         
-        # Add system details (reusing code from overview tab)
-        import platform
-        
+        # Add system details (same cached values as the overview tab)
         system_info_layout.addRow("Config Path:", QLabel(os.path.join(self.script_dir, "frigate", "config")))
-        system_info_layout.addRow("Operating System:", QLabel(f"{platform.system()} {platform.release()}"))
-        system_info_layout.addRow("Architecture:", QLabel(platform.machine()))
-        system_info_layout.addRow("Python Version:", QLabel(platform.python_version()))
+        system_info_layout.addRow("Operating System:", QLabel(_SYS_OS))
+        system_info_layout.addRow("Architecture:", QLabel(_SYS_ARCH))
+        system_info_layout.addRow("Python Version:", QLabel(_SYS_PY))
         
         right_layout.addWidget(system_info_group)
         
@@ -6852,18 +7238,7 @@ cameras:
             "⚠️ If Frigate isn't working as expected, check the logs for detailed information."
         )
         troubleshooting_message.setWordWrap(True)
-        troubleshooting_message.setStyleSheet("""
-            QLabel {
-                background: #fffbf5;
-                color: #fb923c;
-                padding: 10px;
-                border-radius: 6px;
-                font-size: 12px;
-                font-weight: 500;
-                border: 2px solid #fde4cc;
-                margin: 2px 0px;
-            }
-        """)
+        troubleshooting_message.setObjectName("troubleshootingMessage")
         
         # Button to go to Docker logs - more compact for sidebar and left-aligned
         button_container = QWidget()
@@ -6876,26 +7251,7 @@ cameras:
         self.view_logs_btn.setMinimumHeight(35)
         self.view_logs_btn.setMaximumWidth(120)  # Limit width to make it smaller
         self.view_logs_btn.setToolTip("Open Advanced Settings → Docker Logs to view detailed Frigate logs")
-        self.view_logs_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #fb923c, stop:1 #f97316);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 12px;
-                font-weight: 600;
-                margin: 4px 0px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #fdba74, stop:1 #fb923c);
-            }
-            QPushButton:pressed {
-                background: #ea580c;
-            }
-        """)
+        self.view_logs_btn.setObjectName("viewLogsButton")
         
         button_layout.addWidget(self.view_logs_btn)
         button_layout.addStretch()  # Push button to the left
@@ -6928,41 +7284,7 @@ cameras:
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setFrameShape(QFrame.NoFrame)  # Remove frame for cleaner look
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollArea > QWidget > QWidget {
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: #f0f0f0;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: #4a90a4;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #38758a;
-            }
-            QScrollBar:horizontal {
-                background: #f0f0f0;
-                height: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #4a90a4;
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #38758a;
-            }
-        """)
+        scroll_area.setStyleSheet(_TRANSPARENT_SCROLL_QSS)
         layout.addWidget(scroll_area)
         
         # Update status on tab creation - reuse existing check_status method
@@ -6971,11 +7293,10 @@ cameras:
         # Update button states after tab creation
         QTimer.singleShot(1000, self.update_preconfigured_button_states)  # Check container status after tab loads
         
-        # Set up auto-refresh timer for PreConfigured tab (every 30 seconds to reduce CPU usage)
-        self.preconfigured_refresh_timer = QTimer()
-        self.preconfigured_refresh_timer.timeout.connect(self.update_preconfigured_status)
-        self.preconfigured_refresh_timer.setInterval(30000)  # 30 seconds
-        self.preconfigured_refresh_timer.start()
+        # Refresh when the Frigate container changes state, rather than polling for it
+        self._docker_events_worker = DockerEventsWorker()
+        self._docker_events_worker.container_changed.connect(self._on_frigate_container_changed)
+        self._docker_events_worker.start()
         
         return widget
     
@@ -7004,9 +7325,16 @@ cameras:
         # Manual setup sub-tabs
         self.manual_tab_widget = QTabWidget()
         
-        # Add Prerequisites and Frigate Setup tabs
+        # Add Prerequisites and Frigate Setup tabs. Frigate Setup (which checks the repository as it
+        # is built) starts as a placeholder and is built the first time it is selected
         self.manual_tab_widget.addTab(self.create_prerequisites_tab(), "🔧 Prerequisites")
-        self.manual_tab_widget.addTab(self.create_setup_tab(), "⚙️ Frigate Setup")
+        placeholder_setup = QLabel("Loading Frigate Setup...")
+        placeholder_setup.setAlignment(Qt.AlignCenter)
+        placeholder_setup.setStyleSheet(_TAB_PLACEHOLDER_QSS)
+        self.manual_tab_widget.addTab(placeholder_setup, "⚙️ Frigate Setup")
+        self._manual_tab_builders = {1: (self.create_setup_tab, "⚙️ Frigate Setup")}
+        self.manual_tab_widget.currentChanged.connect(
+            lambda index: self._on_sub_tab_changed(self.manual_tab_widget, self._manual_tab_builders, index))
         
         container_layout.addWidget(self.manual_tab_widget)
         
@@ -7017,41 +7345,7 @@ cameras:
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setFrameShape(QFrame.NoFrame)  # Remove frame for cleaner look
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollArea > QWidget > QWidget {
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: #f0f0f0;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: #4a90a4;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #38758a;
-            }
-            QScrollBar:horizontal {
-                background: #f0f0f0;
-                height: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #4a90a4;
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #38758a;
-            }
-        """)
+        scroll_area.setStyleSheet(_TRANSPARENT_SCROLL_QSS)
         layout.addWidget(scroll_area)
         
         return widget
@@ -7081,10 +7375,20 @@ cameras:
         # Advanced settings sub-tabs (all the original functionality)
         self.advanced_tab_widget = QTabWidget()
         
-        # Add remaining advanced tabs (Prerequisites and Frigate Setup moved to Manual Setup tab, Overview tab removed)
+        # Add remaining advanced tabs (Prerequisites and Frigate Setup moved to Manual Setup tab, Overview tab removed).
+        # Docker Manager and Docker Logs start as placeholders and are built the first time they are selected
         self.advanced_tab_widget.addTab(self.create_config_tab(), "🎛️ Configuration")
-        self.advanced_tab_widget.addTab(self.create_docker_manager_tab(), "🐳 Docker Manager")
-        self.advanced_tab_widget.addTab(self.create_logs_tab(), "📋 Docker Logs")
+        self._advanced_tab_builders = {
+            1: (self._build_docker_manager_tab, "🐳 Docker Manager"),
+            2: (self.create_logs_tab, "📋 Docker Logs"),
+        }
+        for index, (_, tab_title) in self._advanced_tab_builders.items():
+            placeholder = QLabel(f"Loading {tab_title.split(' ', 1)[1]}...")
+            placeholder.setAlignment(Qt.AlignCenter)
+            placeholder.setStyleSheet(_TAB_PLACEHOLDER_QSS)
+            self.advanced_tab_widget.insertTab(index, placeholder, tab_title)
+        self.advanced_tab_widget.currentChanged.connect(
+            lambda index: self._on_sub_tab_changed(self.advanced_tab_widget, self._advanced_tab_builders, index))
         
         container_layout.addWidget(self.advanced_tab_widget)
         
@@ -7095,41 +7399,7 @@ cameras:
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setFrameShape(QFrame.NoFrame)  # Remove frame for cleaner look
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollArea > QWidget > QWidget {
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: #f0f0f0;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: #4a90a4;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #38758a;
-            }
-            QScrollBar:horizontal {
-                background: #f0f0f0;
-                height: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #4a90a4;
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #38758a;
-            }
-        """)
+        scroll_area.setStyleSheet(_TRANSPARENT_SCROLL_QSS)
         layout.addWidget(scroll_area)
         return widget
     
@@ -7142,55 +7412,15 @@ cameras:
         except:
             return False
     
+    @Slot()
     def check_status(self):
         """Check system status using background thread to avoid UI blocking"""
         # Use background worker instead of blocking subprocess calls
         self.start_background_status_check()
     
-    def update_system_monitoring(self):
-        """Update system monitoring labels for both Overview and Docker Manager tabs"""
-        if not PSUTIL_AVAILABLE:
-            return
-        
-        try:
-            import psutil
-            
-            # Get CPU usage
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            cpu_text = f"{cpu_percent:.1f}%"
-            
-            # Get memory usage
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-            memory_used_gb = memory.used / (1024**3)
-            memory_total_gb = memory.total / (1024**3)
-            memory_text = f"{memory_percent:.1f}% ({memory_used_gb:.1f} GB / {memory_total_gb:.1f} GB)"
-            
-            # Update Overview tab labels (if they exist)
-            if hasattr(self, 'cpu_usage_label'):
-                self.cpu_usage_label.setText(cpu_text)
-            if hasattr(self, 'memory_usage_label'):
-                self.memory_usage_label.setText(memory_text)
-            if hasattr(self, 'disk_usage_label'):
-                # Get disk usage for the script directory
-                disk_usage = psutil.disk_usage(self.script_dir)
-                disk_percent = (disk_usage.used / disk_usage.total) * 100
-                disk_used_gb = disk_usage.used / (1024**3)
-                disk_total_gb = disk_usage.total / (1024**3)
-                disk_text = f"{disk_percent:.1f}% ({disk_used_gb:.1f} GB / {disk_total_gb:.1f} GB)"
-                self.disk_usage_label.setText(disk_text)
-                
-        except Exception as e:
-            # Handle any errors gracefully
-            error_text = f"❌ Error: {str(e)[:20]}..."
-            
-            # Update Overview tab labels with error
-            if hasattr(self, 'cpu_usage_label'):
-                self.cpu_usage_label.setText(error_text)
-            if hasattr(self, 'memory_usage_label'):
-                self.memory_usage_label.setText(error_text)
-            if hasattr(self, 'disk_usage_label'):
-                self.disk_usage_label.setText(error_text)
+    def _disk_usage(self):
+        """Disk usage of the install directory, statted at most once per _DISK_USAGE_TTL"""
+        return self._sys_cache.get('disk', _DISK_USAGE_TTL, lambda: psutil.disk_usage(self.script_dir))
     
     def get_memryx_devices(self):
         """Get MemryX devices with caching to improve performance"""
@@ -7222,13 +7452,13 @@ cameras:
         
         if not os.path.exists(frigate_path):
             self.repo_status_label.setText("❌ No Frigate repository found")
-            self.repo_status_label.setStyleSheet("background: #fbeaea; color: #6b3737; padding: 8px; border-radius: 6px;")
+            self.repo_status_label.setStyleSheet(_STATUS_ERROR_QSS)
             return
         
         git_dir = os.path.join(frigate_path, '.git')
         if not os.path.exists(git_dir):
             self.repo_status_label.setText("⚠️ Frigate directory exists but is not a git repository")
-            self.repo_status_label.setStyleSheet("background: #fdf6e3; color: #8b7355; padding: 8px; border-radius: 6px;")
+            self.repo_status_label.setStyleSheet(_STATUS_WARNING_QSS)
             return
         
         try:
@@ -7237,7 +7467,7 @@ cameras:
                                   cwd=frigate_path, capture_output=True, text=True)
             if result.returncode != 0:
                 self.repo_status_label.setText("❌ Git repository is corrupted")
-                self.repo_status_label.setStyleSheet("background: #fbeaea; color: #6b3737; padding: 8px; border-radius: 6px;")
+                self.repo_status_label.setStyleSheet(_STATUS_ERROR_QSS)
                 return
             
             # Check for local changes
@@ -7268,11 +7498,11 @@ cameras:
             status_text += f"Remote status: {fetch_status}"
             
             self.repo_status_label.setText(status_text)
-            self.repo_status_label.setStyleSheet("background: #e8f4f0; color: #2d5a4a; padding: 8px; border-radius: 6px;")
+            self.repo_status_label.setStyleSheet(_STATUS_OK_QSS)
             
         except Exception as e:
             self.repo_status_label.setText(f"❌ Error checking repository: {str(e)}")
-            self.repo_status_label.setStyleSheet("background: #fbeaea; color: #6b3737; padding: 8px; border-radius: 6px;")
+            self.repo_status_label.setStyleSheet(_STATUS_ERROR_QSS)
         
         # Update guidance after checking status
         if hasattr(self, 'step2_guidance'):
@@ -7280,6 +7510,9 @@ cameras:
     
     def install_frigate(self, action_type='skip_frigate'):
         """Start the installation process with specified action type"""
+        if self._worker_running('worker'):
+            return
+        
         # Clear progress and show action being performed
         self.install_progress.clear()
         
@@ -7288,23 +7521,23 @@ cameras:
             'update_only': "🔄 Starting Frigate repository update process...",
         }
         
-        self.install_progress.append(action_descriptions.get(action_type, "Starting installation..."))
+        self.append_install_progress(action_descriptions.get(action_type, "Starting installation..."))
         
         # Enhanced validation for repository actions
         frigate_path = os.path.join(self.script_dir, 'frigate')
         
         if action_type == 'clone_only':
-            self.install_progress.append("📋 Cloning fresh Frigate repository...")
+            self.append_install_progress("📋 Cloning fresh Frigate repository...")
             if os.path.exists(frigate_path):
-                self.install_progress.append("⚠️  Existing Frigate directory will be removed and replaced.")
+                self.append_install_progress("⚠️  Existing Frigate directory will be removed and replaced.")
         
         if action_type == 'update_only':
-            self.install_progress.append("📋 Updating existing Frigate repository...")
+            self.append_install_progress("📋 Updating existing Frigate repository...")
             if not os.path.exists(frigate_path):
                 QMessageBox.warning(self, "Cannot Update", 
                                   "❌ No Frigate repository found to update.\n\n"
                                   "Please use 'Clone Fresh Repository' instead to download Frigate for the first time.")
-                self.install_progress.append("❌ Update aborted: No repository found")
+                self.append_install_progress("❌ Update aborted: No repository found")
                 return
             
             git_dir = os.path.join(frigate_path, '.git')
@@ -7312,10 +7545,10 @@ cameras:
                 QMessageBox.warning(self, "Cannot Update", 
                                   "❌ Frigate directory exists but is not a git repository.\n\n"
                                   "Please use 'Clone Fresh Repository' instead to fix this issue.")
-                self.install_progress.append("❌ Update aborted: Invalid repository")
+                self.append_install_progress("❌ Update aborted: Invalid repository")
                 return
             
-            self.install_progress.append("✅ Valid repository found, proceeding with update...")
+            self.append_install_progress("✅ Valid repository found, proceeding with update...")
         
         # Disable buttons during operation
         if hasattr(self, 'clone_frigate_btn'):
@@ -7334,7 +7567,7 @@ cameras:
         if message == "UPDATE_CONFIG_MTIME":
             # Special signal to update config file mtime after creating default config
             # This prevents the reload popup when we automatically create the config
-            config_path = os.path.join(self.script_dir, "frigate", "config", "config.yaml")
+            config_path = self._config_path
             if os.path.exists(config_path):
                 try:
                     self.config_file_mtime = os.path.getmtime(config_path)
@@ -7342,7 +7575,7 @@ cameras:
                     pass  # Silently handle any errors
         else:
             # Normal progress message, append to log
-            self.install_progress.append(message)
+            self.append_install_progress(message)
     
     def on_install_finished(self, success):
         # Re-enable buttons
@@ -7352,12 +7585,12 @@ cameras:
             self.update_frigate_btn.setEnabled(True)
         
         if success:
-            self.install_progress.append("🎉 Operation completed successfully!")
+            self.append_install_progress("🎉 Operation completed successfully!")
             QMessageBox.information(self, "Success", 
                                   "✅ Setup completed successfully!\n\n"
                                   "You can now proceed to the next steps or configure Frigate.")
         else:
-            self.install_progress.append("💡 Please check the error messages above and try again.")
+            self.append_install_progress("💡 Please check the error messages above and try again.")
             QMessageBox.warning(self, "Error", 
                               "❌ Setup failed. Please check the progress log for details.\n\n"
                               "Common issues:\n"
@@ -7402,44 +7635,14 @@ cameras:
         if hasattr(self, 'operation_status_label'):
             if enabled:
                 self.operation_status_label.setText("🟢 Ready - All operations available")
-                self.operation_status_label.setStyleSheet("""
-                    QLabel {
-                        background: #e8f4f0;
-                        color: #2d5a4a;
-                        padding: 8px;
-                        border-radius: 6px;
-                        font-size: 11px;
-                        font-weight: bold;
-                        margin: 4px 0px;
-                    }
-                """)
+                self.operation_status_label.setStyleSheet(_OPERATION_READY_QSS)
             else:
                 if keep_stop_enabled:
                     self.operation_status_label.setText("🟡 Operation in progress - Stop button remains available")
-                    self.operation_status_label.setStyleSheet("""
-                        QLabel {
-                            background: #fef3c7;
-                            color: #92400e;
-                            padding: 8px;
-                            border-radius: 6px;
-                            font-size: 11px;
-                            font-weight: bold;
-                            margin: 4px 0px;
-                        }
-                    """)
+                    self.operation_status_label.setStyleSheet(_OPERATION_BUSY_STOPPABLE_QSS)
                 else:
                     self.operation_status_label.setText("🔴 Operation in progress - buttons disabled")
-                    self.operation_status_label.setStyleSheet("""
-                        QLabel {
-                            background: #fbeaea;
-                            color: #6b3737;
-                            padding: 8px;
-                            border-radius: 6px;
-                            font-size: 11px;
-                            font-weight: bold;
-                            margin: 4px 0px;
-                        }
-                    """)
+                    self.operation_status_label.setStyleSheet(_OPERATION_BUSY_QSS)
 
     def show_first_time_startup_info_if_needed(self):
         """Show first-time startup info only if this is the first time starting Frigate"""
@@ -7469,9 +7672,7 @@ cameras:
     def _check_container_exists_sync(self):
         """Synchronously check if Frigate container exists"""
         try:
-            result = subprocess.run(['docker', 'ps', '-a', '--filter', 'name=frigate', '--format', '{{.Names}}'], 
-                                  capture_output=True, text=True, timeout=10)
-            return 'frigate' in result.stdout
+            return bool(self._list_frigate_containers())
         except Exception:
             return False
 
@@ -7488,26 +7689,7 @@ cameras:
         layout.setContentsMargins(30, 30, 30, 30)
         
         # Icon and title
-        title_layout = QHBoxLayout()
-        
-        # Icon label
-        icon_label = QLabel("🚀")
-        icon_label.setStyleSheet("font-size: 32px;")
-        title_layout.addWidget(icon_label)
-        
-        # Title
-        title_label = QLabel("Starting Frigate...")
-        title_label.setStyleSheet("""
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 18px;
-            font-weight: 700;
-            color: #0694a2;
-            margin-left: 10px;
-        """)
-        title_layout.addWidget(title_label)
-        title_layout.addStretch()
-        
-        layout.addLayout(title_layout)
+        layout.addLayout(_build_header("🚀", "Starting Frigate..."))
         
         # Info text
         info_text = QLabel(
@@ -7569,6 +7751,16 @@ cameras:
             else:
                 return "🔒 Docker operation buttons disabled to prevent conflicts - please wait for current operation to complete"
             
+    @Slot()
+    def _start_frigate(self):
+        """Start the Frigate container (Start buttons and menu action)"""
+        self.docker_action('start')
+    
+    @Slot()
+    def _remove_frigate(self):
+        """Stop and remove the Frigate container (PreConfigured Box Stop button)"""
+        self.docker_action('remove')
+    
     def docker_action(self, action):
         # Check if application is still initializing
         if self.is_initializing:
@@ -7583,8 +7775,8 @@ cameras:
         if hasattr(self, 'docker_worker') and self.docker_worker is not None:
             if self.docker_worker.isRunning():
                 if hasattr(self, 'docker_progress'):
-                    self.docker_progress.append("⚠️ Another Docker operation is already in progress!")
-                    self.docker_progress.append("Please wait for the current operation to complete, or use Stop to cancel it.")
+                    self._append_progress_line(self.docker_progress, "⚠️ Another Docker operation is already in progress!")
+                    self._append_progress_line(self.docker_progress, "Please wait for the current operation to complete, or use Stop to cancel it.")
                 else:
                     QMessageBox.information(self, "Operation in Progress", 
                                           "Another Docker operation is already in progress!\n"
@@ -7601,6 +7793,7 @@ cameras:
         # Clear progress and show initial message
         if hasattr(self, 'docker_progress'):
             self.docker_progress.clear()
+        self._docker_progress_backlog.clear()
         
         # Store current action for completion message
         self.current_docker_action = action
@@ -7617,9 +7810,8 @@ cameras:
             'remove': "🗑️ Initiating Frigate container removal..."
         }
         
-        if hasattr(self, 'docker_progress'):
-            self.docker_progress.append(action_messages.get(action, f"Starting {action} operation..."))
-            self.docker_progress.append("=" * 50)  # Visual separator
+        self.append_docker_progress(action_messages.get(action, f"Starting {action} operation..."))
+        self.append_docker_progress("=" * 50)  # Visual separator
         
         # DISABLE BUTTONS TO PREVENT CONFLICTS
         # For non-stop operations, keep the Stop button enabled for emergency use
@@ -7627,15 +7819,14 @@ cameras:
         self.set_docker_buttons_enabled(False, keep_stop_enabled=keep_stop_enabled)
         
         # Also disable PreConfigured Box buttons during operation
-        if hasattr(self, 'preconfigured_start_btn'):
+        if self.preconfigured_start_btn is not None:
             self.preconfigured_start_btn.setEnabled(False)
-        if hasattr(self, 'preconfigured_stop_btn'):
+        if self.preconfigured_stop_btn is not None:
             # For stop operations, disable the stop button completely
             # For other operations, keep stop enabled for emergency use
             self.preconfigured_stop_btn.setEnabled(keep_stop_enabled)
             
-        if hasattr(self, 'docker_progress'):
-            self.docker_progress.append(self.get_operation_status_message(False, keep_stop_enabled=keep_stop_enabled))
+        self.append_docker_progress(self.get_operation_status_message(False, keep_stop_enabled=keep_stop_enabled))
         
         # Show confirmation for destructive actions
         if action in ['rebuild', 'remove']:
@@ -7653,12 +7844,10 @@ cameras:
             )
             
             if reply != QMessageBox.Yes:
-                if hasattr(self, 'docker_progress'):
-                    self.docker_progress.append("❌ Operation cancelled by user")
+                self.append_docker_progress("❌ Operation cancelled by user")
                 # RE-ENABLE BUTTONS IF USER CANCELS
                 self.set_docker_buttons_enabled(True)
-                if hasattr(self, 'docker_progress'):
-                    self.docker_progress.append(self.get_operation_status_message(True))
+                self.append_docker_progress(self.get_operation_status_message(True))
                 return
         
         # Create and start the worker
@@ -7678,7 +7867,7 @@ cameras:
 
     def update_preconfigured_button_state(self, state, operation_text=""):
         """Update the preconfigured Start/Stop Frigate button states with animation"""
-        if not hasattr(self, 'preconfigured_start_btn'):
+        if self.preconfigured_start_btn is None:
             return
             
         self.button_operation_state = state
@@ -7690,89 +7879,30 @@ cameras:
             self.preconfigured_start_btn.setEnabled(True)
             
             # Reset stop button to default state
-            if hasattr(self, 'preconfigured_stop_btn'):
+            if self.preconfigured_stop_btn is not None:
                 self.preconfigured_stop_btn.setText("⏹️ Stop")
-                self.preconfigured_stop_btn.setStyleSheet("""
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                            stop:0 #f87171, stop:1 #ef4444);
-                        color: white;
-                        border: none;
-                        border-radius: 8px;
-                        padding: 14px 16px;
-                        font-weight: 600;
-                        font-size: 14px;
-                        font-family: 'Segoe UI', 'Inter', sans-serif;
-                    }
-                    QPushButton:hover:enabled {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                            stop:0 #fca5a5, stop:1 #f87171);
-                    }
-                    QPushButton:pressed {
-                        background: #dc2626;
-                    }
-                    QPushButton:disabled {
-                        background: #a0aec0;
-                        color: #718096;
-                    }
-                """)
+                self.preconfigured_stop_btn.setStyleSheet(_STOP_BTN_QSS)
                 self.preconfigured_stop_btn.setEnabled(False)
             
         elif state == "building":
             self.button_base_text = "🔨 Building Image"
             self.button_animation_dots = 0
             self.preconfigured_start_btn.setEnabled(False)
-            self.preconfigured_start_btn.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                        stop:0 #ff9800, stop:1 #f57c00);
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 14px 16px;
-                    font-weight: 600;
-                    font-size: 14px;
-                    font-family: 'Segoe UI', 'Inter', sans-serif;
-                }
-            """)
+            self.preconfigured_start_btn.setStyleSheet(_START_BTN_BUILDING_QSS)
             self.button_animation_timer.start(500)  # Update every 500ms
             
         elif state == "starting":
             self.button_base_text = "🚀 Starting Frigate"
             self.button_animation_dots = 0
             self.preconfigured_start_btn.setEnabled(False)
-            self.preconfigured_start_btn.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                        stop:0 #2196f3, stop:1 #1976d2);
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 14px 16px;
-                    font-weight: 600;
-                    font-size: 14px;
-                    font-family: 'Segoe UI', 'Inter', sans-serif;
-                }
-            """)
+            self.preconfigured_start_btn.setStyleSheet(_START_BTN_STARTING_QSS)
             self.button_animation_timer.start(500)
             
         elif state == "starting_container":
             self.button_base_text = "🚀 Starting Container"
             self.button_animation_dots = 0
             self.preconfigured_start_btn.setEnabled(False)
-            self.preconfigured_start_btn.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                        stop:0 #4caf50, stop:1 #388e3c);
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 14px 16px;
-                    font-weight: 600;
-                    font-size: 14px;
-                    font-family: 'Segoe UI', 'Inter', sans-serif;
-                }
-            """)
+            self.preconfigured_start_btn.setStyleSheet(_START_BTN_RUNNING_QSS)
             self.button_animation_timer.start(500)
             
         elif state == "stopping":
@@ -7781,44 +7911,20 @@ cameras:
             self.preconfigured_start_btn.setEnabled(False)
             
             # Update stop button state during stopping
-            if hasattr(self, 'preconfigured_stop_btn'):
+            if self.preconfigured_stop_btn is not None:
                 self.stop_button_base_text = "🛑 Stopping"
                 self.preconfigured_stop_btn.setEnabled(False)
-                self.preconfigured_stop_btn.setStyleSheet("""
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                            stop:0 #ff5722, stop:1 #d84315);
-                        color: white;
-                        border: none;
-                        border-radius: 8px;
-                        padding: 14px 16px;
-                        font-weight: 600;
-                        font-size: 14px;
-                        font-family: 'Segoe UI', 'Inter', sans-serif;
-                    }
-                """)
+                self.preconfigured_stop_btn.setStyleSheet(_STOP_BTN_STOPPING_QSS)
             self.button_animation_timer.start(500)
             
         elif state == "running":
             self.button_animation_timer.stop()
             self.preconfigured_start_btn.setText("✅ Frigate Running")
-            self.preconfigured_start_btn.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                        stop:0 #4caf50, stop:1 #388e3c);
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 14px 16px;
-                    font-weight: 600;
-                    font-size: 14px;
-                    font-family: 'Segoe UI', 'Inter', sans-serif;
-                }
-            """)
+            self.preconfigured_start_btn.setStyleSheet(_START_BTN_RUNNING_QSS)
             self.preconfigured_start_btn.setEnabled(False)
             
             # Enable stop button when running
-            if hasattr(self, 'preconfigured_stop_btn'):
+            if self.preconfigured_stop_btn is not None:
                 self.preconfigured_stop_btn.setText("⏹️ Stop")
                 self.preconfigured_stop_btn.setEnabled(True)
                 
@@ -7829,26 +7935,14 @@ cameras:
             self.preconfigured_start_btn.setEnabled(True)
             
             # Update stop button to stopped state
-            if hasattr(self, 'preconfigured_stop_btn'):
+            if self.preconfigured_stop_btn is not None:
                 self.preconfigured_stop_btn.setText("✅ Stopped")
-                self.preconfigured_stop_btn.setStyleSheet("""
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                            stop:0 #6c757d, stop:1 #5a6268);
-                        color: white;
-                        border: none;
-                        border-radius: 8px;
-                        padding: 14px 16px;
-                        font-weight: 600;
-                        font-size: 14px;
-                        font-family: 'Segoe UI', 'Inter', sans-serif;
-                    }
-                """)
+                self.preconfigured_stop_btn.setStyleSheet(_STOP_BTN_STOPPED_QSS)
                 self.preconfigured_stop_btn.setEnabled(False)
 
     def update_button_animation(self):
         """Update button text with animated dots"""
-        if not hasattr(self, 'preconfigured_start_btn') or self.button_operation_state == "idle":
+        if self.preconfigured_start_btn is None or self.button_operation_state == "idle":
             return
             
         # Cycle through different numbers of dots (0, 1, 2, 3, then repeat)
@@ -7865,14 +7959,14 @@ cameras:
         
         # Update stop button animation during stopping state
         if (self.button_operation_state == "stopping" and 
-            hasattr(self, 'preconfigured_stop_btn') and 
+            self.preconfigured_stop_btn is not None and 
             hasattr(self, 'stop_button_base_text')):
             stop_animated_text = f"{self.stop_button_base_text}{dots}{padding}"
             self.preconfigured_stop_btn.setText(stop_animated_text)
 
     def on_docker_progress_for_button(self, text):
         """Handle docker progress updates for button state enhancement - simplified to only show 3 states"""
-        if not hasattr(self, 'preconfigured_start_btn'):
+        if self.preconfigured_start_btn is None:
             return
             
         # Only map specific progress messages to button states - ignore errors and warnings
@@ -7881,11 +7975,11 @@ cameras:
         # Progression: Starting Frigate -> Building Image -> Starting Container -> Running
         if ("building" in text_lower or "build" in text_lower) and "building image" not in text_lower:
             # Only switch to building if not already in that state
-            if hasattr(self, 'button_operation_state') and self.button_operation_state != "building":
+            if self.button_operation_state != "building":
                 self.update_preconfigured_button_state("building")
         elif ("starting" in text_lower or "creating" in text_lower) and "starting container" not in text_lower:
             # Only switch to starting container if currently building
-            if hasattr(self, 'button_operation_state') and self.button_operation_state in ["starting", "building", "starting_container"]:
+            if self.button_operation_state in ["starting", "building", "starting_container"]:
                 self.update_preconfigured_button_state("starting_container")
         elif "started successfully" in text_lower or "frigate is now running" in text_lower:
             self.update_preconfigured_button_state("running")
@@ -7903,11 +7997,15 @@ cameras:
         else:
             formatted_text = text
             
+        self.append_docker_progress(formatted_text)
+    
+    def append_docker_progress(self, message):
+        """Add a line to the Docker Manager console, holding it until the Docker Manager tab is built"""
         if hasattr(self, 'docker_progress'):
-            self.docker_progress.append(formatted_text)
+            self._append_progress_line(self.docker_progress, message)
         else:
-            # Print to console if no docker_progress widget available
-            print(f"Docker Progress: {formatted_text}")
+            self._docker_progress_backlog.append(message)
+            del self._docker_progress_backlog[:-_DOCKER_PROGRESS_MAX_LINES]
     
     def on_docker_finished(self, success):
         # Update button state based on completion - no error state, just reset to idle
@@ -7924,62 +8022,52 @@ cameras:
                 self.update_preconfigured_button_state("idle")
         
         # Add completion separator
-        if hasattr(self, 'docker_progress'):
-            self.docker_progress.append("=" * 50)
+        self.append_docker_progress("=" * 50)
         
         if success:
             # Check what operation was performed and provide specific messages
             if hasattr(self, 'current_docker_action'):
                 if self.current_docker_action == 'start':
-                    if hasattr(self, 'docker_progress'):
-                        self.docker_progress.append("🎉 Frigate Docker container started successfully!")
+                    self.append_docker_progress("🎉 Frigate Docker container started successfully!")
                     self.show_message_box(QMessageBox.Information, "Success", "Frigate Docker container started successfully!\n\nOpen Frigate Web UI to monitor.")
                 elif self.current_docker_action == 'stop':
-                    if hasattr(self, 'docker_progress'):
-                        self.docker_progress.append("🎉 Frigate Docker container stopped successfully!")
+                    self.append_docker_progress("🎉 Frigate Docker container stopped successfully!")
                     self.show_message_box(QMessageBox.Information, "Success", "Frigate Docker container stopped successfully!")
                 elif self.current_docker_action == 'restart':
-                    if hasattr(self, 'docker_progress'):
-                        self.docker_progress.append("🎉 Frigate Docker container restarted successfully!")
+                    self.append_docker_progress("🎉 Frigate Docker container restarted successfully!")
                     self.show_message_box(QMessageBox.Information, "Success", "Frigate Docker container restarted successfully!\n\nOpen Frigate Web UI to monitor.")
                 elif self.current_docker_action == 'rebuild':
-                    if hasattr(self, 'docker_progress'):
-                        self.docker_progress.append("🎉 Frigate Docker container rebuilt successfully!")
+                    self.append_docker_progress("🎉 Frigate Docker container rebuilt successfully!")
                     self.show_message_box(QMessageBox.Information, "Success", "Frigate Docker container rebuilt successfully!")
                 elif self.current_docker_action == 'remove':
-                    if hasattr(self, 'docker_progress'):
-                        self.docker_progress.append("🎉 Frigate Docker container stopped and removed successfully!")
+                    self.append_docker_progress("🎉 Frigate Docker container stopped and removed successfully!")
                     self.show_message_box(QMessageBox.Information, "Success", "Frigate Docker container stopped and removed successfully!")
                     # Set stopped state for buttons
-                    if hasattr(self, 'preconfigured_start_btn'):
+                    if self.preconfigured_start_btn is not None:
                         QTimer.singleShot(500, lambda: self.update_preconfigured_button_state("stopped"))
                 else:
                     # Fallback for unknown operations
-                    if hasattr(self, 'docker_progress'):
-                        self.docker_progress.append("🎉 Docker operation completed successfully!")
+                    self.append_docker_progress("🎉 Docker operation completed successfully!")
                     self.show_message_box(QMessageBox.Information, "Success", "Docker operation completed successfully!")
             else:
                 # Fallback if no action stored
-                if hasattr(self, 'docker_progress'):
-                    self.docker_progress.append("🎉 Docker operation completed successfully!")
+                self.append_docker_progress("🎉 Docker operation completed successfully!")
                 self.show_message_box(QMessageBox.Information, "Success", "Docker operation completed successfully!")
         else:
-            if hasattr(self, 'docker_progress'):
-                self.docker_progress.append("❌ Docker operation failed. Check the logs above for details.")
+            self.append_docker_progress("❌ Docker operation failed. Check the logs above for details.")
             self.show_message_box(QMessageBox.Warning, "Error", "Docker operation failed. Please check the logs.")
         
         # RE-ENABLE ALL BUTTONS AFTER OPERATION COMPLETES
         self.set_docker_buttons_enabled(True)
         
         # Re-enable PreConfigured Box buttons and update their states
-        if hasattr(self, 'preconfigured_start_btn'):
+        if self.preconfigured_start_btn is not None:
             self.preconfigured_start_btn.setEnabled(True)
         
-        if hasattr(self, 'docker_progress'):
-            self.docker_progress.append(self.get_operation_status_message(True))
+        self.append_docker_progress(self.get_operation_status_message(True))
         
         # Update PreConfigured Box button states after operation
-        if hasattr(self, 'preconfigured_start_btn') and hasattr(self, 'preconfigured_stop_btn'):
+        if self.preconfigured_start_btn is not None and self.preconfigured_stop_btn is not None:
             QTimer.singleShot(1000, self.update_preconfigured_button_states)  # Update after 1 second delay
         
         # CLEAN UP WORKER THREAD
@@ -8003,8 +8091,8 @@ cameras:
         
         # Only update layouts if not in initialization phase
         if not getattr(self, 'is_initializing', True):
-            # Use QTimer to defer the update and avoid blocking during resize
-            QTimer.singleShot(50, self.update_responsive_layouts)
+            # Restarting the timer defers the update until the resize drag pauses
+            self._responsive_layout_timer.start(50)
     
     def update_responsive_layouts(self):
         """Update responsive container layouts based on current window size"""
@@ -8016,10 +8104,12 @@ cameras:
         new_horizontal = max(20, int(window_size.width() * 0.05))   # 5% each side = 10% total, min 20px
         new_vertical = max(15, int(window_size.height() * 0.05))    # 5% each side = 10% total, min 15px
         
-        # Update all registered responsive containers
+        margins = QMargins(new_horizontal, new_vertical, new_horizontal, new_vertical)
+        
+        # Update all registered responsive containers (skipping unchanged ones, which would still relayout)
         for tab_name, layout in self.responsive_containers:
-            if layout and not layout.parent().isHidden():  # Only update visible layouts
-                layout.setContentsMargins(new_horizontal, new_vertical, new_horizontal, new_vertical)
+            if layout and not layout.parent().isHidden() and layout.contentsMargins() != margins:
+                layout.setContentsMargins(margins)
     
     def changeEvent(self, event):
         """Handle window state changes (minimize, maximize, restore)"""
@@ -8029,7 +8119,11 @@ cameras:
         if event.type() == QEvent.WindowStateChange:
             # Update layouts after a short delay to ensure window is fully restored
             if not self.isMinimized():
-                QTimer.singleShot(100, self.update_responsive_layouts)
+                self._responsive_layout_timer.start(100)
+                self.resume_preconfigured_refresh()
+            else:
+                # No point refreshing the status of a window nobody can see
+                self.pause_preconfigured_refresh()
     
     def showEvent(self, event):
         """Handle window show events"""
@@ -8037,7 +8131,16 @@ cameras:
         
         # Update layouts when window is shown
         if not getattr(self, 'is_initializing', True):
-            QTimer.singleShot(50, self.update_responsive_layouts)
+            self._responsive_layout_timer.start(50)
+        
+        self.resume_preconfigured_refresh()
+    
+    def hideEvent(self, event):
+        """Handle window hide events"""
+        super().hideEvent(event)
+        
+        # Hidden windows (e.g. minimized to the tray) do not need status refreshes
+        self.pause_preconfigured_refresh()
     
     def closeEvent(self, event):
         """Handle application close event - clean up worker threads"""
@@ -8058,10 +8161,21 @@ cameras:
                 self.status_timer.stop()
             if hasattr(self, 'config_watcher_timer'):
                 self.config_watcher_timer.stop()
-            if hasattr(self, 'logs_timer'):
-                self.logs_timer.stop()
-            if hasattr(self, 'preconfigured_refresh_timer'):
-                self.preconfigured_refresh_timer.stop()
+            
+            # Stop watching Frigate container events
+            if self._docker_events_worker is not None:
+                self._docker_events_worker.stop()
+                self._docker_events_worker.wait(2000)
+                self._docker_events_worker = None
+            
+            # Stop following the container log
+            if self._docker_logs_worker is not None:
+                self._docker_logs_worker.requestInterruption()
+                self._docker_logs_worker.wait(2000)
+                self._docker_logs_worker = None
+            
+            # Release the persistent Docker API connection
+            self._docker_client.close()
                 
         except Exception as e:
             print(f"Error during cleanup: {e}")
@@ -8069,6 +8183,11 @@ cameras:
         # Accept the close event
         event.accept()
     
+    @Slot()
+    def _goto_manual_setup(self):
+        """Switch to the Manual Setup tab"""
+        self.main_tab_widget.setCurrentIndex(1)
+    
     def open_web_ui(self):
         subprocess.Popen(['xdg-open', 'http://localhost:5000'])
     
@@ -8081,7 +8200,8 @@ cameras:
                 "The application is still initializing. Please wait for the initialization to complete."
             )
             return
-            
+        
+        ConfigGUI = _load_config_gui()
         if ConfigGUI is None:
             self.show_message_box(
                 QMessageBox.Critical, 'Advanced Config GUI Unavailable',
@@ -8104,12 +8224,12 @@ cameras:
             )
     
     def edit_config_manual(self):
-        config_path = os.path.join(self.script_dir, "frigate", "config", "config.yaml")
+        config_path = self._config_path
         subprocess.Popen(['xdg-open', config_path])
     
     def save_config(self):
         """Save the configuration from the editor to the config file"""
-        config_path = os.path.join(self.script_dir, "frigate", "config", "config.yaml")
+        config_path = self._config_path
         
         try:
             # Ensure the config directory exists
@@ -8137,8 +8257,7 @@ cameras:
                 shutil.copy2(config_path, backup_path)
             
             # Save the new configuration
-            with open(config_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            _atomic_write(config_path, content)
             
             # Update the tracked modification time after saving
             self.config_file_mtime = os.path.getmtime(config_path)
@@ -8164,45 +8283,25 @@ cameras:
         if self.config_is_read_only:
             # Switch to edit mode
             self.config_preview.setReadOnly(False)
+            self.config_preview.setUndoRedoEnabled(True)
             self.config_is_read_only = False
             self.edit_config_btn.setText("👁️ View")
             self.edit_config_btn.setToolTip("Switch to read-only view mode")
             self.save_config_btn.setEnabled(True)
             
             # Update styling for edit mode
-            self.config_preview.setStyleSheet("""
-                QTextEdit {
-                    background: #ffffff;
-                    border: 2px solid #28a745;
-                    border-radius: 6px;
-                    font-family: 'Consolas', 'Monaco', 'Liberation Mono', monospace;
-                    font-size: 13px;
-                    color: #2d3748;
-                    padding: 12px;
-                    line-height: 1.5;
-                }
-            """)
+            self.config_preview.setStyleSheet(_CONFIG_EDITOR_EDIT_QSS)
         else:
             # Switch to read-only mode
             self.config_preview.setReadOnly(True)
+            self.config_preview.setUndoRedoEnabled(False)
             self.config_is_read_only = True
             self.edit_config_btn.setText("✏️ Edit")
             self.edit_config_btn.setToolTip("Switch to edit mode to modify the configuration")
             self.save_config_btn.setEnabled(False)
             
             # Update styling for read-only mode
-            self.config_preview.setStyleSheet("""
-                QTextEdit {
-                    background: #f8f9fa;
-                    border: 1px solid #cbd5e0;
-                    border-radius: 6px;
-                    font-family: 'Consolas', 'Monaco', 'Liberation Mono', monospace;
-                    font-size: 13px;
-                    color: #495057;
-                    padding: 12px;
-                    line-height: 1.5;
-                }
-            """)
+            self.config_preview.setStyleSheet(_CONFIG_EDITOR_VIEW_QSS)
     
     def check_prerequisites(self):
         """Check basic prerequisites - only if widgets exist (for backward compatibility)"""
@@ -8215,22 +8314,37 @@ cameras:
                 result = subprocess.run(['which', tool], capture_output=True)
                 if result.returncode == 0:
                     label.setText("✅ Installed")
-                    label.setStyleSheet("background: #e8f4f0; color: #2d5a4a;")
+                    label.setStyleSheet(_CHECK_OK_QSS)
                 else:
                     label.setText("❌ Missing")
-                    label.setStyleSheet("background: #fbeaea; color: #6b3737;")
+                    label.setStyleSheet(_CHECK_MISSING_QSS)
+    
+    def set_config_preview_text(self, content):
+        """Load content into the config editor, skipping the document rebuild if it's already shown"""
+        content_hash = hash(content)
+        # Hash comparison avoids an O(n) toPlainText(); the modified flag catches manual edits
+        if content_hash == self._config_preview_hash and not self.config_preview.document().isModified():
+            return
+        # Replace the text on the document directly, with undo off so the old text isn't kept as a snapshot
+        doc = self.config_preview.document()
+        undo_enabled = doc.isUndoRedoEnabled()
+        doc.setUndoRedoEnabled(False)
+        doc.setPlainText(content)
+        doc.setUndoRedoEnabled(undo_enabled)
+        doc.setModified(False)
+        self._config_preview_hash = content_hash
     
     def load_config_preview(self):
-        config_path = os.path.join(self.script_dir, "frigate", "config", "config.yaml")
+        config_path = self._config_path
         if os.path.exists(config_path):
             try:
                 with open(config_path, 'r', encoding='utf-8') as f:
                     content = f.read()
-                    self.config_preview.setPlainText(content)
+                    self.set_config_preview_text(content)
                 # Update the tracked modification time
                 self.config_file_mtime = os.path.getmtime(config_path)
             except Exception as e:
-                self.config_preview.setPlainText(f"Error loading configuration file:\n{str(e)}")
+                self.set_config_preview_text(f"Error loading configuration file:\n{str(e)}")
         else:
             # Show a default configuration template if no config exists
             default_config = """# Frigate Configuration
@@ -8304,7 +8418,7 @@ version: 0.17-0
 # For more configuration options, visit:
 # https://docs.frigate.video/configuration/
 """
-            self.config_preview.setPlainText(default_config)
+            self.set_config_preview_text(default_config)
             self.config_file_mtime = 0  # No file exists yet
         
         # Ensure read-only state is maintained after reload
@@ -8317,7 +8431,7 @@ version: 0.17-0
         if self.suppress_config_change_popup:
             return
             
-        config_path = os.path.join(self.script_dir, "frigate", "config", "config.yaml")
+        config_path = self._config_path
         
         if os.path.exists(config_path):
             try:
@@ -8342,7 +8456,7 @@ version: 0.17-0
                         )
                         
                         if reply == QMessageBox.Yes:
-                            self.config_preview.setPlainText(file_content)
+                            self.set_config_preview_text(file_content)
                             self.config_file_mtime = current_mtime
                         else:
                             # User chose not to reload, update mtime to avoid asking again
@@ -8359,45 +8473,22 @@ version: 0.17-0
             # File was deleted externally
             self.config_file_mtime = 0
     
-    def refresh_logs(self):
-        try:
-            # Get recent logs (last 200 lines to show more context)
-            result = subprocess.run(['docker', 'logs', '--tail', '200', 'frigate'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                new_text = result.stdout
-                current_text = self.logs_display.toPlainText()
-                
-                # Only update if text has changed
-                if new_text != current_text:
-                    # Check if this is new content being appended or completely different content
-                    if current_text and new_text.startswith(current_text):
-                        # New content appended - extract and append only the new part
-                        new_part = new_text[len(current_text):]
-                        if new_part.strip():  # Only append if there's actual new content
-                            # Remove leading newline if present
-                            new_part = new_part.lstrip('\n')
-                            if new_part:
-                                self.logs_display.append(new_part.rstrip('\n'))
-                    else:
-                        # Completely different content or first load - use setPlainText and force scroll
-                        self.logs_display.setPlainText(new_text)
-                        # Force scroll to bottom immediately after setPlainText
-                        scrollbar = self.logs_display.verticalScrollBar()
-                        scrollbar.setValue(scrollbar.maximum())
-            else:
-                self.logs_display.setPlainText("Unable to fetch logs. Is Frigate container running?")
-        except subprocess.FileNotFoundError:
-            self.logs_display.setPlainText("Docker not found. Please ensure Docker is installed and running.")
-        except Exception as e:
-            self.logs_display.setPlainText(f"Error fetching logs: {str(e)}\n\nIs Frigate container running?")
+    def _on_docker_logs_received(self, text, replace):
+        """Show a batch of streamed container log lines, or a status message that replaces them"""
+        if replace:
+            self.logs_display.setPlainText(text)
+            scrollbar = self.logs_display.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
+        else:
+            self._append_progress_line(self.logs_display, text)
     
     def start_logs_auto_refresh(self):
-        """Start automatic logs refresh with 3-second interval"""
-        # Start the logs timer immediately
-        self.logs_timer.start(3000)  # Refresh every 3 seconds
-        # Also refresh immediately to show current logs
-        self.refresh_logs()
+        """Start following the Frigate container log"""
+        if self._docker_logs_worker is not None:
+            return
+        self._docker_logs_worker = DockerLogsWorker()
+        self._docker_logs_worker.logs_received.connect(self._on_docker_logs_received)
+        self._docker_logs_worker.start()
     
     def update_step2_guidance(self):
         """Update the guidance text for Step 2 based on current repository status"""
@@ -8476,11 +8567,11 @@ version: 0.17-0
             if result.returncode == 0:
                 version = result.stdout.strip()
                 self.setup_python_check.setText(f"✅ {version}")
-                self.setup_python_check.setStyleSheet("background: #e8f4f0; color: #2d5a4a;")
+                self.setup_python_check.setStyleSheet(_CHECK_OK_QSS)
                 self.install_setup_python_btn.setVisible(False)
             else:
                 self.setup_python_check.setText("❌ Not Installed")
-                self.setup_python_check.setStyleSheet("background: #fbeaea; color: #6b3737;")
+                self.setup_python_check.setStyleSheet(_CHECK_MISSING_QSS)
                 self.install_setup_python_btn.setVisible(True)
             
             # Check Pip
@@ -8488,26 +8579,26 @@ version: 0.17-0
             if result.returncode == 0:
                 version = result.stdout.split()[1] if result.stdout else "installed"
                 self.setup_pip_check.setText(f"✅ pip {version}")
-                self.setup_pip_check.setStyleSheet("background: #e8f4f0; color: #2d5a4a;")
+                self.setup_pip_check.setStyleSheet(_CHECK_OK_QSS)
                 self.install_setup_pip_btn.setVisible(False)
             else:
                 self.setup_pip_check.setText("❌ Not Available")
-                self.setup_pip_check.setStyleSheet("background: #fbeaea; color: #6b3737;")
+                self.setup_pip_check.setStyleSheet(_CHECK_MISSING_QSS)
                 self.install_setup_pip_btn.setVisible(True)
             
             # Check Virtual Environment
             venv_path = os.path.join(self.script_dir, '.venv')
             if os.path.exists(venv_path) and os.path.exists(os.path.join(venv_path, 'bin', 'python')):
                 self.setup_venv_check.setText("✅ Created")
-                self.setup_venv_check.setStyleSheet("background: #e8f4f0; color: #2d5a4a;")
+                self.setup_venv_check.setStyleSheet(_CHECK_OK_QSS)
                 self.install_setup_venv_btn.setVisible(False)
             else:
                 self.setup_venv_check.setText("❌ Not Created")
-                self.setup_venv_check.setStyleSheet("background: #fbeaea; color: #6b3737;")
+                self.setup_venv_check.setStyleSheet(_CHECK_MISSING_QSS)
                 self.install_setup_venv_btn.setVisible(True)
                 
         except Exception as e:
-            self.install_progress.append(f"❌ Error checking setup dependencies: {str(e)}")
+            self.append_install_progress(f"❌ Error checking setup dependencies: {str(e)}")
     
     def install_setup_dependency(self, dep_type):
         """Install a setup dependency (python, pip, or venv)"""
@@ -8524,7 +8615,7 @@ version: 0.17-0
             'venv': 'Virtual Environment'
         }
         
-        self.install_progress.append(f"🚀 Starting {dep_names[dep_type]} setup...")
+        self.append_install_progress(f"🚀 Starting {dep_names[dep_type]} setup...")
         
         if dep_type == 'python':
             self._install_python_for_setup()
@@ -8536,21 +8627,21 @@ version: 0.17-0
     def _install_python_for_setup(self):
         """Install Python 3 for setup tab"""
         try:
-            self.install_progress.append("📦 Installing Python 3 and related packages...")
+            self.append_install_progress("📦 Installing Python 3 and related packages...")
             
             # Update package repositories
-            self.install_progress.append("🔄 Updating package repositories...")
+            self.append_install_progress("🔄 Updating package repositories...")
             subprocess.run(['sudo', 'apt', 'update'], check=True)
             
             # Install Python 3 and related packages
-            self.install_progress.append("📥 Installing Python 3, pip, and venv...")
+            self.append_install_progress("📥 Installing Python 3, pip, and venv...")
             subprocess.run(['sudo', 'apt', 'install', '-y', 
                            'python3', 'python3-pip', 'python3-venv', 'python3-dev'], check=True)
             
             # Verify installation
             result = subprocess.run(['python3', '--version'], capture_output=True, text=True, check=True)
             version = result.stdout.strip()
-            self.install_progress.append(f"✅ Python installed successfully: {version}")
+            self.append_install_progress(f"✅ Python installed successfully: {version}")
             
             # Re-enable buttons
             self.install_setup_python_btn.setEnabled(True)
@@ -8561,7 +8652,7 @@ version: 0.17-0
             self.check_setup_dependencies()
             
         except subprocess.CalledProcessError as e:
-            self.install_progress.append(f"❌ Python installation failed: {str(e)}")
+            self.append_install_progress(f"❌ Python installation failed: {str(e)}")
             self.install_setup_python_btn.setEnabled(True)
             self.install_setup_pip_btn.setEnabled(True)
             self.install_setup_venv_btn.setEnabled(True)
@@ -8569,26 +8660,26 @@ version: 0.17-0
     def _install_pip_for_setup(self):
         """Install/upgrade pip for setup tab"""
         try:
-            self.install_progress.append("📦 Installing/upgrading pip...")
+            self.append_install_progress("📦 Installing/upgrading pip...")
             
             # Check if python3 is available
             result = subprocess.run(['python3', '--version'], capture_output=True)
             if result.returncode != 0:
-                self.install_progress.append("❌ Python 3 must be installed first")
+                self.append_install_progress("❌ Python 3 must be installed first")
                 return
             
             # Install/upgrade pip
-            self.install_progress.append("📥 Installing pip...")
+            self.append_install_progress("📥 Installing pip...")
             subprocess.run(['sudo', 'apt', 'install', '-y', 'python3-pip'], check=True)
             
             # Upgrade pip
-            self.install_progress.append("⬆️ Upgrading pip...")
+            self.append_install_progress("⬆️ Upgrading pip...")
             subprocess.run(['python3', '-m', 'pip', 'install', '--upgrade', '--user', 'pip'], check=True)
             
             # Verify installation
             result = subprocess.run(['python3', '-m', 'pip', '--version'], capture_output=True, text=True, check=True)
             version = result.stdout.split()[1] if result.stdout else "unknown"
-            self.install_progress.append(f"✅ Pip installed successfully: version {version}")
+            self.append_install_progress(f"✅ Pip installed successfully: version {version}")
             
             # Re-enable buttons
             self.install_setup_python_btn.setEnabled(True)
@@ -8599,7 +8690,7 @@ version: 0.17-0
             self.check_setup_dependencies()
             
         except subprocess.CalledProcessError as e:
-            self.install_progress.append(f"❌ Pip installation failed: {str(e)}")
+            self.append_install_progress(f"❌ Pip installation failed: {str(e)}")
             self.install_setup_python_btn.setEnabled(True)
             self.install_setup_pip_btn.setEnabled(True)
             self.install_setup_venv_btn.setEnabled(True)
@@ -8612,7 +8703,7 @@ version: 0.17-0
             # Check if python3 and venv are available
             result = subprocess.run(['python3', '-m', 'venv', '--help'], capture_output=True)
             if result.returncode != 0:
-                self.install_progress.append("❌ Python 3 venv module not available. Install python3-venv first.")
+                self.append_install_progress("❌ Python 3 venv module not available. Install python3-venv first.")
                 return
             
             # Check if environment already exists and is functional
@@ -8623,7 +8714,7 @@ version: 0.17-0
                         # Test if the existing venv works
                         result = subprocess.run([venv_python, '--version'], capture_output=True, timeout=5)
                         if result.returncode == 0:
-                            self.install_progress.append("✅ Virtual environment already exists and is functional!")
+                            self.append_install_progress("✅ Virtual environment already exists and is functional!")
                             # Re-enable buttons and refresh checks
                             self.install_setup_python_btn.setEnabled(True)
                             self.install_setup_pip_btn.setEnabled(True)
@@ -8633,11 +8724,11 @@ version: 0.17-0
                     except:
                         pass
             
-            self.install_progress.append(f"🏠 Creating virtual environment at: {venv_path}")
+            self.append_install_progress(f"🏠 Creating virtual environment at: {venv_path}")
             
             # Remove existing venv if it exists but is broken
             if os.path.exists(venv_path):
-                self.install_progress.append("🗑️ Removing existing virtual environment...")
+                self.append_install_progress("🗑️ Removing existing virtual environment...")
                 subprocess.run(['rm', '-rf', venv_path], check=True)
             
             # Create new virtual environment
@@ -8646,10 +8737,10 @@ version: 0.17-0
             # Verify creation
             venv_python = os.path.join(venv_path, 'bin', 'python')
             if os.path.exists(venv_python):
-                self.install_progress.append("✅ Virtual environment created successfully!")
+                self.append_install_progress("✅ Virtual environment created successfully!")
                 
                 # Upgrade pip in venv
-                self.install_progress.append("⬆️ Upgrading pip in virtual environment...")
+                self.append_install_progress("⬆️ Upgrading pip in virtual environment...")
                 subprocess.run([venv_python, '-m', 'pip', 'install', '--upgrade', 'pip'], check=True)
                 
             else:
@@ -8664,64 +8755,128 @@ version: 0.17-0
             self.check_setup_dependencies()
             
         except subprocess.CalledProcessError as e:
-            self.install_progress.append(f"❌ Virtual environment creation failed: {str(e)}")
+            self.append_install_progress(f"❌ Virtual environment creation failed: {str(e)}")
             self.install_setup_python_btn.setEnabled(True)
             self.install_setup_pip_btn.setEnabled(True)
             self.install_setup_venv_btn.setEnabled(True)
 
-    def auto_scroll_prereq_progress(self):
-        """Auto-scroll the prerequisites progress text to the bottom when new content is added"""
-        # Get the scroll bar of the QTextEdit
-        scrollbar = self.prereq_progress.verticalScrollBar()
-        # Move to the maximum (bottom) position
-        scrollbar.setValue(scrollbar.maximum())
+    def append_prereq_progress(self, message):
+        """Add a line to the prerequisites progress log"""
+        self._append_progress_line(self.prereq_progress, message)
+    
+    def append_install_progress(self, message):
+        """Add a line to the setup/install progress log"""
+        self._append_progress_line(self.install_progress, message)
+    
+    def _append_progress_line(self, text_edit, message):
+        """Insert a line at the end of a progress log, following it to the bottom unless the user scrolled up"""
+        scrollbar = text_edit.verticalScrollBar()
+        following = text_edit in self._scroll_pending or scrollbar.value() == scrollbar.maximum()
+        document = text_edit.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        # One edit block, so a multi-line chunk (a streamed DockerLogsWorker batch) is a single document change
+        cursor.beginEditBlock()
+        if not document.isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(message)
+        cursor.endEditBlock()
+        if following:
+            self._queue_progress_scroll(text_edit)
+    
+    def _queue_progress_scroll(self, text_edit):
+        """Scroll a progress log to the bottom once for a burst of appended lines"""
+        if text_edit in self._scroll_pending:
+            return
+        self._scroll_pending.add(text_edit)
+        QTimer.singleShot(_PROGRESS_SCROLL_DELAY_MS, lambda: self._scroll_progress_to_bottom(text_edit))
     
-    def auto_scroll_install_progress(self):
-        """Auto-scroll the setup/install progress text to the bottom when new content is added"""
-        scrollbar = self.install_progress.verticalScrollBar()
+    def _scroll_progress_to_bottom(self, text_edit):
+        """Auto-scroll a progress log to the bottom after new content was added"""
+        self._scroll_pending.discard(text_edit)
+        scrollbar = text_edit.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
     
-    def auto_scroll_docker_progress(self):
-        """Auto-scroll the docker progress text to the bottom when new content is added"""
-        scrollbar = self.docker_progress.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+    def _prereq_run(self, args, **kwargs):
+        """subprocess.run for prerequisite probes, reusing a result younger than _PREREQ_CHECK_TTL"""
+        return self._prereq_cache.get(tuple(args), _PREREQ_CHECK_TTL, lambda: subprocess.run(args, **kwargs))
     
-    def auto_scroll_logs_display(self):
-        """Auto-scroll the logs display to the bottom when new content is added"""
-        scrollbar = self.logs_display.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
-
+    def _worker_running(self, attr):
+        """Whether the install worker stored in attr is still running (so its button shouldn't start another)"""
+        worker = getattr(self, attr, None)
+        return worker is not None and worker.isRunning()
+    
+    def recheck_prerequisites(self, check):
+        """Run a prerequisite check with fresh probes (Refresh buttons, after an install)"""
+        self._prereq_cache.invalidate()
+        check()
+    
+    def _start_prereq_probe(self, name, probe):
+        """Run a prerequisite probe on the thread pool; its result (or exception) comes back through prereq_probed"""
+        if name in self._prereq_probes_running:
+            return  # Repeated Check/Refresh clicks share the probe already running
+        self._prereq_probes_running.add(name)
+        
+        def run():
+            try:
+                result = probe()
+            except Exception as e:
+                result = e
+            self.prereq_probed.emit(name, result)
+        
+        QThreadPool.globalInstance().start(_RunnableFn(run))
+    
+    def _on_prereq_probed(self, name, result):
+        """Show a finished prerequisite probe on the Prerequisites tab"""
+        self._prereq_probes_running.discard(name)
+        self._prereq_result_handlers[name](result)
+        if name in self._prereq_initial_pending:
+            self._prereq_initial_pending.discard(name)
+            if not self._prereq_initial_pending:
+                self.append_prereq_progress("✅ Prerequisite check complete")
+    
+    def _check_all_prerequisites(self):
+        """Probe every prerequisite at once on the thread pool, noting in the log when all have answered"""
+        self._prereq_initial_pending = set(self._prereq_result_handlers)
+        self.append_prereq_progress("🔍 Checking prerequisites...")
+        self.check_system_prerequisites()
+        self.check_docker_prereq_status()
+        self.check_memryx_prereq_status()
     
     def check_system_prerequisites(self):
-        """Check the system-level prerequisites for Frigate"""
-        try:
-            # Check Git
-            result = subprocess.run(['git', '--version'], capture_output=True, text=True)
-            if result.returncode == 0:
-                self.prereq_git_check.setText("✅ Installed")
-                self.prereq_git_check.setStyleSheet("background: #e8f4f0; color: #2d5a4a;")
-                self.install_git_btn.setVisible(False)
-            else:
-                self.prereq_git_check.setText("❌ Not Installed")
-                self.prereq_git_check.setStyleSheet("background: #fbeaea; color: #6b3737;")
-                self.install_git_btn.setVisible(True)
-            
-            # Check build-essential (for DKMS and other build tools)
-            result = subprocess.run(['dpkg', '-l', 'build-essential'], capture_output=True)
-            if result.returncode == 0:
-                self.prereq_build_check.setText("✅ Installed")
-                self.prereq_build_check.setStyleSheet("background: #e8f4f0; color: #2d5a4a;")
-                self.install_build_btn.setVisible(False)
-            else:
-                self.prereq_build_check.setText("❌ Not Installed")
-                self.prereq_build_check.setStyleSheet("background: #fbeaea; color: #6b3737;")
-                self.install_build_btn.setVisible(True)
-            
-        except Exception as e:
-            self.prereq_progress.append(f"❌ Error checking prerequisites: {str(e)}")
+        """Check the system-level prerequisites for Frigate (Git and build tools are probed in parallel)"""
+        self._start_prereq_probe(
+            'git', lambda: self._prereq_run(['git', '--version'], capture_output=True, text=True).returncode == 0)
+        # build-essential provides DKMS and other build tools
+        self._start_prereq_probe(
+            'build-tools', lambda: self._prereq_run(['dpkg', '-l', 'build-essential'], capture_output=True).returncode == 0)
+    
+    def _show_git_prereq(self, installed):
+        """Update the Git row from a probe result"""
+        self._show_system_prereq(self.prereq_git_check, self.install_git_btn, installed)
+    
+    def _show_build_tools_prereq(self, installed):
+        """Update the Build Tools row from a probe result"""
+        self._show_system_prereq(self.prereq_build_check, self.install_build_btn, installed)
+    
+    def _show_system_prereq(self, status_label, install_btn, installed):
+        """Show a system prerequisite as installed or not, offering its install button when missing"""
+        if isinstance(installed, Exception):
+            self.append_prereq_progress(f"❌ Error checking prerequisites: {str(installed)}")
+        elif installed:
+            status_label.setText("✅ Installed")
+            status_label.setStyleSheet(_CHECK_OK_QSS)
+            install_btn.setVisible(False)
+        else:
+            status_label.setText("❌ Not Installed")
+            status_label.setStyleSheet(_CHECK_MISSING_QSS)
+            install_btn.setVisible(True)
     
     def install_system_prereq(self, install_type):
         """Install a system prerequisite (git, python, or build-tools)"""
+        if self._worker_running('system_prereq_worker'):
+            return
+        
         # Get sudo password from user
         install_names = {
             'git': 'Git',
@@ -8730,7 +8885,7 @@ version: 0.17-0
         
         sudo_password = PasswordDialog.get_sudo_password(self, f"{install_names[install_type]} installation")
         if sudo_password is None:
-            self.prereq_progress.append(f"❌ {install_names[install_type]} installation cancelled - password required")
+            self.append_prereq_progress(f"❌ {install_names[install_type]} installation cancelled - password required")
             return
         
         # Disable all install buttons during installation
@@ -8740,11 +8895,11 @@ version: 0.17-0
         # Clear progress and show starting message
         self.prereq_progress.clear()
         
-        self.prereq_progress.append(f"🚀 Starting {install_names[install_type]} installation...")
+        self.append_prereq_progress(f"🚀 Starting {install_names[install_type]} installation...")
         
         # Create and start worker thread with password
         self.system_prereq_worker = SystemPrereqInstallWorker(self.script_dir, install_type, sudo_password)
-        self.system_prereq_worker.progress.connect(self.prereq_progress.append)
+        self.system_prereq_worker.progress.connect(self.append_prereq_progress)
         self.system_prereq_worker.finished.connect(self.on_system_prereq_install_finished)
         self.system_prereq_worker.start()
     
@@ -8755,206 +8910,231 @@ version: 0.17-0
         self.install_build_btn.setEnabled(True)
         
         if success:
-            self.prereq_progress.append("✅ Installation completed successfully!")
+            self.append_prereq_progress("✅ Installation completed successfully!")
             # Refresh the status checks
-            self.check_system_prerequisites()
+            self.recheck_prerequisites(self.check_system_prerequisites)
         else:
-            self.prereq_progress.append("❌ Installation failed. Please check the error messages above.")
+            self.append_prereq_progress("❌ Installation failed. Please check the error messages above.")
     
     def check_docker_prereq_status(self):
         """Check the Docker installation and service status"""
-        try:
-            status_lines = []
-            docker_installed = False
-            docker_accessible = False
+        self._start_prereq_probe('docker', self._probe_docker_prereq)
+    
+    def _probe_docker_prereq(self):
+        """Probe Docker (runs on the thread pool): returns (status lines, installed, accessible)"""
+        status_lines = []
+        docker_installed = False
+        docker_accessible = False
+        
+        # Check if Docker is installed
+        result = self._prereq_run(['which', 'docker'], capture_output=True, text=True)
+        if result.returncode == 0:
+            docker_installed = True
             
-            # Check if Docker is installed
-            result = subprocess.run(['which', 'docker'], capture_output=True, text=True)
-            if result.returncode == 0:
-                docker_installed = True
-                
-                # Get Docker version
-                try:
-                    version_check = subprocess.run(['docker', '--version'], capture_output=True, text=True, timeout=5)
-                    if version_check.returncode == 0:
-                        docker_accessible = True
-                        version_info = version_check.stdout.strip()
-                        status_lines.append(f"✅ {version_info}")
-                        
-                        # Check Docker service status
-                        service_check = subprocess.run(['systemctl', 'is-active', 'docker'], 
+            # Get Docker version
+            try:
+                version_check = self._prereq_run(['docker', '--version'], capture_output=True, text=True, timeout=5)
+                if version_check.returncode == 0:
+                    docker_accessible = True
+                    version_info = version_check.stdout.strip()
+                    status_lines.append(f"✅ {version_info}")
+                    
+                    # Check Docker service status
+                    service_check = self._prereq_run(['systemctl', 'is-active', 'docker'], 
                                                      capture_output=True, text=True)
-                        if service_check.returncode == 0:
-                            status_lines.append("✅ Service: Active")
-                        else:
-                            status_lines.append("⚠️ Service: Inactive")
-                        
+                    if service_check.returncode == 0:
+                        status_lines.append("✅ Service: Active")
                     else:
-                        status_lines.append("❌ Docker installed but not accessible")
-                        status_lines.append("💡 Try: logout and login again")
-                        
-                except subprocess.TimeoutExpired:
-                    status_lines.append("⏰ Docker not responding")
-                    status_lines.append("💡 Try: sudo systemctl restart docker")
-            else:
-                status_lines.append("❌ Docker not installed")
-                status_lines.append("💡 Click 'Install Docker' below")
-            
-            # Set the status text
-            status_text = '\n'.join(status_lines)
-            self.prereq_docker_status.setText(status_text)
-            
-            # Set style based on overall status
-            if docker_installed and docker_accessible:
-                self.prereq_docker_status.setStyleSheet("background: #e8f4f0; color: #2d5a4a; padding: 8px; border-radius: 6px;")
-                self.install_docker_prereq_btn.setVisible(False)
-            elif docker_installed:
-                self.prereq_docker_status.setStyleSheet("background: #fff3cd; color: #856404; padding: 8px; border-radius: 6px;")
-                self.install_docker_prereq_btn.setVisible(False)
-            else:
-                self.prereq_docker_status.setStyleSheet("background: #fbeaea; color: #6b3737; padding: 8px; border-radius: 6px;")
-                self.install_docker_prereq_btn.setVisible(True)
+                        status_lines.append("⚠️ Service: Inactive")
+                    
+                else:
+                    status_lines.append("❌ Docker installed but not accessible")
+                    status_lines.append("💡 Try: logout and login again")
+                    
+            except subprocess.TimeoutExpired:
+                status_lines.append("⏰ Docker not responding")
+                status_lines.append("💡 Try: sudo systemctl restart docker")
+        else:
+            status_lines.append("❌ Docker not installed")
+            status_lines.append("💡 Click 'Install Docker' below")
         
-        except Exception as e:
-            self.prereq_progress.append(f"❌ Error checking Docker status: {str(e)}")
-            self.prereq_docker_status.setText(f"❌ Error checking Docker: {str(e)}")
-            self.prereq_docker_status.setStyleSheet("background: #fbeaea; color: #6b3737; padding: 8px; border-radius: 6px;")
+        return status_lines, docker_installed, docker_accessible
+    
+    def _show_docker_prereq_status(self, result):
+        """Update the Docker step from a probe result"""
+        if isinstance(result, Exception):
+            self.append_prereq_progress(f"❌ Error checking Docker status: {str(result)}")
+            self.prereq_docker_status.setText(f"❌ Error checking Docker: {str(result)}")
+            self.prereq_docker_status.setStyleSheet(_STATUS_ERROR_QSS)
+            self.install_docker_prereq_btn.setVisible(True)
+            return
+        
+        status_lines, docker_installed, docker_accessible = result
+        
+        # Set the status text
+        status_text = '\n'.join(status_lines)
+        self.prereq_docker_status.setText(status_text)
+        
+        # Set style based on overall status
+        if docker_installed and docker_accessible:
+            self.prereq_docker_status.setStyleSheet(_STATUS_OK_QSS)
+            self.install_docker_prereq_btn.setVisible(False)
+        elif docker_installed:
+            self.prereq_docker_status.setStyleSheet("background: #fff3cd; color: #856404; padding: 8px; border-radius: 6px;")
+            self.install_docker_prereq_btn.setVisible(False)
+        else:
+            self.prereq_docker_status.setStyleSheet(_STATUS_ERROR_QSS)
             self.install_docker_prereq_btn.setVisible(True)
     
     def check_memryx_prereq_status(self):
         """Check the MemryX driver and runtime installation status"""
-        try:
-            # Check if MemryX devices exist
-            devices = [d for d in glob.glob("/dev/memx*") if "_feature" not in d]
-            device_count = len(devices)
-            
-            # Helper function to get package version
-            def get_package_version(package_name):
-                """Get the installed version of a package using apt policy"""
-                try:
-                    result = subprocess.run(['apt', 'policy', package_name], capture_output=True, text=True)
-                    if result.returncode == 0:
-                        lines = result.stdout.split('\n')
-                        for line in lines:
-                            if 'Installed:' in line:
-                                version = line.split('Installed:')[1].strip()
-                                if version and version != '(none)':
-                                    # Extract just the version number (e.g., "2.0.1" from "2.0.1-1ubuntu1")
-                                    version_parts = version.split('-')[0].split('+')[0]
-                                    return version_parts
-                except:
-                    pass
-                return None
-            
-            # Check if memx-drivers package is installed
-            drivers_result = subprocess.run(['dpkg', '-l', 'memx-drivers'], capture_output=True, text=True)
-            drivers_installed = drivers_result.returncode == 0
-            drivers_version = get_package_version('memx-drivers') if drivers_installed else None
-            
-            # Check if mxa-manager package is installed
-            manager_result = subprocess.run(['dpkg', '-l', 'mxa-manager'], capture_output=True, text=True)
-            manager_installed = manager_result.returncode == 0
-            manager_version = get_package_version('mxa-manager') if manager_installed else None
-            
-            # Check if memx-accl package is installed
-            accl_result = subprocess.run(['dpkg', '-l', 'memx-accl'], capture_output=True, text=True)
-            accl_installed = accl_result.returncode == 0
-            accl_version = get_package_version('memx-accl') if accl_installed else None
-            
-            if not drivers_installed:
-                self.prereq_memryx_status.setText("❌ MemryX drivers not installed")
-                self.prereq_memryx_status.setStyleSheet("background: #fbeaea; color: #6b3737; padding: 8px; border-radius: 6px;")
-                self.install_memryx_prereq_btn.setVisible(True)
-                self.install_memryx_prereq_btn.setEnabled(True)
-                self.restart_system_btn.setVisible(False)  # Hide restart button
-                self.memryx_prereq_guidance.setText(
-                    "⚠️ MemryX drivers are not installed. Click 'Install MemryX Drivers & Runtime' to "
-                    "automatically install the MemryX drivers and runtime components required for hardware acceleration."
-                )
-                return
-            
-            if device_count == 0:
-                drivers_text = "drivers installed"
-                if drivers_version:
-                    drivers_text += f" (v{drivers_version})"
-                self.prereq_memryx_status.setText(f"⚠️ MemryX {drivers_text} but no devices detected, restart required")
-                self.prereq_memryx_status.setStyleSheet("background: #fdf6e3; color: #8b7355; padding: 8px; border-radius: 6px;")
-                self.install_memryx_prereq_btn.setVisible(False)
-                self.restart_system_btn.setVisible(True)  # Show restart button
-                self.memryx_prereq_guidance.setText(
-                    "💡 MemryX drivers are installed but no devices are detected.\n"
-                    "A system restart is required for the drivers to take effect.\n\n"
-                    "Click 'Restart System Now' to restart your computer and activate the MemryX drivers.\n\n"
-                    "If devices are still not detected after restart:\n"
-                    "• Check that MemryX hardware is properly connected\n"
-                    "• Verify hardware compatibility"
-                )
-                return
-            
-            if not (manager_installed and accl_installed):
-                missing_packages = []
-                if not manager_installed:
-                    missing_packages.append("mxa-manager")
-                if not accl_installed:
-                    missing_packages.append("memx-accl")
-                
-                self.prereq_memryx_status.setText(f"⚠️ Missing runtime packages: {', '.join(missing_packages)}")
-                self.prereq_memryx_status.setStyleSheet("background: #fdf6e3; color: #8b7355; padding: 8px; border-radius: 6px;")
-                self.install_memryx_prereq_btn.setVisible(True)
-                self.install_memryx_prereq_btn.setEnabled(True)
-                self.restart_system_btn.setVisible(False)  # Hide restart button
-                self.memryx_prereq_guidance.setText(
-                    f"💡 MemryX drivers installed but missing runtime packages: {', '.join(missing_packages)}\n"
-                    "Click 'Install MemryX Drivers & Runtime' to complete the installation."
-                )
-                return
-            
-            # Everything looks good - show version information
-            status_text = f"✅ MemryX fully installed and operational\n"
-            status_text += f"Devices detected: {device_count}\n"
-            
-            # Show drivers with version
-            drivers_text = "✅ memx-drivers"
+        self._start_prereq_probe('memryx', self._probe_memryx_prereq)
+    
+    def _probe_memryx_prereq(self):
+        """Probe MemryX devices and packages (runs on the thread pool)"""
+        # Check if MemryX devices exist
+        devices = [d for d in glob.glob("/dev/memx*") if "_feature" not in d]
+        device_count = len(devices)
+        
+        # Helper function to get package version
+        def get_package_version(package_name):
+            """Get the installed version of a package using apt policy"""
+            try:
+                result = self._prereq_run(['apt', 'policy', package_name], capture_output=True, text=True)
+                if result.returncode == 0:
+                    lines = result.stdout.split('\n')
+                    for line in lines:
+                        if 'Installed:' in line:
+                            version = line.split('Installed:')[1].strip()
+                            if version and version != '(none)':
+                                # Extract just the version number (e.g., "2.0.1" from "2.0.1-1ubuntu1")
+                                version_parts = version.split('-')[0].split('+')[0]
+                                return version_parts
+            except:
+                pass
+            return None
+        
+        # Check if memx-drivers package is installed
+        drivers_result = self._prereq_run(['dpkg', '-l', 'memx-drivers'], capture_output=True, text=True)
+        drivers_installed = drivers_result.returncode == 0
+        drivers_version = get_package_version('memx-drivers') if drivers_installed else None
+        
+        # Check if mxa-manager package is installed
+        manager_result = self._prereq_run(['dpkg', '-l', 'mxa-manager'], capture_output=True, text=True)
+        manager_installed = manager_result.returncode == 0
+        manager_version = get_package_version('mxa-manager') if manager_installed else None
+        
+        # Check if memx-accl package is installed
+        accl_result = self._prereq_run(['dpkg', '-l', 'memx-accl'], capture_output=True, text=True)
+        accl_installed = accl_result.returncode == 0
+        accl_version = get_package_version('memx-accl') if accl_installed else None
+        
+        return (device_count, drivers_installed, drivers_version, manager_installed, manager_version,
+                accl_installed, accl_version)
+    
+    def _show_memryx_prereq_status(self, result):
+        """Update the MemryX step from a probe result"""
+        if isinstance(result, Exception):
+            self.prereq_memryx_status.setText(f"❌ Error checking MemryX: {str(result)}")
+            self.prereq_memryx_status.setStyleSheet(_STATUS_ERROR_QSS)
+            self.install_memryx_prereq_btn.setVisible(True)
+            self.install_memryx_prereq_btn.setEnabled(True)
+            self.restart_system_btn.setVisible(False)  # Hide restart button on error
+            self.memryx_prereq_guidance.setText(
+                "❓ Could not determine MemryX status. You may need to install MemryX drivers."
+            )
+            return
+        
+        (device_count, drivers_installed, drivers_version, manager_installed, manager_version,
+         accl_installed, accl_version) = result
+        
+        if not drivers_installed:
+            self.prereq_memryx_status.setText("❌ MemryX drivers not installed")
+            self.prereq_memryx_status.setStyleSheet(_STATUS_ERROR_QSS)
+            self.install_memryx_prereq_btn.setVisible(True)
+            self.install_memryx_prereq_btn.setEnabled(True)
+            self.restart_system_btn.setVisible(False)  # Hide restart button
+            self.memryx_prereq_guidance.setText(
+                "⚠️ MemryX drivers are not installed. Click 'Install MemryX Drivers & Runtime' to "
+                "automatically install the MemryX drivers and runtime components required for hardware acceleration."
+            )
+            return
+        
+        if device_count == 0:
+            drivers_text = "drivers installed"
             if drivers_version:
                 drivers_text += f" (v{drivers_version})"
-            status_text += f"Drivers: {drivers_text}\n"
-            
-            # Show runtime with versions
-            runtime_parts = []
-            if manager_installed:
-                manager_text = "mxa-manager"
-                if manager_version:
-                    manager_text += f" (v{manager_version})"
-                runtime_parts.append(manager_text)
-            
-            if accl_installed:
-                accl_text = "memx-accl"
-                if accl_version:
-                    accl_text += f" (v{accl_version})"
-                runtime_parts.append(accl_text)
-            
-            status_text += f"Runtime: ✅ {', '.join(runtime_parts)}"
-            
-            self.prereq_memryx_status.setText(status_text)
-            self.prereq_memryx_status.setStyleSheet("background: #e8f4f0; color: #2d5a4a; padding: 8px; border-radius: 6px;")
+            self.prereq_memryx_status.setText(f"⚠️ MemryX {drivers_text} but no devices detected, restart required")
+            self.prereq_memryx_status.setStyleSheet(_STATUS_WARNING_QSS)
             self.install_memryx_prereq_btn.setVisible(False)
-            self.restart_system_btn.setVisible(False)  # Hide restart button when everything is working
+            self.restart_system_btn.setVisible(True)  # Show restart button
             self.memryx_prereq_guidance.setText(
-                "✅ MemryX is ready for use. Hardware acceleration is available for Frigate."
+                "💡 MemryX drivers are installed but no devices are detected.\n"
+                "A system restart is required for the drivers to take effect.\n\n"
+                "Click 'Restart System Now' to restart your computer and activate the MemryX drivers.\n\n"
+                "If devices are still not detected after restart:\n"
+                "• Check that MemryX hardware is properly connected\n"
+                "• Verify hardware compatibility"
             )
+            return
+        
+        if not (manager_installed and accl_installed):
+            missing_packages = []
+            if not manager_installed:
+                missing_packages.append("mxa-manager")
+            if not accl_installed:
+                missing_packages.append("memx-accl")
             
-        except Exception as e:
-            self.prereq_memryx_status.setText(f"❌ Error checking MemryX: {str(e)}")
-            self.prereq_memryx_status.setStyleSheet("background: #fbeaea; color: #6b3737; padding: 8px; border-radius: 6px;")
+            self.prereq_memryx_status.setText(f"⚠️ Missing runtime packages: {', '.join(missing_packages)}")
+            self.prereq_memryx_status.setStyleSheet(_STATUS_WARNING_QSS)
             self.install_memryx_prereq_btn.setVisible(True)
             self.install_memryx_prereq_btn.setEnabled(True)
-            self.restart_system_btn.setVisible(False)  # Hide restart button on error
+            self.restart_system_btn.setVisible(False)  # Hide restart button
             self.memryx_prereq_guidance.setText(
-                "❓ Could not determine MemryX status. You may need to install MemryX drivers."
+                f"💡 MemryX drivers installed but missing runtime packages: {', '.join(missing_packages)}\n"
+                "Click 'Install MemryX Drivers & Runtime' to complete the installation."
             )
+            return
+        
+        # Everything looks good - show version information
+        status_text = f"✅ MemryX fully installed and operational\n"
+        status_text += f"Devices detected: {device_count}\n"
+        
+        # Show drivers with version
+        drivers_text = "✅ memx-drivers"
+        if drivers_version:
+            drivers_text += f" (v{drivers_version})"
+        status_text += f"Drivers: {drivers_text}\n"
+        
+        # Show runtime with versions
+        runtime_parts = []
+        if manager_installed:
+            manager_text = "mxa-manager"
+            if manager_version:
+                manager_text += f" (v{manager_version})"
+            runtime_parts.append(manager_text)
+        
+        if accl_installed:
+            accl_text = "memx-accl"
+            if accl_version:
+                accl_text += f" (v{accl_version})"
+            runtime_parts.append(accl_text)
+        
+        status_text += f"Runtime: ✅ {', '.join(runtime_parts)}"
+        
+        self.prereq_memryx_status.setText(status_text)
+        self.prereq_memryx_status.setStyleSheet(_STATUS_OK_QSS)
+        self.install_memryx_prereq_btn.setVisible(False)
+        self.restart_system_btn.setVisible(False)  # Hide restart button when everything is working
+        self.memryx_prereq_guidance.setText(
+            "✅ MemryX is ready for use. Hardware acceleration is available for Frigate."
+        )
     
     def install_docker_prereq(self):
         """Install Docker for Prerequisites tab"""
+        if self._worker_running('docker_install_worker'):
+            return
+        
         reply = QMessageBox.question(
             self, "Install Docker", 
             "This will install Docker CE from scratch on your system.\n\n"
@@ -8974,16 +9154,16 @@ version: 0.17-0
         # Get sudo password from user
         sudo_password = PasswordDialog.get_sudo_password(self, "Docker installation")
         if sudo_password is None:
-            self.prereq_progress.append("❌ Docker installation cancelled - password required")
+            self.append_prereq_progress("❌ Docker installation cancelled - password required")
             return
         
         # Disable the install button during operation
         self.install_docker_prereq_btn.setEnabled(False)
-        self.install_docker_prereq_btn.setText("🔄 Installing Docker...")
+        _set_button_label(self.install_docker_prereq_btn, "🔄 Installing Docker...")
         
         # Start Docker installation worker with password
         self.docker_install_worker = DockerInstallWorker(self.script_dir, sudo_password)
-        self.docker_install_worker.progress.connect(self.prereq_progress.append)
+        self.docker_install_worker.progress.connect(self.append_prereq_progress)
         self.docker_install_worker.finished.connect(self.on_docker_prereq_install_finished)
         self.docker_install_worker.start()
     
@@ -8991,10 +9171,10 @@ version: 0.17-0
         """Handle Docker installation completion for Prerequisites tab"""
         # Re-enable the install button
         self.install_docker_prereq_btn.setEnabled(True)
-        self.install_docker_prereq_btn.setText("🐳 Install Docker from Scratch")
+        _set_button_label(self.install_docker_prereq_btn, "🐳 Install Docker from Scratch")
         
         if success:
-            self.prereq_progress.append("🎉 Docker installation completed successfully!")
+            self.append_prereq_progress("🎉 Docker installation completed successfully!")
             QMessageBox.information(
                 self, "Docker Installation Complete", 
                 "✅ Docker has been installed successfully!\n\n"
@@ -9002,7 +9182,7 @@ version: 0.17-0
                 "After re-login, Docker will be ready for use."
             )
         else:
-            self.prereq_progress.append("💡 Please check the error messages above.")
+            self.append_prereq_progress("💡 Please check the error messages above.")
             QMessageBox.warning(
                 self, "Docker Installation Failed", 
                 "❌ Docker installation failed. Please check the progress log for details.\n\n"
@@ -9010,11 +9190,14 @@ version: 0.17-0
             )
         
         # Refresh Docker status
-        self.check_docker_prereq_status()
+        self.recheck_prerequisites(self.check_docker_prereq_status)
         self.check_system_prerequisites()
     
     def install_memryx_prereq(self):
         """Install MemryX for Prerequisites tab"""
+        if self._worker_running('memryx_install_worker'):
+            return
+        
         reply = QMessageBox.question(
             self, "Install MemryX", 
             "This will install MemryX drivers and runtime on your system.\n\n"
@@ -9037,16 +9220,16 @@ version: 0.17-0
         # Get sudo password from user
         sudo_password = PasswordDialog.get_sudo_password(self, "MemryX installation")
         if sudo_password is None:
-            self.prereq_progress.append("❌ MemryX installation cancelled - password required")
+            self.append_prereq_progress("❌ MemryX installation cancelled - password required")
             return
         
         # Disable the install button during operation
         self.install_memryx_prereq_btn.setEnabled(False)
-        self.install_memryx_prereq_btn.setText("🔄 Installing MemryX...")
+        _set_button_label(self.install_memryx_prereq_btn, "🔄 Installing MemryX...")
         
         # Start MemryX installation worker with password
         self.memryx_install_worker = MemryXInstallWorker(self.script_dir, sudo_password)
-        self.memryx_install_worker.progress.connect(self.prereq_progress.append)
+        self.memryx_install_worker.progress.connect(self.append_prereq_progress)
         self.memryx_install_worker.finished.connect(self.on_memryx_prereq_install_finished)
         self.memryx_install_worker.start()
     
@@ -9054,10 +9237,10 @@ version: 0.17-0
         """Handle MemryX installation completion for Prerequisites tab"""
         # Re-enable the install button
         self.install_memryx_prereq_btn.setEnabled(True)
-        self.install_memryx_prereq_btn.setText("🧠 Install MemryX Drivers & Runtime")
+        _set_button_label(self.install_memryx_prereq_btn, "🧠 Install MemryX Drivers & Runtime")
         
         if success:
-            self.prereq_progress.append("🎉 MemryX installation completed successfully!")
+            self.append_prereq_progress("🎉 MemryX installation completed successfully!")
             
             # Check if restart is needed by checking for devices
             devices = [d for d in glob.glob("/dev/memx*") if "_feature" not in d]
@@ -9084,7 +9267,7 @@ version: 0.17-0
                     "Hardware acceleration is now available for Frigate."
                 )
         else:
-            self.prereq_progress.append("💡 Please check the error messages above.")
+            self.append_prereq_progress("💡 Please check the error messages above.")
             QMessageBox.warning(
                 self, "MemryX Installation Failed", 
                 "❌ MemryX installation failed. Please check the progress log for details.\n\n"
@@ -9096,7 +9279,7 @@ version: 0.17-0
             )
         
         # Refresh MemryX status
-        self.check_memryx_prereq_status()
+        self.recheck_prerequisites(self.check_memryx_prereq_status)
         self.check_system_prerequisites()
 
     def restart_system(self):
@@ -9118,12 +9301,12 @@ version: 0.17-0
             # Get sudo password for restart
             sudo_password = PasswordDialog.get_sudo_password(self, "system restart")
             if sudo_password is None:
-                self.prereq_progress.append("❌ System restart cancelled - password required")
+                self.append_prereq_progress("❌ System restart cancelled - password required")
                 return
             
             try:
-                self.prereq_progress.append("🔄 Initiating system restart...")
-                self.prereq_progress.append("💾 Please save any open work before the restart completes.")
+                self.append_prereq_progress("🔄 Initiating system restart...")
+                self.append_prereq_progress("💾 Please save any open work before the restart completes.")
                 
                 # Store password for _perform_restart
                 self.restart_sudo_password = sudo_password
@@ -9132,7 +9315,7 @@ version: 0.17-0
                 QTimer.singleShot(2000, self._perform_restart)
                 
             except Exception as e:
-                self.prereq_progress.append(f"❌ Error initiating restart: {str(e)}")
+                self.append_prereq_progress(f"❌ Error initiating restart: {str(e)}")
                 QMessageBox.warning(
                     self, "Restart Failed", 
                     f"❌ Could not restart the system automatically: {str(e)}\n\n"
@@ -9159,15 +9342,15 @@ version: 0.17-0
                 sudo_cmd = ['sudo', '-S', 'reboot']
                 result = subprocess.run(sudo_cmd, input=f"{self.restart_sudo_password}\n", 
                                       text=True, check=True, capture_output=True)
-                self.prereq_progress.append("✅ Restart command executed successfully")
+                self.append_prereq_progress("✅ Restart command executed successfully")
             else:
                 # Fallback to normal sudo (will prompt for password)
                 subprocess.run(['sudo', 'reboot'], check=True)
             
         except subprocess.CalledProcessError as e:
-            self.prereq_progress.append(f"❌ Restart command failed: {str(e)}")
+            self.append_prereq_progress(f"❌ Restart command failed: {str(e)}")
             if e.stderr:
-                self.prereq_progress.append(f"   Error details: {e.stderr}")
+                self.append_prereq_progress(f"   Error details: {e.stderr}")
             QMessageBox.warning(
                 self, "Restart Failed", 
                 "❌ Could not restart the system.\n\n"
@@ -9176,7 +9359,7 @@ version: 0.17-0
                 "• Or use your system's restart option"
             )
         except Exception as e:
-            self.prereq_progress.append(f"❌ Unexpected error during restart: {str(e)}")
+            self.append_prereq_progress(f"❌ Unexpected error during restart: {str(e)}")
             QMessageBox.warning(
                 self, "Restart Error", 
                 f"❌ Unexpected error: {str(e)}\n\n"
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Pre-scale the camera setup guide screenshots
+Writes step-card sized copies of the images in cam_assets/ so the launcher can
+load them directly instead of resampling the full-size originals at runtime.
+Re-run after adding or replacing a screenshot.
+"""
+
+import glob
+import os
+import sys
+
+from PySide6.QtGui import QImage
+
+from frigate_launcher import _SETUP_GUIDE_SCALED_DIR, _prescaled_image_path, _scale_setup_guide_image
+
+
+def main():
+    cam_assets_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cam_assets")
+    os.makedirs(os.path.join(cam_assets_dir, _SETUP_GUIDE_SCALED_DIR), exist_ok=True)
+    
+    failed = False
+    for image_path in sorted(glob.glob(os.path.join(cam_assets_dir, "*.png")) + glob.glob(os.path.join(cam_assets_dir, "*.jpg"))):
+        image = QImage(image_path)
+        if image.isNull():
+            print(f"❌ Could not read {image_path}")
+            failed = True
+            continue
+        
+        scaled = _scale_setup_guide_image(image)
+        scaled_path = _prescaled_image_path(image_path)
+        # JPEG quality only applies to the photos; PNGs keep Qt's default compression
+        quality = 90 if scaled_path.endswith(".jpg") else -1
+        if not scaled.save(scaled_path, quality=quality):
+            print(f"❌ Could not write {scaled_path}")
+            failed = True
+            continue
+        print(f"✅ {os.path.basename(image_path)}: {image.width()}x{image.height()} -> {scaled.width()}x{scaled.height()}")
+    
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())